@@ -1,121 +1,147 @@
-from datetime import datetime
+"""Benchmarks of croniters against the original croniter.
+
+Every benchmark runs once per implementation and lands in a group named after
+the operation and expression class, so the report shows both side by side::
+
+    uv run pytest compare/test.py --benchmark-group-by=group
+
+`--benchmark-disable` runs each case once, as a quick check that every case
+still runs on both implementations.
+
+croniters runs on its pure-Python backend when `croniters.PURE_PYTHON` is set
+(the default on PyPy, or with CRONITERS_PURE_PYTHON=1), and is then reported
+as `croniters-pure`.
+"""
+
+from datetime import datetime, timedelta
 
 import croniter as original_croniter
 import pytest
+import pytz
 from pytest_benchmark.fixture import BenchmarkFixture
 
 import croniters as my_croniter
 
+IMPLEMENTATION_NAMES = {
+    original_croniter: 'croniter',
+    my_croniter: 'croniters-pure' if my_croniter.PURE_PYTHON else 'croniters',
+}
+IMPLEMENTATIONS = [
+    pytest.param(module, id=name) for module, name in IMPLEMENTATION_NAMES.items()
+]
+
+# Number of dates each iteration benchmark walks through.
+STEPS = 10
+
+START = datetime(2024, 1, 15, 10, 30)
+NEW_YORK = pytz.timezone('America/New_York')
+
+# expression class -> (expression, croniter keyword arguments, start time)
+EXPRESSION_CLASSES = {
+    'interval': ('*/5 * * * *', {}, START),
+    'hour-step': ('0 */2 * * *', {}, START),
+    'dom-dow-union': ('0 0 1,15 * mon', {}, START),
+    'dom-dow-intersection': ('0 0 1-7 * mon', {'day_or': False}, START),
+    'last-dom': ('0 0 L * *', {}, START),
+    'nth-weekday': ('0 0 * * sat#1,sun#3', {}, START),
+    'last-weekday': ('0 0 * * L5', {}, START),
+    'seconds': ('*/15 * * * * */10', {}, START),
+    'year': ('0 12 1 1 * 0 2000-2099', {}, START),
+    'dst': ('30 1,2 * * *', {}, NEW_YORK.localize(datetime(2024, 3, 5))),
+    'far-future': ('0 0 29 2 *', {}, datetime(2150, 6, 1)),
+}
+
+HASHED_EXPRESSIONS = {
+    'hash': 'H * * * *',
+    'hash-fields': 'H H * * H',
+    'hash-range': 'H(30-59)/10 H * * *',
+    'hash-keyword': '@daily',
+}
+
+
+CASES = [pytest.param(*case, id=name) for name, case in EXPRESSION_CLASSES.items()]
+
+
+@pytest.fixture(autouse=True)
+def group(request: pytest.FixtureRequest, benchmark: BenchmarkFixture):
+    """Group each benchmark with the same case on the other implementation"""
+    implementation = IMPLEMENTATION_NAMES[request.node.callspec.params['module']]
+    case = request.node.callspec.id.removesuffix(f'-{implementation}')
+    benchmark.group = f'{request.node.originalname}[{case}]'
+    benchmark.extra_info['implementation'] = implementation
+
+
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_init(benchmark, module, expr, kwargs, start):
+    benchmark(module.croniter, expr, start, **kwargs)
+
+
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_get_next(benchmark, module, expr, kwargs, start):
+    itr = module.croniter(expr, start, **kwargs)
+
+    def run():
+        itr.set_current(start, force=True)
+        return [itr.get_next(datetime) for _ in range(STEPS)]
 
-@pytest.fixture
-def base_time():
-    return datetime.now()
+    benchmark(run)
 
 
-@pytest.fixture
-def test_expressions():
-    return [
-        '*/5 * * * *',  # every 5 minutes
-        '0 */2 * * *',  # every 2 hours
-        '0 0 1 */3 *',  # first of every 3rd month
-        '0 0 * * sat#1',  # first Saturday
-        '0 0 L * *',  # last day of month
-    ]
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_get_prev(benchmark, module, expr, kwargs, start):
+    itr = module.croniter(expr, start, **kwargs)
 
+    def run():
+        itr.set_current(start, force=True)
+        return [itr.get_prev(datetime) for _ in range(STEPS)]
 
-def test_basic_iteration(benchmark: BenchmarkFixture, base_time: datetime):
-    def run(module):
-        for _ in range(1000):
-            _iter = module('0 0 * * *', base_time)
-            _iter.get_next(datetime)
+    benchmark(run)
 
-    benchmark.pedantic(
-        run,
-        args=(original_croniter.croniter,),
-        iterations=1,
-        rounds=100,
-    )
 
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_croniter_range(benchmark, module, expr, kwargs, start):
+    stop = start + timedelta(days=7)
 
-def test_expression_validation(
-    benchmark: BenchmarkFixture, test_expressions: list[str]
-):
-    def run(module):
-        for expr in test_expressions * 1000:
-            module.is_valid(expr)
+    def run():
+        return list(module.croniter_range(start, stop, expr, **kwargs))
 
-    benchmark.pedantic(
-        run,
-        args=(original_croniter.croniter,),
-        iterations=1,
-        rounds=100,
-    )
+    benchmark(run)
 
 
-def test_date_range_matching(benchmark: BenchmarkFixture, base_time: datetime):
-    end = datetime.now()
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_match(benchmark, module, expr, kwargs, start):
+    benchmark(module.croniter.match, expr, start, **kwargs)
 
-    def run(module):
-        for _ in range(1000):
-            module.match_range('0 * * * *', base_time, end)
 
-    benchmark.pedantic(
-        run,
-        args=(original_croniter.croniter,),
-        iterations=1,
-        rounds=100,
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_match_range(benchmark, module, expr, kwargs, start):
+    benchmark(
+        module.croniter.match_range, expr, start, start + timedelta(days=1), **kwargs
     )
 
 
-def test_next_prev_dates(benchmark: BenchmarkFixture, base_time: datetime):
-    def run(module):
-        _iter = module('0 0 * * *', base_time)
-        for _ in range(1000):
-            _iter.get_next(datetime)
-            _iter.get_prev(datetime)
-
-    benchmark.pedantic(
-        run,
-        args=(original_croniter.croniter,),
-        iterations=1,
-        rounds=100,
-    )
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
+@pytest.mark.parametrize(('expr', 'kwargs', 'start'), CASES)
+def test_is_valid(benchmark, module, expr, kwargs, start):
+    benchmark(module.croniter.is_valid, expr)
 
 
+@pytest.mark.parametrize('module', IMPLEMENTATIONS)
 @pytest.mark.parametrize(
-    'module',
-    [
-        pytest.param(original_croniter.croniter, id='original'),
-        pytest.param(my_croniter.croniter, id='rust'),
-    ],
+    'expr',
+    [pytest.param(expr, id=name) for name, expr in HASHED_EXPRESSIONS.items()],
 )
-def test_all_operations(
-    module,
-    benchmark: BenchmarkFixture,
-    base_time: datetime,
-    test_expressions: list[str],
-):
-    """Compare overall performance of all common operations"""
-    end = datetime.now()
+def test_hash_expand(benchmark, module, expr):
+    hash_ids = iter(range(10**9))
 
     def run():
-        # Basic iteration
-        _iter = module('0 0 * * *', base_time)
-        for _ in range(100):
-            _iter.get_next(datetime)
-
-        # Expression validation
-        for expr in test_expressions * 100:
-            module.is_valid(expr)
-
-        # Range matching
-        for _ in range(100):
-            module.match_range('0 * * * *', base_time, end)
-
-        # Next/prev dates
-        _iter = module('0 0 * * *', base_time)
-        for _ in range(100):
-            _iter.get_next(datetime)
-            _iter.get_prev(datetime)
+        # a new hash_id each round, so that no expansion cache is hit
+        return module.croniter.expand(expr, hash_id=b'job-%d' % next(hash_ids))
 
     benchmark(run)
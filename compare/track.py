@@ -0,0 +1,236 @@
+"""Track benchmark results across commits and versions.
+
+Runs the pytest-benchmark suite in compare/test.py, stores the median time of
+every benchmark as JSON under compare/baselines/, and compares a run against a
+stored baseline::
+
+    uv run compare/track.py save                  # record this commit
+    uv run compare/track.py check --threshold 0.1 # fail on a >10% regression
+
+By default a run is compared on the ratio of croniters to upstream croniter
+measured in the same run, which cancels out most of the difference between
+the machine that stored the baseline and this one. `--absolute` compares the
+raw croniters timings instead.
+
+Each result remembers which croniters backend it measured, so a run of the
+pure-Python backend can be checked against one of the extension, e.g. on
+PyPy where the extension goes through cpyext::
+
+    CRONITERS_PURE_PYTHON=0 pypy3 compare/track.py save --output native.json
+    CRONITERS_PURE_PYTHON=1 pypy3 compare/track.py check --baseline native.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+import croniters as my_croniter
+
+HERE = Path(__file__).parent
+BASELINES = HERE / 'baselines'
+SUITE = HERE / 'test.py'
+
+IMPLEMENTATION = 'croniters-pure' if my_croniter.PURE_PYTHON else 'croniters'
+REFERENCE = 'croniter'
+
+
+def git(*args):
+    try:
+        return subprocess.run(
+            ['git', *args], cwd=HERE, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def run_suite(pytest_args):
+    """Run the benchmark suite and return pytest-benchmark's JSON report"""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / 'benchmark.json'
+        subprocess.run(
+            [
+                sys.executable,
+                '-m',
+                'pytest',
+                str(SUITE),
+                '-q',
+                f'--benchmark-json={report}',
+                *pytest_args,
+            ],
+            check=True,
+        )
+        return json.loads(report.read_text())
+
+
+def summarize(report, name=None):
+    """Reduce a pytest-benchmark report to {group: {implementation: median}}"""
+    commit = git('rev-parse', '--short', 'HEAD')
+    benchmarks = {}
+    for bench in report['benchmarks']:
+        implementation = bench['extra_info']['implementation']
+        benchmarks.setdefault(bench['group'], {})[implementation] = bench['stats'][
+            'median'
+        ]
+    machine = report['machine_info']
+    return {
+        'name': name
+        or '-'.join(
+            filter(
+                None,
+                (my_croniter.__version__, commit, my_croniter.PURE_PYTHON and 'pure'),
+            )
+        ),
+        'version': my_croniter.__version__,
+        'implementation': IMPLEMENTATION,
+        'commit': commit,
+        'datetime': report.get('datetime') or datetime.now(timezone.utc).isoformat(),
+        'machine': {
+            'python': f'{machine["python_implementation"]} {machine["python_version"]}',
+            'cpu': machine.get('cpu', {}).get('brand_raw', machine['processor']),
+        },
+        'benchmarks': dict(sorted(benchmarks.items())),
+    }
+
+
+def load_baseline(name):
+    if name:
+        path = Path(name)
+        if not path.exists():
+            path = BASELINES / f'{name}.json'
+        return json.loads(path.read_text())
+    stored = [json.loads(path.read_text()) for path in BASELINES.glob('*.json')]
+    if not stored:
+        raise SystemExit(f'no baseline stored in {BASELINES}, run `save` first')
+    return max(stored, key=lambda result: result['datetime'])
+
+
+def metric(result, group, absolute):
+    timings = result['benchmarks'].get(group, {})
+    current = timings.get(result.get('implementation', 'croniters'))
+    if current is None or absolute:
+        return current
+    reference = timings.get(REFERENCE)
+    return current / reference if reference else None
+
+
+def compare(baseline, current, threshold, absolute):
+    """Return (group, baseline, current, change) rows and the regressed groups"""
+    rows, regressions = [], []
+    for group in current['benchmarks']:
+        new = metric(current, group, absolute)
+        old = metric(baseline, group, absolute)
+        change = new / old - 1 if new is not None and old else None
+        rows.append((group, old, new, change))
+        if change is not None and change > threshold:
+            regressions.append(group)
+    return rows, regressions
+
+
+def report(console, baseline, current, rows, threshold, absolute):
+    unit = 'median (us)' if absolute else f'croniters/{REFERENCE}'
+    table = Table(
+        title=f'[bold]{current["name"]} against {baseline["name"]}[/bold]',
+        caption=f'{baseline["machine"]["cpu"]}, {baseline["machine"]["python"]}'
+        f' -> {current["machine"]["cpu"]}, {current["machine"]["python"]}',
+    )
+    table.add_column('Operation', style='magenta')
+    table.add_column('Case', style='cyan')
+    table.add_column(f'Baseline {unit}', justify='right')
+    table.add_column(f'Current {unit}', justify='right')
+    table.add_column('Change', justify='right')
+
+    def fmt(value):
+        if value is None:
+            return '-'
+        return f'{value * 1e6:.1f}' if absolute else f'{value:.3f}'
+
+    for group, old, new, change in rows:
+        operation, _, case = group.partition('[')
+        if change is None:
+            status = '[dim]new[/dim]'
+        elif change > threshold:
+            status = f'[bold red]{change:+.1%}[/bold red]'
+        elif change < -threshold:
+            status = f'[green]{change:+.1%}[/green]'
+        else:
+            status = f'{change:+.1%}'
+        table.add_row(
+            operation.removeprefix('test_'),
+            case.rstrip(']'),
+            fmt(old),
+            fmt(new),
+            status,
+        )
+    console.print(table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    save = commands.add_parser('save', help='run the suite and store the results')
+    save.add_argument('--name', help='file name under compare/baselines/')
+    save.add_argument(
+        '--output', help='write to this path instead of compare/baselines/'
+    )
+    check = commands.add_parser('check', help='run the suite and compare it')
+    check.add_argument(
+        '--baseline', help='stored name or JSON path (default: most recent)'
+    )
+    check.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='relative slowdown that fails the check (default: 0.1)',
+    )
+    check.add_argument(
+        '--absolute',
+        action='store_true',
+        help='compare raw timings instead of the ratio to upstream croniter',
+    )
+    for command in (save, check):
+        command.add_argument(
+            '--from-json', help='use an existing pytest-benchmark JSON report'
+        )
+    args, pytest_args = parser.parse_known_args(argv)
+
+    if args.from_json:
+        raw = json.loads(Path(args.from_json).read_text())
+    else:
+        raw = run_suite(pytest_args)
+    console = Console()
+
+    if args.command == 'save':
+        current = summarize(raw, args.name)
+        if args.output:
+            path = Path(args.output)
+        else:
+            BASELINES.mkdir(exist_ok=True)
+            path = BASELINES / f'{current["name"]}.json'
+        path.write_text(json.dumps(current, indent=2) + '\n')
+        console.print(f'saved {len(current["benchmarks"])} benchmarks to {path}')
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    current = summarize(raw)
+    rows, regressions = compare(baseline, current, args.threshold, args.absolute)
+    report(console, baseline, current, rows, args.threshold, args.absolute)
+    if regressions:
+        console.print(
+            f'[bold red]{len(regressions)} benchmark(s) regressed by more than '
+            f'{args.threshold:.0%}:[/bold red] {escape(", ".join(regressions))}'
+        )
+        return 1
+    console.print(f'[green]no regression above {args.threshold:.0%}[/green]')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,45 +1,86 @@
-import calendar
-import copy
+import _thread
 import datetime
+import importlib
+import itertools
 import math
-import re
+import os
 import sys
-import traceback as _traceback
 import warnings
+from bisect import bisect_left, bisect_right
 from time import time
 
-# as pytz is optional in thirdparty libs but we need it for good support under
-# python2, just test that it's well installed
-import pytz
-from dateutil.relativedelta import relativedelta
-from dateutil.tz import tzutc
-
-from ._croniters import (
-    CRON_FIELDS,
-    DAY_FIELD,
-    DAYS as DAYS_CONSTANT,
-    DOW_ALPHAS,
-    DOW_FIELD,
-    EXPANDERS,
-    HOUR_FIELD,
-    LEN_MEANS_ALL as LEN_MEANS_ALL_CONSTANT,
-    M_ALPHAS,
-    MINUTE_FIELD,
-    MONTH_FIELD,
-    MONTHS,
-    RANGES as RANGES_CONSTANT,
-    SECOND_CRON_LEN,
-    SECOND_FIELD,
-    UNIX_CRON_LEN,
-    VALID_LEN_EXPRESSION,
-    WEEKDAYS,
-    YEAR_CRON_LEN,
-    YEAR_FIELD,
-    HashExpander,  # noqa: F401 # for backwards compatibility
-    __version__,
-    is_32bit,
-    is_leap,
-)
+# On PyPy, calls into the pyo3 extension go through cpyext and cannot be traced
+# by the JIT, so the pure-Python mirror of the extension is used instead.
+# CRONITERS_PURE_PYTHON=1 (or 0) forces the choice on any interpreter.
+_pure_python_flag = os.environ.get('CRONITERS_PURE_PYTHON', '').strip().lower()
+if _pure_python_flag:
+    PURE_PYTHON = _pure_python_flag not in ('0', 'false', 'no', 'off')
+else:
+    PURE_PYTHON = sys.implementation.name == 'pypy'
+del _pure_python_flag
+
+if PURE_PYTHON:
+    from ._pure import (
+        CRON_FIELDS,
+        DAY_FIELD,
+        DAYS as DAYS_CONSTANT,
+        DOW_ALPHAS,
+        DOW_FIELD,
+        EXPANDERS,
+        HOUR_FIELD,
+        LEN_MEANS_ALL as LEN_MEANS_ALL_CONSTANT,
+        M_ALPHAS,
+        MINUTE_FIELD,
+        MONTH_FIELD,
+        MONTHS,
+        RANGES as RANGES_CONSTANT,
+        SECOND_CRON_LEN,
+        SECOND_FIELD,
+        UNIX_CRON_LEN,
+        VALID_LEN_EXPRESSION,
+        WEEKDAYS,
+        YEAR_CRON_LEN,
+        YEAR_FIELD,
+        CronRandom,
+        HashExpander,  # for backwards compatibility
+        __version__,
+        datetime_to_seconds as _datetime_to_seconds,
+        datetime_to_timestamp,
+        is_32bit,
+        is_leap,
+        timestamp_to_datetime as _timestamp_to_datetime,
+    )
+else:
+    from ._croniters import (
+        CRON_FIELDS,
+        DAY_FIELD,
+        DAYS as DAYS_CONSTANT,
+        DOW_ALPHAS,
+        DOW_FIELD,
+        EXPANDERS,
+        HOUR_FIELD,
+        LEN_MEANS_ALL as LEN_MEANS_ALL_CONSTANT,
+        M_ALPHAS,
+        MINUTE_FIELD,
+        MONTH_FIELD,
+        MONTHS,
+        RANGES as RANGES_CONSTANT,
+        SECOND_CRON_LEN,
+        SECOND_FIELD,
+        UNIX_CRON_LEN,
+        VALID_LEN_EXPRESSION,
+        WEEKDAYS,
+        YEAR_CRON_LEN,
+        YEAR_FIELD,
+        CronRandom,
+        HashExpander,  # noqa: F401 # for backwards compatibility
+        __version__,
+        datetime_to_seconds as _datetime_to_seconds,
+        datetime_to_timestamp,
+        is_32bit,
+        is_leap,
+        timestamp_to_datetime as _timestamp_to_datetime,
+    )
 
 VERSION = __version__
 
@@ -56,43 +97,339 @@ except ImportError:
     OrderedDict = dict  # py26 degraded mode, expanders order will not be immutable
 
 
-try:
-    # py3 recent
-    UTC_DT = datetime.timezone.utc
-except AttributeError:
-    UTC_DT = pytz.utc
-EPOCH = datetime.datetime.fromtimestamp(0, UTC_DT)
+UTC_DT = datetime.timezone.utc
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC_DT)
+
+
+class _LazyPattern:
+    """A regular expression compiled on first use.
+
+    Importing `re` and compiling the parser's patterns is a noticeable part of
+    the import time, and is only needed once an expression gets parsed.
+    """
+
+    __slots__ = ('_compiled', '_pattern')
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+        self._compiled = None
+
+    def __getattr__(self, name):
+        if self._compiled is None:
+            import re
 
+            self._compiled = re.compile(self._pattern)
+        return getattr(self._compiled, name)
 
-step_search_re = re.compile(r'^([^-]+)-([^-/]+)(/(\d+))?$')
-only_int_re = re.compile(r'^\d+$')
 
-star_or_int_re = re.compile(r'^(\d+|\*)$')
-special_dow_re = re.compile(
+step_search_re = _LazyPattern(r'^([^-]+)-([^-/]+)(/(\d+))?$')
+star_step_re = _LazyPattern(r'^\*(\/.+)$')
+start_step_re = _LazyPattern(r'^(.+)\/(.+)$')
+only_int_re = _LazyPattern(r'^\d+$')
+
+star_or_int_re = _LazyPattern(r'^(\d+|\*)$')
+special_dow_re = _LazyPattern(
     (rf'^(?P<pre>((?P<he>(({WEEKDAYS})(-({WEEKDAYS}))?)')
     + (rf'|(({MONTHS})(-({MONTHS}))?)|\w+)#)|l)(?P<last>\d+)$')
 )
-re_star = re.compile('[*]')
-hash_expression_re = re.compile(
+re_star = _LazyPattern('[*]')
+hash_expression_re = _LazyPattern(
     r'^(?P<hash_type>h|r)(\((?P<range_begin>\d+)-(?P<range_end>\d+)\))?(\/(?P<divisor>\d+))?$'
 )
 
+
+class _BoundedCache(dict):
+    """A dict that drops its oldest entries once it holds `maxsize` items.
+
+    Reads are plain dict lookups; writes are serialized so that concurrent
+    inserts (including on free-threaded builds) cannot race the eviction.
+    """
+
+    __slots__ = ('_lock', 'maxsize')
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+        # the same lock as threading.Lock, without importing threading
+        self._lock = _thread.allocate_lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if len(self) >= self.maxsize and key not in self:
+                for old in list(itertools.islice(self, max(self.maxsize // 8, 1))):
+                    dict.pop(self, old, None)
+            dict.__setitem__(self, key, value)
+
+
 # retrocompat
-TIMESTAMP_TO_DT_CACHE = {}
-EXPRESSIONS = {}
+TIMESTAMP_TO_DT_CACHE = _BoundedCache(8192)
+EXPRESSIONS = _BoundedCache(4096)
 MARKER = object()
+# search counters, see `enable_stats`; None keeps the search free of counting
+_search_stats = None
+# see `set_slow_hook`
+_slow_watch = None
+
+
+def _count(key, expressions):
+    # for the search's rarer events; the hot loop checks `_search_stats` inline
+    if _search_stats is not None:
+        _search_stats.add(key, expressions)
+
+
+# tzinfo classes with a single UTC offset, by qualified name so that pytz and
+# dateutil need not be imported to recognize theirs
+_FIXED_OFFSET_CLASSES = frozenset(
+    (
+        'datetime.timezone',
+        'pytz.UTC',
+        'pytz._FixedOffset',
+        'pytz.tzinfo.StaticTzInfo',
+        'dateutil.tz.tz.tzutc',
+        'dateutil.tz.tz.tzoffset',
+    )
+)
+# tzinfo type -> whether it has a single UTC offset, see `_fixed_offset`
+FIXED_OFFSET_TYPES = _BoundedCache(256)
+
+
+def _fixed_offset(tzinfo):
+    """Whether `tzinfo` (None being UTC) never changes its UTC offset.
+
+    Results in such a timezone never need `_adjust_dst`.
+    """
+    if tzinfo is None:
+        return True
+    cls = type(tzinfo)
+    try:
+        return FIXED_OFFSET_TYPES[cls]
+    except KeyError:
+        pass
+    fixed = any(
+        f'{base.__module__}.{base.__qualname__}' in _FIXED_OFFSET_CLASSES
+        for base in cls.__mro__
+    )
+    FIXED_OFFSET_TYPES[cls] = fixed
+    return fixed
+
+
+# id(tzinfo) -> (tzinfo, its `TransitionTable` or None), see `_transition_table`
+TRANSITION_TABLES = _BoundedCache(256)
+
+
+def _transition_table(tzinfo):
+    """Return the `_tztable.TransitionTable` of `tzinfo`, or None if it has none.
+
+    Keyed by identity, as tzinfos need not be hashable; the entry holds on to
+    the tzinfo so that its id is not reused while cached.
+    """
+    entry = TRANSITION_TABLES.get(id(tzinfo))
+    if entry is not None and entry[0] is tzinfo:
+        return entry[1]
+    table = None
+    if not _fixed_offset(tzinfo):
+        from ._tztable import build_table
+
+        table = build_table(tzinfo)
+    TRANSITION_TABLES[id(tzinfo)] = (tzinfo, table)
+    return table
+
+
+def _utcoffset_seconds(tzinfo, table, t):
+    """The UTC offset of `tzinfo` at the timestamp `t`, in seconds.
+
+    Read from `table`, the tzinfo's `_transition_table`, when it covers `t`.
+    """
+    if table is not None:
+        offset = table.utcoffset(t)
+        if offset is not None:
+            return offset
+    delta = _timestamp_to_datetime(t, tzinfo).utcoffset()
+    return delta.days * 86400 + delta.seconds
+
+
+def _offset_change(tzinfo, table, low, high):
+    """Return the first timestamp in `low < t <= high` at another UTC offset
+    than `low`, which must be in there.
+    """
+    offset = _utcoffset_seconds(tzinfo, table, low)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _utcoffset_seconds(tzinfo, table, middle) == offset:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def _wall_clock_at(tzinfo, table, t, dst_fold):
+    """Return the local wall-clock time at the timestamp `t`, in seconds, for
+    a wall-clock search to start from.
+
+    When the clocks are moved back, the repeated times fire on the `dst_fold`
+    pass only. A `t` on the other pass is placed at the edge of the repeated
+    times instead, so that the search finds those on either side of it.
+    """
+    second = math.floor(t)
+    offset = _utcoffset_seconds(tzinfo, table, second)
+    wall = second + offset
+    before = _utcoffset_seconds(tzinfo, table, wall - 86400)
+    after = _utcoffset_seconds(tzinfo, table, wall + 86400)
+    if (
+        before > after
+        and _utcoffset_seconds(tzinfo, table, wall - before) == before
+        and _utcoffset_seconds(tzinfo, table, wall - after) == after
+    ):
+        # half a second before the end (after the first pass) or the start
+        # (before the last pass) of the repeated times, between whole seconds
+        if dst_fold == 'first' and offset == after:
+            change = _offset_change(tzinfo, table, wall - before, second)
+            return change + before - 0.5
+        if dst_fold == 'last' and offset == before:
+            change = _offset_change(tzinfo, table, second, wall - after)
+            return change + after - 0.5
+    return t + offset
+
+
+# (day-of-month field, month field) -> feasible months, see `_feasible_months`
+FEASIBLE_MONTHS_CACHE = _BoundedCache(1024)
+
+
+def _feasible_months(days, months):
+    """Return the (month, is leap year) pairs in which one of `days` exists.
+
+    Only months allowed by the `months` field are included. Returns None when
+    every month qualifies, e.g. when `days` is '*' or includes 'l'.
+    """
+    if days[0] == '*' or 'l' in days:
+        return None
+    key = (tuple(days), tuple(months))
+    try:
+        return FEASIBLE_MONTHS_CACHE[key]
+    except KeyError:
+        pass
+    first_day = min(days)
+    feasible = frozenset(
+        (month, leap)
+        for month in (range(1, 13) if months[0] == '*' else months)
+        for leap in (False, True)
+        if first_day <= DAYS_CONSTANT[month - 1] + (month == 2 and leap)
+    )
+    if len(feasible) == 24:
+        feasible = None
+    FEASIBLE_MONTHS_CACHE[key] = feasible
+    return feasible
+
+
+def _nearest_feasible_month(d, feasible, is_prev):
+    """Move `d` to the start of the next month in `feasible`, or with `is_prev`
+    to the end of the previous one. Returns None when there is none.
+    """
+    year, month = d.year, d.month
+    step = -1 if is_prev else 1
+    # two leap years are at most 8 years apart
+    for _ in range(8 * 12):
+        month += step
+        if month > 12:
+            month, year = 1, year + 1
+        elif month < 1:
+            month, year = 12, year - 1
+        leap = is_leap(year)
+        if (month, leap) in feasible:
+            if is_prev:
+                last_day = DAYS_CONSTANT[month - 1] + (month == 2 and leap)
+                return d.replace(
+                    year=year, month=month, day=last_day, hour=23, minute=59, second=59
+                )
+            return d.replace(year=year, month=month, day=1, hour=0, minute=0, second=0)
+    return None
+
+
+# (hour field, minute field, second field) -> seconds of the day, see
+# `_intraday_offsets`
+INTRADAY_OFFSETS_CACHE = _BoundedCache(64)
+
+
+def _intraday_offsets(expanded):
+    """Return the sorted seconds of the day matched by the time fields.
+
+    Returns None for schedules that fire at most once a day, for which
+    stepping within a day never saves a search.
+    """
+    hours, minutes = expanded[HOUR_FIELD], expanded[MINUTE_FIELD]
+    seconds = expanded[SECOND_FIELD] if len(expanded) > UNIX_CRON_LEN else (0,)
+    key = (tuple(hours), tuple(minutes), tuple(seconds))
+    try:
+        return INTRADAY_OFFSETS_CACHE[key]
+    except KeyError:
+        pass
+    from array import array
+
+    offsets = array(
+        'i',
+        [
+            hour * 3600 + minute * 60 + second
+            for hour in (range(24) if hours[0] == '*' else hours)
+            for minute in (range(60) if minutes[0] == '*' else minutes)
+            for second in (range(60) if seconds[0] == '*' else seconds)
+        ],
+    )
+    if len(offsets) < 2:
+        offsets = None
+    INTRADAY_OFFSETS_CACHE[key] = offsets
+    return offsets
+
+
+def _intraday_step(plan, cur, is_prev):
+    """Return the next (or previous) time of the planned day after `cur`.
+
+    `plan` is (tzinfo, dst_start_time, timestamp of the day's midnight,
+    `_intraday_offsets`), see `croniter._plan_day`.
+    Returns None when `cur` is outside the day or the day has no further
+    match, and the full search has to run.
+    """
+    _, _, midnight, offsets = plan
+    t = cur - midnight
+    if is_prev:
+        if 0 < t <= 86400:
+            i = bisect_left(offsets, t)
+            if i:
+                return midnight + offsets[i - 1]
+    elif 0 <= t < 86400:
+        i = bisect_right(offsets, t)
+        if i < len(offsets):
+            return midnight + offsets[i]
+    return None
+
+
+def _coerce_rng(rng):
+    if rng is None or isinstance(rng, CronRandom):
+        return rng
+    if isinstance(rng, bool) or not isinstance(rng, int):
+        raise TypeError('rng must be an int seed or a CronRandom instance')
+    return CronRandom(rng)
 
 
 def timedelta_to_seconds(td: datetime.timedelta) -> float:
     return (td.microseconds + (td.seconds + td.days * 24 * 3600) * 10**6) / 10**6
 
 
-def datetime_to_timestamp(d: datetime.datetime) -> float:
-    if d.tzinfo is not None:
-        if (offset := d.utcoffset()) is not None:
-            d = d.replace(tzinfo=None) - offset
+DST_GAP_POLICIES = ('shift', 'skip')
+DST_FOLD_POLICIES = ('first', 'last')
 
-    return timedelta_to_seconds(d - datetime.datetime(1970, 1, 1))
+
+def _check_dst_policies(dst_gap, dst_fold):
+    if dst_gap not in DST_GAP_POLICIES:
+        raise ValueError(f'dst_gap must be one of {DST_GAP_POLICIES}')
+    if dst_fold not in DST_FOLD_POLICIES:
+        raise ValueError(f'dst_fold must be one of {DST_FOLD_POLICIES}')
+
+
+def _check_ret_type(ret_type):
+    if not issubclass(ret_type, (float, int, datetime.datetime)):
+        raise TypeError(
+            "Invalid ret_type, only 'float', 'int' or 'datetime' is acceptable."
+        )
 
 
 class CroniterError(ValueError):
@@ -136,9 +473,9 @@ class croniter:
         {},  # 1: hour
         {'l': 'l'},  # 2: dom
         # 3: mon
-        copy.deepcopy(M_ALPHAS),
+        dict(M_ALPHAS),
         # 4: dow
-        copy.deepcopy(DOW_ALPHAS),
+        dict(DOW_ALPHAS),
         # 5: second
         {},
         # 6: year
@@ -155,6 +492,12 @@ class croniter:
         {},
     )
 
+    # the times of the last matched day, see `_plan_day`
+    _day_plan = None
+    # (timestamp, wall-clock time) of the last wall-clock search result, see
+    # `_search_wall_clock`
+    _wall_position = None
+
     LEN_MEANS_ALL = LEN_MEANS_ALL_CONSTANT
 
     def __init__(
@@ -169,18 +512,28 @@ class croniter:
         implement_cron_bug=False,
         second_at_beginning=None,
         expand_from_start_time=False,
+        rng=None,
+        wall_clock=False,
+        dst_gap='shift',
+        dst_fold='first',
     ):
         self._ret_type = ret_type
         self._day_or = day_or
         self._implement_cron_bug = implement_cron_bug
         self.second_at_beginning = bool(second_at_beginning)
         self._expand_from_start_time = expand_from_start_time
+        _check_dst_policies(dst_gap, dst_fold)
+        self._wall_clock = bool(wall_clock)
+        self._dst_gap = dst_gap
+        self._dst_fold = dst_fold
 
         if hash_id:
             if not isinstance(hash_id, (bytes, str)):
                 raise TypeError('hash_id must be bytes or UTF-8 string')
             if not isinstance(hash_id, bytes):
                 hash_id = hash_id.encode('UTF-8')
+        self._hash_id = hash_id or None
+        rng = _coerce_rng(rng)
 
         self._max_years_btw_matches_explicitly_set = (
             max_years_between_matches is not None
@@ -199,16 +552,20 @@ class croniter:
         self.cur = None
         self.set_current(start_time, force=False)
 
-        self.expanded, self.nth_weekday_of_month = self.expand(
-            expr_format,
-            hash_id=hash_id,
-            from_timestamp=self.dst_start_time
-            if self._expand_from_start_time
-            else None,
-            second_at_beginning=second_at_beginning,
+        # the split fields come back with the expansion rather than being read
+        # from EXPRESSIONS, which another thread may have evicted meanwhile
+        self.expanded, self.nth_weekday_of_month, self.expressions = (
+            self._checked_expand(
+                expr_format,
+                hash_id=hash_id,
+                from_timestamp=self.dst_start_time
+                if self._expand_from_start_time
+                else None,
+                second_at_beginning=second_at_beginning,
+                rng=rng,
+            )
         )
         self.fields = CRON_FIELDS[len(self.expanded)]
-        self.expressions = EXPRESSIONS[(expr_format, hash_id, second_at_beginning)]
         self._is_prev = is_prev
 
     @classmethod
@@ -244,7 +601,9 @@ class croniter:
         ret_type = ret_type or self._ret_type
         if issubclass(ret_type, datetime.datetime):
             return self.timestamp_to_datetime(self.cur)
-        return self.cur
+        if issubclass(ret_type, int):
+            return math.floor(self.cur)
+        return float(self.cur)
 
     def set_current(self, start_time, force=True):
         if (force or (self.cur is None)) and start_time is not None:
@@ -272,20 +631,25 @@ class croniter:
         if tzinfo:
             k = (timestamp, repr(tzinfo))
         try:
-            return TIMESTAMP_TO_DT_CACHE[k]
+            result = TIMESTAMP_TO_DT_CACHE[k]
         except KeyError:
             pass
-        if OVERFLOW32B_MODE:
-            # degraded mode to workaround Y2038
-            # see https://github.com/python/cpython/issues/101069
-            result = EPOCH.replace(tzinfo=None) + datetime.timedelta(seconds=timestamp)
         else:
-            result = datetime.datetime.fromtimestamp(timestamp, tz=tzutc()).replace(
-                tzinfo=None
-            )
-        if tzinfo:
-            result = result.replace(tzinfo=UTC_DT).astimezone(tzinfo)
-        TIMESTAMP_TO_DT_CACHE[(result, repr(result.tzinfo))] = result
+            if _search_stats is not None:
+                _search_stats.add('timestamp_cache_hits', self.expressions)
+            return result
+        if _search_stats is not None:
+            _search_stats.add('timestamp_cache_misses', self.expressions)
+        result = None
+        if tzinfo and type(timestamp) is int:
+            table = _transition_table(tzinfo)
+            if table is not None:
+                result = table.to_datetime(timestamp)
+        if result is None:
+            # computed from the fields rather than with `fromtimestamp`, so
+            # there is no Y2038 limit on 32-bit platforms either
+            result = _timestamp_to_datetime(timestamp, tzinfo or None)
+        TIMESTAMP_TO_DT_CACHE[k] = result
         return result
 
     _timestamp_to_datetime = timestamp_to_datetime  # retrocompat
@@ -308,21 +672,151 @@ class croniter:
         is_prev=None,
         update_current=None,
     ):
+        watch = _slow_watch
+        if watch is None:
+            return self._search_next(ret_type, start_time, is_prev, update_current)
+        return watch.run(self, ret_type, start_time, is_prev, update_current)
+
+    def _search_next(
+        self,
+        ret_type=None,
+        start_time=None,
+        is_prev=None,
+        update_current=None,
+        passes=None,
+    ):
+        # `_get_next` itself; `passes`, a one-item list, counts the passes of
+        # the search loops
         if update_current is None:
             update_current = True
         self.set_current(start_time, force=True)
         if is_prev is None:
             is_prev = self._is_prev
         self._is_prev = is_prev
-        expanded = self.expanded[:]
-        nth_weekday_of_month = self.nth_weekday_of_month.copy()
 
         ret_type = ret_type or self._ret_type
+        _check_ret_type(ret_type)
+
+        # dense schedules step through the times of the last matched day, and
+        # only search again when crossing to another day
+        plan = self._current_plan()
+        result = dtresult = None
+        if plan is not None:
+            result = _intraday_step(plan, self.cur, is_prev)
+        if result is None:
+            # only a timezone with DST changes can move the result
+            if _fixed_offset(self.tzinfo):
+                result = self._search_day(is_prev, passes)
+            elif self._wall_clock:
+                result = self._search_wall_clock(is_prev, passes)
+            else:
+                result = self._search_day(is_prev, passes)
+                result, dtresult = self._adjust_dst(result)
+            self._day_plan = self._plan_day(result)
+        elif _search_stats is not None:
+            _search_stats.add('intraday_steps', self.expressions)
+        if update_current:
+            self.cur = result
+        # the search works in whole seconds, as ints
+        if issubclass(ret_type, datetime.datetime):
+            result = dtresult or self.timestamp_to_datetime(result)
+        elif not issubclass(ret_type, int):
+            result = float(result)
+        return result
 
-        if not issubclass(ret_type, (float, datetime.datetime)):
-            raise TypeError(
-                "Invalid ret_type, only 'float' or 'datetime' is acceptable."
-            )
+    def _adjust_dst(self, result):
+        """Return `result`, shifted when a DST change is crossed, as a timestamp
+        and as a datetime.
+        """
+        table = _transition_table(self.tzinfo)
+        if table is not None:
+            offset = table.utcoffset(result)
+            if offset is not None and offset == table.utcoffset(self.dst_start_time):
+                return result, None  # no DST change crossed
+        # DST Handling for cron job spanning across days
+        dtstarttime = self._timestamp_to_datetime(self.dst_start_time)
+        dtstarttime_utcoffset = dtstarttime.utcoffset() or datetime.timedelta(0)
+        dtresult = self.timestamp_to_datetime(result)
+        lag = lag_hours = 0
+        # do we trigger DST on next crontab (handle backward changes)
+        dtresult_utcoffset = dtstarttime_utcoffset
+        if dtresult and self.tzinfo:
+            dtresult_utcoffset = dtresult.utcoffset()
+            lag_hours = self._timedelta_to_seconds(dtresult - dtstarttime) / (60 * 60)
+            lag = self._timedelta_to_seconds(dtresult_utcoffset - dtstarttime_utcoffset)
+        hours_before_midnight = 24 - dtstarttime.hour
+        if dtresult_utcoffset != dtstarttime_utcoffset:
+            if (lag > 0 and abs(lag_hours) >= hours_before_midnight) or (
+                lag < 0
+                and ((3600 * abs(lag_hours) + abs(lag)) >= hours_before_midnight * 3600)
+            ):
+                dtresult_adjusted = dtresult - datetime.timedelta(seconds=lag)
+                result_adjusted = _datetime_to_seconds(dtresult_adjusted)
+                # Do the actual adjust only if the result time actually exists
+                if (
+                    self._timestamp_to_datetime(result_adjusted).tzinfo
+                    == dtresult_adjusted.tzinfo
+                ):
+                    dtresult = dtresult_adjusted
+                    result = result_adjusted
+                    _count('dst_adjustments', self.expressions)
+                self.dst_start_time = result
+        return result, dtresult
+
+    def _search_wall_clock(self, is_prev, passes):
+        """Run the full search over the local wall-clock time of `self.cur`.
+
+        The fields advance as a naive datetime, without converting to UTC and
+        back or adjusting for DST afterwards. Each matched wall-clock time is
+        then resolved to a timestamp once: a time skipped by the clocks moving
+        forward fires at the change with `dst_gap='shift'`, or not at all with
+        'skip', and a time repeated by them moving back fires at its `dst_fold`
+        ('first' or 'last') occurrence.
+        """
+        tzinfo = self.tzinfo
+        table = _transition_table(tzinfo)
+        cur = self.cur
+        position = self._wall_position
+        if position is not None and position[0] == cur:
+            wall = position[1]
+        else:
+            wall = _wall_clock_at(tzinfo, table, cur, self._dst_fold)
+        while True:
+            wall = self._search_day(is_prev, passes, wall, None)
+            # offsets a day away, which bound those the wall-clock time can have
+            before = _utcoffset_seconds(tzinfo, table, wall - 86400)
+            after = _utcoffset_seconds(tzinfo, table, wall + 86400)
+            if before == after:
+                result = wall - before
+                break
+            found = [
+                t
+                for t in (wall - before, wall - after)
+                if _utcoffset_seconds(tzinfo, table, t) == wall - t
+            ]
+            if found:
+                result = found[0] if self._dst_fold == 'first' else found[-1]
+            else:
+                _count('dst_gaps', self.expressions)
+                if self._dst_gap == 'skip':
+                    continue
+                result = _offset_change(tzinfo, table, wall - after, wall - before)
+            if (result < cur) if is_prev else (result > cur):
+                break
+            if not found:
+                # past the other times of the gap, which fire at the same change
+                wall = result + (before if is_prev else after)
+        self._wall_position = (result, wall)
+        return result
+
+    def _search_day(self, is_prev, passes, now=None, tzinfo=MARKER):
+        """Run the full search from `now` (`self.cur` by default) and return the
+        found timestamp. `tzinfo=None` searches over naive wall-clock times.
+        """
+        if now is None:
+            now = self.cur
+        expanded = self.expanded[:]
+        nth_weekday_of_month = self.nth_weekday_of_month.copy()
 
         # exception to support day of month and day of week as defined in cron
         dom_dow_exception_processed = False
@@ -342,11 +836,16 @@ class croniter:
             else:
                 bak = expanded[DOW_FIELD]
                 expanded[DOW_FIELD] = ['*']
-                t1 = self._calc(self.cur, expanded, nth_weekday_of_month, is_prev)
+                t1 = self._calc(
+                    now, expanded, nth_weekday_of_month, is_prev, passes, tzinfo
+                )
                 expanded[DOW_FIELD] = bak
                 expanded[DAY_FIELD] = ['*']
 
-                t2 = self._calc(self.cur, expanded, nth_weekday_of_month, is_prev)
+                t2 = self._calc(
+                    now, expanded, nth_weekday_of_month, is_prev, passes, tzinfo
+                )
+                _count('dom_dow_passes', self.expressions)
                 if not is_prev:
                     result = t1 if t1 < t2 else t2
                 else:
@@ -354,40 +853,98 @@ class croniter:
                 dom_dow_exception_processed = True
 
         if not dom_dow_exception_processed:
-            result = self._calc(self.cur, expanded, nth_weekday_of_month, is_prev)
+            result = self._calc(
+                now, expanded, nth_weekday_of_month, is_prev, passes, tzinfo
+            )
+        return result
 
-        # DST Handling for cron job spanning across days
-        dtstarttime = self._timestamp_to_datetime(self.dst_start_time)
-        dtstarttime_utcoffset = dtstarttime.utcoffset() or datetime.timedelta(0)
-        dtresult = self.timestamp_to_datetime(result)
-        lag = lag_hours = 0
-        # do we trigger DST on next crontab (handle backward changes)
-        dtresult_utcoffset = dtstarttime_utcoffset
-        if dtresult and self.tzinfo:
-            dtresult_utcoffset = dtresult.utcoffset()
-            lag_hours = self._timedelta_to_seconds(dtresult - dtstarttime) / (60 * 60)
-            lag = self._timedelta_to_seconds(dtresult_utcoffset - dtstarttime_utcoffset)
-        hours_before_midnight = 24 - dtstarttime.hour
-        if dtresult_utcoffset != dtstarttime_utcoffset:
-            if (lag > 0 and abs(lag_hours) >= hours_before_midnight) or (
-                lag < 0
-                and ((3600 * abs(lag_hours) + abs(lag)) >= hours_before_midnight * 3600)
+    def _current_plan(self):
+        """Return the plan of the last matched day, if it is still usable."""
+        plan = self._day_plan
+        if plan is not None and plan[:2] == (
+            self.tzinfo,
+            None
+            if self._wall_clock or _fixed_offset(self.tzinfo)
+            else self.dst_start_time,
+        ):
+            return plan
+        return None
+
+    def _day_steps(self, n, ret_type, is_prev):
+        """Take up to `n` steps within the planned day at once, moving `cur`.
+
+        Returns an empty list when the next result is on another day.
+        """
+        plan = self._current_plan()
+        if plan is None:
+            return []
+        _, _, midnight, offsets = plan
+        t = self.cur - midnight
+        if is_prev:
+            if not 0 < t <= 86400:
+                return []
+            stop = bisect_left(offsets, t)
+            found = offsets[max(stop - n, 0) : stop][::-1]
+        else:
+            if not 0 <= t < 86400:
+                return []
+            start = bisect_right(offsets, t)
+            found = offsets[start : start + n]
+        if not found:
+            return []
+        self.cur = midnight + found[-1]
+        if _search_stats is not None:
+            _search_stats.add('intraday_steps', self.expressions, len(found))
+        if issubclass(ret_type, datetime.datetime):
+            # the day has a single UTC offset, so wall-clock arithmetic holds
+            day = self.timestamp_to_datetime(midnight)
+            return [day + datetime.timedelta(seconds=offset) for offset in found]
+        if issubclass(ret_type, int):
+            return [midnight + offset for offset in found]
+        return [float(midnight + offset) for offset in found]
+
+    def _plan_day(self, result):
+        """Return the `_intraday_step` plan of the day of `result`, if any.
+
+        Days with a UTC offset change are not planned: their times are not a
+        fixed offset from midnight.
+        """
+        offsets = _intraday_offsets(self.expanded)
+        if offsets is None:
+            return None
+        tzinfo = self.tzinfo
+        fixed = _fixed_offset(tzinfo)
+        table = None if fixed else _transition_table(tzinfo)
+        utcoffset = None if table is None else table.utcoffset(result)
+        if utcoffset is None:
+            local = _timestamp_to_datetime(result, tzinfo or UTC_DT)
+            second_of_day = local.hour * 3600 + local.minute * 60 + local.second
+        else:
+            second_of_day = (result + utcoffset) % 86400
+        i = bisect_left(offsets, second_of_day)
+        if i == len(offsets) or offsets[i] != second_of_day:
+            return None  # moved off the schedule by `_adjust_dst`
+        midnight = result - second_of_day
+        if fixed:
+            return (tzinfo, None, midnight, offsets)
+        # `_adjust_dst` is a no-op for results at the UTC offset of
+        # `dst_start_time`, so the steps can skip it while that one is the same;
+        # wall-clock searches do not depend on it
+        key = None if self._wall_clock else self.dst_start_time
+        if utcoffset is not None:
+            if not table.same_offset(midnight, midnight + 86399) or (
+                key is not None and table.utcoffset(key) != utcoffset
             ):
-                dtresult_adjusted = dtresult - datetime.timedelta(seconds=lag)
-                result_adjusted = self._datetime_to_timestamp(dtresult_adjusted)
-                # Do the actual adjust only if the result time actually exists
+                return None
+        else:
+            utcoffset = local.utcoffset()
+            for t in (midnight, midnight + 86399, key):
                 if (
-                    self._timestamp_to_datetime(result_adjusted).tzinfo
-                    == dtresult_adjusted.tzinfo
+                    t is not None
+                    and _timestamp_to_datetime(t, tzinfo).utcoffset() != utcoffset
                 ):
-                    dtresult = dtresult_adjusted
-                    result = result_adjusted
-                self.dst_start_time = result
-        if update_current:
-            self.cur = result
-        if issubclass(ret_type, datetime.datetime):
-            result = dtresult
-        return result
+                    return None
+        return (tzinfo, key, midnight, offsets)
 
     # iterator protocol, to enable direct use of croniter
     # objects in a loop, like "for dt in croniter("5 0 * * *'): ..."
@@ -430,15 +987,125 @@ class croniter:
                 return
             raise
 
+    def to_bytes(self):
+        """Return a compact, versioned binary encoding of this iterator.
+
+        The expanded fields are stored as bitmasks, together with the flags
+        and current position, typically in well under 100 bytes. Naive, UTC
+        and fixed-offset `datetime.timezone` start times are encoded; any other
+        tzinfo has to be passed back to `from_bytes`, as does an `int` ret_type.
+        """
+        from . import _codec
+
+        return _codec.encode(self)
+
+    @classmethod
+    def from_bytes(cls, data, tzinfo=MARKER, ret_type=None):
+        """Rebuild an iterator from `to_bytes` output, without re-parsing.
+
+        Raises ValueError for truncated data or an unknown encoding version.
+        """
+        from . import _codec
+
+        return _codec.decode(cls, bytes(data), tzinfo, ret_type, MARKER)
+
+    def fingerprint(self):
+        """Return a stable hex digest of the times this schedule matches.
+
+        Expressions matching the same times have the same fingerprint however
+        they are spelled, e.g. `*/15 * * * *` and `0,15,30,45 * * * *`; see
+        `CronSchedule.intern` to share one schedule between them.
+        """
+        from . import _codec
+
+        return _codec.fingerprint(self)
+
+    def __reduce__(self):
+        # the tzinfo and ret_type are pickled by reference next to the encoding
+        return (
+            type(self).from_bytes,
+            (self.to_bytes(), self.tzinfo, self._ret_type),
+        )
+
+    def aiter(self, ret_type=None):
+        """Returns an async iterator yielding each next date once it is due.
+
+        Wakeups are scheduled with `loop.call_at` on the event loop's
+        monotonic clock, and each deadline is taken from the schedule rather
+        than from the previous wakeup, so fires do not drift::
+
+            async for dt in croniter('*/5 * * * *', ret_type=datetime.datetime).aiter():
+                ...
+
+        Dates already in the past (e.g. with an old start_time) are yielded
+        immediately. Naive schedules are interpreted as UTC, as with
+        `get_next(float)`.
+        """
+        from ._aio import aiter_schedule
+
+        return aiter_schedule(self, ret_type)
+
     def iter(self, *args, **kwargs):
         return self.all_prev if self._is_prev else self.all_next
 
+    def next_array(self, n, unit='s'):
+        """Returns the next `n` dates as an int64 array of epoch times in `unit`.
+
+        Dates follow the iterator's direction, as with `iter_chunks`, and come
+        in an `array('q')` that exports them through the buffer protocol; see
+        `croniter_range_array`. The array is shorter than `n` only when a
+        `max_years_between_matches` window runs out.
+        """
+        return _int64_array(itertools.islice(self.iter_chunks(n, int), 1), unit)
+
+    def iter_chunks(self, size=1024, ret_type=None):
+        """Returns a generator yielding the following dates in lists of `size`.
+
+        Dates follow the iterator's direction, as with `next()`. Dates within
+        a day of a schedule firing several times a day are computed together,
+        so streaming them costs much less per date than `all_next`. The last
+        list may be shorter; exhaustion is handled as in `all_next`.
+        """
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        ret_type = ret_type or self._ret_type
+        _check_ret_type(ret_type)
+        is_prev = self._is_prev
+        while True:
+            chunk = []
+            try:
+                while len(chunk) < size:
+                    steps = self._day_steps(size - len(chunk), ret_type, is_prev)
+                    if steps:
+                        chunk += steps
+                    else:
+                        chunk.append(self._get_next(ret_type, is_prev=is_prev))
+            except CroniterBadDateError:
+                if chunk:
+                    yield chunk
+                if self._max_years_btw_matches_explicitly_set:
+                    return
+                raise
+            yield chunk
+
     def __iter__(self):
         return self
 
     __next__ = next = _get_next
 
-    def _calc(self, now, expanded, nth_weekday_of_month, is_prev):
+    def _calc(
+        self, now, expanded, nth_weekday_of_month, is_prev, passes=None, tzinfo=MARKER
+    ):
+        # dateutil is only loaded once a date is actually searched for
+        from dateutil.relativedelta import relativedelta
+
+        stats = _search_stats
+        if stats is not None:
+            stats.add('calc_calls', self.expressions)
+            relativedelta = stats.counting(
+                relativedelta, 'relativedelta_ops', self.expressions
+            )
+
         if is_prev:
             now = math.ceil(now)
             nearest_diff_method = self._get_prev_nearest_diff
@@ -450,7 +1117,7 @@ class croniter:
             sign = 1
             offset = 1 if (len(expanded) > UNIX_CRON_LEN) else 60
 
-        dst = now = self.timestamp_to_datetime(now + sign * offset)
+        dst = now = self.timestamp_to_datetime(now + sign * offset, tzinfo)
 
         month, year = dst.month, dst.year
         current_year = now.year
@@ -555,16 +1222,14 @@ class croniter:
                     return True, d
             return False, d
 
-        def proc_day_of_week_nth(d):
-            if '*' in nth_weekday_of_month:
-                s = nth_weekday_of_month['*']
-                for i in range(0, 7):
-                    if i in nth_weekday_of_month:
-                        nth_weekday_of_month[i].update(s)
-                    else:
-                        nth_weekday_of_month[i] = s
-                del nth_weekday_of_month['*']
+        if '*' in nth_weekday_of_month:
+            # build a new mapping: the sets are shared with the croniter instance
+            s = nth_weekday_of_month['*']
+            nth_weekday_of_month = {
+                i: nth_weekday_of_month.get(i, set()) | s for i in range(0, 7)
+            }
 
+        def proc_day_of_week_nth(d):
             candidates = []
             for wday, nth in nth_weekday_of_month.items():
                 c = self._get_nth_weekday_of_month(d.year, d.month, wday)
@@ -651,7 +1316,23 @@ class croniter:
             proc_second,
         ]
 
+        # months where the day-of-month field can match at all; the search jumps
+        # over the others instead of stepping through them
+        feasible = _feasible_months(expanded[DAY_FIELD], expanded[MONTH_FIELD])
+
         while abs(year - current_year) <= self._max_years_between_matches:
+            if stats is not None:
+                stats.add('calc_iterations', self.expressions)
+            if passes is not None:
+                passes[0] += 1
+            if feasible is not None and (dst.month, is_leap(dst.year)) not in feasible:
+                dst = _nearest_feasible_month(dst, feasible, is_prev)
+                if dst is None:
+                    break
+                if stats is not None:
+                    stats.add('restarts.month_index', self.expressions)
+                month, year = dst.month, dst.year
+                continue
             next = False
             stop = False
             for proc in procs:
@@ -662,6 +1343,9 @@ class croniter:
                     stop = True
                     break
                 if changed:
+                    if stats is not None:
+                        # proc_month -> restarts.month
+                        stats.add(f'restarts.{proc.__name__[5:]}', self.expressions)
                     month, year = dst.month, dst.year
                     next = True
                     break
@@ -669,7 +1353,7 @@ class croniter:
                 break
             if next:
                 continue
-            return self.datetime_to_timestamp(dst.replace(microsecond=0))
+            return _datetime_to_seconds(dst)
 
         if is_prev:
             raise CroniterBadDateError('failed to find prev date')
@@ -751,6 +1435,8 @@ class croniter:
         The last weekday of the month is always [-1].
         """
         w = (day_of_week + 6) % 7
+        import calendar
+
         c = calendar.Calendar(w).monthdayscalendar(year, month)
         if c[0][0] == 0:
             c.pop(0)
@@ -789,13 +1475,7 @@ class croniter:
         return val
 
     @classmethod
-    def _expand(
-        cls,
-        expr_format,
-        hash_id=None,
-        second_at_beginning=False,
-        from_timestamp=None,
-    ):
+    def _split_expression(cls, expr_format, hash_id=None, second_at_beginning=False):
         # Split the expression in components, and normalize L -> l, MON -> mon,
         # etc. Keep expr_format untouched so we can use it in the exception
         # messages.
@@ -827,6 +1507,21 @@ class croniter:
             # move second to it's own(6th) field to process by same logical
             expressions.insert(SECOND_FIELD, expressions.pop(0))
 
+        return efl, expressions
+
+    @classmethod
+    def _expand(
+        cls,
+        expr_format,
+        hash_id=None,
+        second_at_beginning=False,
+        from_timestamp=None,
+        rng=None,
+    ):
+        efl, expressions = cls._split_expression(
+            expr_format, hash_id=hash_id, second_at_beginning=second_at_beginning
+        )
+
         expanded = []
         nth_weekday_of_month = {}
 
@@ -838,6 +1533,7 @@ class croniter:
                     expr,
                     hash_id=hash_id,
                     from_timestamp=from_timestamp,
+                    rng=rng,
                 )
 
             if '?' in expr:
@@ -880,8 +1576,7 @@ class croniter:
 
                 # Before matching step_search_re, normalize "*" to "{min}-{max}".
                 # Example: in the minute field, "*/5" normalizes to "0-59/5"
-                t = re.sub(
-                    r'^\*(\/.+)$',
+                t = star_step_re.sub(
                     r'%d-%d\1'
                     % (cls.RANGES[field_index][0], cls.RANGES[field_index][1]),
                     str(e),
@@ -892,8 +1587,7 @@ class croniter:
                     # Before matching step_search_re,
                     # normalize "{start}/{step}" to "{start}-{max}/{step}".
                     # Example: in the minute field, "10/5" normalizes to "10-59/5"
-                    t = re.sub(
-                        r'^(.+)\/(.+)$',
+                    t = start_step_re.sub(
                         r'\1-%d/\2' % (cls.RANGES[field_index][1]),
                         str(e),
                     )
@@ -950,26 +1644,28 @@ class croniter:
                             )
                         )
                         # Add FirstBound -> ENDRANGE, respecting step
-                        rng = list(range(low, cls.RANGES[field_index][1] + 1, step))
+                        field_range = list(
+                            range(low, cls.RANGES[field_index][1] + 1, step)
+                        )
                         # Then 0 -> SecondBound, but skipping n first occurences according to step
                         # EG to respect such expressions : Apr-Jan/3
                         to_skip = 0
-                        if rng:
+                        if field_range:
                             already_skipped = list(reversed(whole_field_range)).index(
-                                rng[-1]
+                                field_range[-1]
                             )
-                            curpos = whole_field_range.index(rng[-1])
+                            curpos = whole_field_range.index(field_range[-1])
                             if ((curpos + step) > len(whole_field_range)) and (
                                 already_skipped < step
                             ):
                                 to_skip = step - already_skipped
-                        rng += list(
+                        field_range += list(
                             range(cls.RANGES[field_index][0] + to_skip, high + 1, step)
                         )
                     # if we include a range type: Jan-Jan, or Sun-Sun,
                     #  it means the whole cycle (all days of week, # all monthes of year, etc)
                     elif low == high:
-                        rng = list(
+                        field_range = list(
                             range(
                                 cls.RANGES[field_index][0],
                                 cls.RANGES[field_index][1] + 1,
@@ -978,16 +1674,16 @@ class croniter:
                         )
                     else:
                         try:
-                            rng = list(range(low, high + 1, step))
+                            field_range = list(range(low, high + 1, step))
                         except ValueError as exc:
                             raise CroniterBadCronError(f'invalid range: {exc}')
 
-                    rng = (
-                        [f'{item}#{nth}' for item in rng]
+                    field_range = (
+                        [f'{item}#{nth}' for item in field_range]
                         if field_index == DOW_FIELD and nth and nth != 'l'
-                        else rng
+                        else field_range
                     )
-                    e_list += [a for a in rng if a not in e_list]
+                    e_list += [a for a in field_range if a not in e_list]
                 else:
                     if t.startswith('-'):
                         raise CroniterBadCronError(
@@ -1048,7 +1744,7 @@ class croniter:
                 )
 
         EXPRESSIONS[(expr_format, hash_id, second_at_beginning)] = expressions
-        return expanded, nth_weekday_of_month
+        return expanded, nth_weekday_of_month, expressions
 
     @classmethod
     def expand(
@@ -1057,6 +1753,7 @@ class croniter:
         hash_id=None,
         second_at_beginning=False,
         from_timestamp=None,
+        rng=None,
     ):
         """Expand a cron expression format into a noramlized format of
         list[list[int | 'l' | '*']]. The first list representing each element
@@ -1094,21 +1791,82 @@ class croniter:
         >>> croniter.expand('0 0 * * * */15')
         ([[0], [0], ['*'], ['*'], ['*'], [0, 15, 30, 45]], {})
         """
+        return cls._checked_expand(
+            expr_format,
+            hash_id=hash_id,
+            second_at_beginning=second_at_beginning,
+            from_timestamp=from_timestamp,
+            rng=rng,
+        )[:2]
+
+    @classmethod
+    def _checked_expand(
+        cls,
+        expr_format,
+        hash_id=None,
+        second_at_beginning=False,
+        from_timestamp=None,
+        rng=None,
+    ):
+        # `expand`, also returning the split fields
+        rng = _coerce_rng(rng)
         try:
             return cls._expand(
                 expr_format,
                 hash_id=hash_id,
                 second_at_beginning=second_at_beginning,
                 from_timestamp=from_timestamp,
+                rng=rng,
             )
         except (ValueError,) as exc:
             if isinstance(exc, CroniterError):
                 raise
             if int(sys.version[0]) >= 3:
-                trace = _traceback.format_exc()
+                import traceback
+
+                trace = traceback.format_exc()
                 raise CroniterBadCronError(trace)
             raise CroniterBadCronError(f'{exc}')
 
+    @classmethod
+    def expand_many(
+        cls,
+        expr_formats,
+        rng=None,
+        hash_id=None,
+        second_at_beginning=False,
+    ):
+        """Expand several cron expressions, drawing every random (`R`) field
+        from a single generator.
+
+        `rng` may be an int seed or a `CronRandom` instance; passing the same
+        seed replays the same expansions. Results are returned in input order,
+        in the same format as `expand`.
+
+        Examples:
+        >>> a = croniter.expand_many(['R R * * *', 'R * * * *'], rng=42)
+        >>> b = croniter.expand_many(['R R * * *', 'R * * * *'], rng=42)
+        >>> a == b
+        True
+        """
+        rng = _coerce_rng(rng)
+        if rng is None:
+            rng = CronRandom()
+        if hash_id:
+            if not isinstance(hash_id, (bytes, str)):
+                raise TypeError('hash_id must be bytes or UTF-8 string')
+            if not isinstance(hash_id, bytes):
+                hash_id = hash_id.encode('UTF-8')
+        return [
+            cls.expand(
+                expr_format,
+                hash_id=hash_id,
+                second_at_beginning=second_at_beginning,
+                rng=rng,
+            )
+            for expr_format in expr_formats
+        ]
+
     @classmethod
     def _get_low_from_current_date_number(cls, field_index, step, from_timestamp):
         dt = datetime.datetime.fromtimestamp(from_timestamp, tz=UTC_DT)
@@ -1170,7 +1928,7 @@ class croniter:
         )
         tdp = cron.get_current(datetime.datetime)
         if not tdp.microsecond:
-            tdp += relativedelta(microseconds=1)
+            tdp += datetime.timedelta(microseconds=1)
         cron.set_current(tdp, force=True)
         try:
             tdt = cron.get_prev()
@@ -1193,6 +1951,11 @@ def croniter_range(
     _croniter=None,
     second_at_beginning=False,
     expand_from_start_time=False,
+    chunk_size=None,
+    wall_clock=False,
+    dst_gap='shift',
+    dst_fold='first',
+    hash_id=None,
 ):
     """Generator that provides all times from start to stop matching the given cron expression.
     If the cron expression matches either 'start' and/or 'stop', those times will be returned as
@@ -1200,6 +1963,14 @@ def croniter_range(
 
     You can think of this function as sibling to the builtin range function for datetime objects.
     Like range(start,stop,step), except that here 'step' is a cron expression.
+
+    Numeric `start` and `stop` give float timestamps by default; pass
+    `ret_type=int` for exact integer ones.
+
+    With `chunk_size`, the times come in lists of that many (the last one may
+    be shorter), computed in bulk as by `croniter.iter_chunks`.
+
+    `wall_clock`, `dst_gap`, `dst_fold` and `hash_id` are those of `croniter`.
     """
     _croniter = _croniter or croniter
     auto_rt = datetime.datetime
@@ -1211,15 +1982,12 @@ def croniter_range(
             f'The start and stop must be same type.  {type(start)} != {type(stop)}'
         )
     if isinstance(start, (float, int)):
-        start, stop = (
-            datetime.datetime.fromtimestamp(t, tzutc()).replace(tzinfo=None)
-            for t in (start, stop)
-        )
+        start, stop = _timestamp_to_datetime(start), _timestamp_to_datetime(stop)
         auto_rt = float
     if ret_type is None:
         ret_type = auto_rt
     if not exclude_ends:
-        ms1 = relativedelta(microseconds=1)
+        ms1 = datetime.timedelta(microseconds=1)
         if start < stop:  # Forward (normal) time order
             start -= ms1
             stop += ms1
@@ -1235,6 +2003,10 @@ def croniter_range(
         max_years_between_matches=year_span,
         second_at_beginning=second_at_beginning,
         expand_from_start_time=expand_from_start_time,
+        wall_clock=wall_clock,
+        dst_gap=dst_gap,
+        dst_fold=dst_fold,
+        hash_id=hash_id,
     )
     # define a continue (cont) condition function and step function for the main while loop
     if start < stop:  # Forward
@@ -1249,14 +2021,204 @@ def croniter_range(
             return v > stop
 
         step = ic.get_prev
+    if chunk_size is not None:
+        yield from _range_chunks(ic, start < stop, stop, ret_type, chunk_size)
+        return
     try:
         dt = step()
         while cont(dt):
-            if ret_type is float:
-                yield ic.get_current(float)
+            if ret_type is float or ret_type is int:
+                yield ic.get_current(ret_type)
             else:
                 yield dt
             dt = step()
     except CroniterBadDateError:
         # Stop iteration when this exception is raised; no match found within the given year range
         return
+
+
+# epoch time units of the int64 arrays, as multiples of a second
+_UNIT_SCALES = {'s': 1, 'ms': 10**3, 'us': 10**6, 'ns': 10**9}
+
+
+def _int64_array(chunks, unit):
+    """Pack int timestamps, in lists, into one `array('q')` of `unit` ticks."""
+    try:
+        scale = _UNIT_SCALES[unit]
+    except KeyError:
+        raise ValueError(
+            f'unit must be one of {", ".join(_UNIT_SCALES)}, not {unit!r}'
+        ) from None
+    from array import array
+
+    result = array('q')
+    for chunk in chunks:
+        if scale == 1:
+            result.extend(chunk)
+        else:
+            result.extend([t * scale for t in chunk])
+    return result
+
+
+def croniter_range_array(start, stop, expr_format, unit='s', **kwargs):
+    """Return all the times of `croniter_range` at once, as an int64 array.
+
+    The `array('q')` holds epoch times in `unit` ('s', 'ms', 'us' or 'ns') and
+    exports them through the buffer protocol, so `memoryview`, `struct`,
+    `numpy.frombuffer(times, 'int64')` or Arrow read them without a copy.
+    Other keyword arguments are those of `croniter_range`.
+    """
+    return _int64_array(
+        croniter_range(
+            start, stop, expr_format, ret_type=int, chunk_size=4096, **kwargs
+        ),
+        unit,
+    )
+
+
+def _range_chunks(ic, forward, stop, ret_type, chunk_size):
+    """`croniter_range` in lists of `chunk_size` times."""
+    ic._is_prev = not forward
+    if ret_type is float or ret_type is int:
+        stop = datetime_to_timestamp(stop)
+    else:
+        ret_type = datetime.datetime
+    try:
+        for chunk in ic.iter_chunks(chunk_size, ret_type):
+            if (chunk[-1] < stop) if forward else (chunk[-1] > stop):
+                yield chunk
+                continue
+            # the last chunk: keep the times before `stop`
+            if forward:
+                del chunk[bisect_left(chunk, stop) :]
+            else:
+                while chunk and chunk[-1] <= stop:
+                    chunk.pop()
+            if chunk:
+                yield chunk
+            return
+    except CroniterBadDateError:
+        return
+
+
+def _next_or_none(itr):
+    """Advance `itr` to its next timestamp, or return None once it is exhausted.
+
+    Schedulers built on croniter use this to drop a job whose
+    `max_years_between_matches` window has run out, as iteration does.
+    """
+    try:
+        return itr.get_next(float)
+    except CroniterBadDateError:
+        if itr._max_years_btw_matches_explicitly_set:
+            return None
+        raise
+
+
+def enable_stats(per_expression=False):
+    """Start counting what the date search does, for this process.
+
+    The counters (see `stats`) show why `get_next` is slow for an expression:
+    how many passes the search loop made, which fields forced it to restart,
+    how many relativedelta steps, DOM/DOW double searches and DST adjustments
+    it took, and how the `timestamp_to_datetime` cache performed. With
+    `per_expression`, counts are also kept per normalized expression.
+
+    Counting is off by default, and then costs a global lookup per check.
+    """
+    global _search_stats
+    if _search_stats is None:
+        from ._stats import SearchStats
+
+        _search_stats = SearchStats(per_expression)
+    else:
+        _search_stats.per_expression = per_expression
+
+
+def disable_stats():
+    """Stop counting and drop the counters."""
+    global _search_stats
+    _search_stats = None
+
+
+def stats(by_expression=False):
+    """Return the search counters collected since `enable_stats`.
+
+    Returns a dict of counter name to count, or with `by_expression` a dict of
+    normalized expression to such dicts. Empty while counting is disabled.
+    """
+    if _search_stats is None:
+        return {}
+    return _search_stats.snapshot(by_expression)
+
+
+def reset_stats():
+    """Zero the search counters, keeping counting enabled."""
+    if _search_stats is not None:
+        _search_stats.reset()
+
+
+def set_slow_hook(callback, seconds=None, iterations=None):
+    """Report date searches that take longer than `seconds` or `iterations`.
+
+    `callback` is called with a `SlowComputation` (expression, hash_id,
+    start_time, is_prev, elapsed, iterations) after each `get_next`/`get_prev`
+    step, including those of `all_next`, iteration and `croniter_range`, that
+    ran for at least `seconds` or made at least `iterations` passes of the
+    search loop. Searches that give up with CroniterBadDateError are reported
+    too. The callback runs in the searching thread, and exceptions it raises
+    propagate.
+
+    Pass `callback=None` to remove the hook.
+    """
+    global _slow_watch
+    if callback is None:
+        _slow_watch = None
+        return
+    if seconds is None and iterations is None:
+        raise ValueError('set_slow_hook needs seconds or iterations')
+    from ._slow import SlowWatch
+
+    _slow_watch = SlowWatch(callback, seconds, iterations)
+
+
+def set_transition_horizon(first_year, last_year):
+    """Set the UTC years over which zoneinfo timezones are tabulated.
+
+    The search reads UTC offsets from a table of each timezone's transitions.
+    pytz zones come with theirs; zoneinfo zones are scanned for offset changes
+    a year at a time, as dates are searched, but only from `first_year` to
+    `last_year` (1970 to 2100 by default). Outside of those, conversions go
+    through the zone itself, as for any other tzinfo implementation.
+    """
+    if not datetime.MINYEAR < first_year <= last_year < datetime.MAXYEAR:
+        raise ValueError('the horizon must be a range of years within 2-9998')
+    from . import _tztable
+
+    _tztable.HORIZON = (first_year, last_year)
+    TRANSITION_TABLES.clear()
+
+
+# Optional subsystems are imported on first use, so that `import croniters`
+# does not pay for loading asyncio or multiprocessing.
+_LAZY_ATTRIBUTES = {
+    'CronCursor': '._cursor',
+    'CronDispatcher': '._dispatcher',
+    'CronDriver': '._aio',
+    'CronSchedule': '._cursor',
+    'Horizon': '._horizon',
+    'SlowComputation': '._slow',
+    'schedule_horizon': '._horizon',
+    # retrocompat: these used to be imported at module level
+    'relativedelta': 'dateutil.relativedelta',
+    'tzutc': 'dateutil.tz',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import time
+from collections.abc import AsyncIterator, Hashable
+from typing import TYPE_CHECKING, Any, Callable
+
+from croniters import _next_or_none
+
+if TYPE_CHECKING:
+    from croniters import croniter
+
+# Longest single timer. The wall clock is re-read on every wakeup, so a step in
+# system time (NTP, suspend/resume) is noticed within this many seconds.
+MAX_SLEEP = 60.0
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def sleep_until(timestamp: float) -> None:
+    """Sleep until the wall clock reaches `timestamp` (epoch seconds).
+
+    The wakeup is armed with `loop.call_at` on the loop's monotonic clock and
+    re-armed until `time.time()` has actually caught up, so early wakeups and
+    wall-clock steps never deliver a fire before its scheduled second.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        delay = timestamp - time.time()
+        if delay <= 0:
+            return
+        waiter = loop.create_future()
+        handle = loop.call_at(loop.time() + min(delay, MAX_SLEEP), _wake, waiter)
+        try:
+            await waiter
+        finally:
+            handle.cancel()
+
+
+async def aiter_schedule(
+    itr: croniter, ret_type: type | None = None
+) -> AsyncIterator[Any]:
+    """Yield each fire time of `itr` when it is due. See `croniter.aiter`."""
+    while True:
+        timestamp = _next_or_none(itr)
+        if timestamp is None:
+            return
+        # Every deadline comes from the schedule itself, not from when the previous
+        # wakeup happened, so lateness never accumulates across fires.
+        await sleep_until(timestamp)
+        yield itr.get_current(ret_type)
+
+
+class CronDriver:
+    """Multiplex many croniter schedules on a single event-loop timer.
+
+    Jobs are kept in a heap ordered by their next fire time, and only the
+    earliest one has a timer armed, so thousands of schedules cost one pending
+    callback instead of one task each.
+
+    Example:
+    >>> driver = CronDriver()
+    >>> driver.add('report', croniter('0 * * * *'))
+    >>> driver.add('cleanup', croniter('*/5 * * * *'))
+    >>> async for key, fire_time in driver:
+    ...     print(key, fire_time)
+
+    A driver should be consumed by a single coroutine at a time.
+    """
+
+    def __init__(self, ret_type: type | None = None):
+        self._ret_type = ret_type
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._jobs: dict[Hashable, tuple[croniter, int]] = {}
+        self._counter = itertools.count()
+        self._waiter: asyncio.Future | None = None
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    def add(self, key: Hashable, itr: croniter) -> None:
+        """Schedule `itr` under `key`, replacing any job already using that key."""
+        timestamp = _next_or_none(itr)
+        if timestamp is None:
+            self._jobs.pop(key, None)
+            return
+        seq = next(self._counter)
+        self._jobs[key] = (itr, seq)
+        heapq.heappush(self._heap, (timestamp, seq, key))
+        # The new job may be due before the timer currently armed.
+        if self._waiter is not None:
+            _wake(self._waiter)
+
+    def remove(self, key: Hashable) -> None:
+        """Unschedule the job under `key`. Raises KeyError if there is none."""
+        # The heap entry is dropped lazily once it reaches the top.
+        del self._jobs[key]
+
+    def _drop_stale(self) -> None:
+        heap, jobs = self._heap, self._jobs
+        while heap and (heap[0][2] not in jobs or jobs[heap[0][2]][1] != heap[0][1]):
+            heapq.heappop(heap)
+
+    async def _next_due(self) -> tuple[float, int, Hashable]:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._drop_stale()
+            handle = None
+            if self._heap:
+                delay = self._heap[0][0] - time.time()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)
+                self._waiter = loop.create_future()
+                handle = loop.call_at(
+                    loop.time() + min(delay, MAX_SLEEP), _wake, self._waiter
+                )
+            else:
+                self._waiter = loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+                if handle is not None:
+                    handle.cancel()
+
+    async def _events(self) -> AsyncIterator[tuple[Hashable, Any]]:
+        while True:
+            _, seq, key = await self._next_due()
+            itr = self._jobs[key][0]
+            fire_time = itr.get_current(self._ret_type)
+            timestamp = _next_or_none(itr)
+            if timestamp is None:
+                del self._jobs[key]
+            else:
+                heapq.heappush(self._heap, (timestamp, seq, key))
+            yield key, fire_time
+
+    def __aiter__(self) -> AsyncIterator[tuple[Hashable, Any]]:
+        return self._events()
+
+    async def run(self, callback: Callable[[Hashable, Any], Any]) -> None:
+        """Call `callback(key, fire_time)` for every due job, until cancelled.
+
+        A callback returning an awaitable is scheduled as a task, so a slow
+        job never delays the timer for the others. Exceptions from those tasks
+        go to the loop's exception handler; tasks still running when `run`
+        is cancelled are cancelled with it.
+        """
+        loop = asyncio.get_running_loop()
+        tasks: set[asyncio.Future] = set()
+
+        def done(task: asyncio.Future) -> None:
+            tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                loop.call_exception_handler(
+                    {
+                        'message': 'CronDriver job raised',
+                        'exception': task.exception(),
+                        'future': task,
+                    }
+                )
+
+        try:
+            async for key, fire_time in self:
+                result = callback(key, fire_time)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    tasks.add(task)
+                    task.add_done_callback(done)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
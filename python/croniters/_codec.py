@@ -0,0 +1,342 @@
+"""Compact binary encoding of parsed cron schedules.
+
+Layout (version 1, little-endian)::
+
+    u8   version
+    u8   number of fields (5, 6 or 7)
+    u8   flags (see FLAG_*)
+    u8   star mask: bit i set when field i expanded to ['*']
+    u16  max_years_between_matches
+    ...  one bitmask per non-star field, fixed width per field index
+    u64  nth-weekday table, present when FLAG_NTH is set
+    u16  length + UTF-8 of the space-joined source fields
+    u16  length + hash_id (empty when there is none)
+    3xf64 cur, start_time, dst_start_time
+    u8   tzinfo kind, followed by an i32 offset for TZ_FIXED
+    u8   wall-clock options (see WALL_*), omitted when all are off
+
+A typical five-field schedule encodes to 60-70 bytes, and decoding does not
+go through the expression parser.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import struct
+from typing import Any
+
+from . import (
+    CRON_FIELDS,
+    DAY_FIELD,
+    DOW_FIELD,
+    MONTH_FIELD,
+    RANGES_CONSTANT as RANGES,
+    SECOND_FIELD,
+    UNIX_CRON_LEN,
+    YEAR_CRON_LEN,
+    YEAR_FIELD,
+    _feasible_months,
+    re_star,
+)
+
+VERSION = 1
+# version of the `canonical` form, which fingerprints are computed from
+CANONICAL_VERSION = 1
+
+FLAG_DAY_OR = 1 << 0
+FLAG_IMPLEMENT_CRON_BUG = 1 << 1
+FLAG_SECOND_AT_BEGINNING = 1 << 2
+FLAG_EXPAND_FROM_START_TIME = 1 << 3
+FLAG_IS_PREV = 1 << 4
+FLAG_MAX_YEARS_SET = 1 << 5
+FLAG_NTH = 1 << 6
+FLAG_RET_DATETIME = 1 << 7
+
+WALL_CLOCK = 1 << 0
+WALL_GAP_SKIP = 1 << 1
+WALL_FOLD_LAST = 1 << 2
+
+TZ_NAIVE = 0
+TZ_UTC = 1
+TZ_FIXED = 2
+TZ_OTHER = 3
+
+_HEADER = struct.Struct('<BBBBH')
+_STATE = struct.Struct('<ddd')
+# bit used for 'l' in the day-of-month mask, after the 31 days
+_DOM_LAST_BIT = RANGES[DAY_FIELD][1] - RANGES[DAY_FIELD][0] + 1
+# nth-weekday table: one byte per weekday (slot 7 is '*'), bits 0-4 are the
+# 1st-5th occurrence and bit 5 is 'l'
+_NTH_LAST_BIT = 5
+_NTH_STAR_SLOT = 7
+_EVERY_DAY = frozenset(range(1, 32))
+_EVERY_WEEKDAY = frozenset(range(7))
+
+
+def _field_width(index: int) -> int:
+    low, high = RANGES[index]
+    return (high - low + 1 + (index == DAY_FIELD) + 7) // 8
+
+
+def _encode_field(index: int, values: list) -> bytes:
+    low = RANGES[index][0]
+    mask = 0
+    for value in values:
+        if value == 'l' and index == DAY_FIELD:
+            mask |= 1 << _DOM_LAST_BIT
+        else:
+            mask |= 1 << (value - low)
+    return mask.to_bytes(_field_width(index), 'little')
+
+
+def _decode_field(index: int, data: bytes) -> list:
+    low = RANGES[index][0]
+    mask = int.from_bytes(data, 'little')
+    values: list = []
+    bit = 0
+    while mask:
+        if mask & 1:
+            values.append(
+                'l' if index == DAY_FIELD and bit == _DOM_LAST_BIT else bit + low
+            )
+        mask >>= 1
+        bit += 1
+    return values
+
+
+def _encode_nth(nth_weekday_of_month: dict) -> bytes:
+    table = 0
+    for weekday, nths in nth_weekday_of_month.items():
+        slot = _NTH_STAR_SLOT if weekday == '*' else weekday
+        byte = 0
+        for nth in nths:
+            byte |= 1 << (_NTH_LAST_BIT if nth == 'l' else nth - 1)
+        table |= byte << (8 * slot)
+    return table.to_bytes(8, 'little')
+
+
+def _decode_nth(data: bytes) -> dict:
+    table = int.from_bytes(data, 'little')
+    nth_weekday_of_month = {}
+    for slot in range(8):
+        byte = (table >> (8 * slot)) & 0xFF
+        if byte:
+            nth_weekday_of_month['*' if slot == _NTH_STAR_SLOT else slot] = {
+                'l' if bit == _NTH_LAST_BIT else bit + 1
+                for bit in range(_NTH_LAST_BIT + 1)
+                if byte & (1 << bit)
+            }
+    return nth_weekday_of_month
+
+
+def encode_fields(expanded: list, nth_weekday_of_month: dict) -> tuple[int, bytes]:
+    """Return the star mask and the packed field bitmasks and nth table.
+
+    The result only depends on the set of values each field matches, not on
+    how the expression spelled them.
+    """
+    star_mask = 0
+    parts = []
+    for index, values in enumerate(expanded):
+        if values == ['*']:
+            star_mask |= 1 << index
+        else:
+            parts.append(_encode_field(index, values))
+    if nth_weekday_of_month:
+        parts.append(_encode_nth(nth_weekday_of_month))
+    return star_mask, b''.join(parts)
+
+
+def canonical(itr: Any) -> bytes:
+    """Return the canonical form of the times matched by a croniter or schedule.
+
+    Equivalent expressions give the same bytes however they spell their
+    fields, e.g. `*/15 * * * *`, `0,15,30,45 * * * *` and `0-59/15 * * * *`.
+    Seconds of 0 and years of `*` count as absent, and day fields matching
+    every day as `*`. `day_or` and `implement_cron_bug` only count when they
+    make the day fields match either one rather than both. Options that do not
+    change the times, such as `ret_type`, are not part of it.
+    """
+    expanded = list(itr.expanded)
+    nth_weekday_of_month = itr.nth_weekday_of_month
+    if len(expanded) == YEAR_CRON_LEN and expanded[YEAR_FIELD] == ['*']:
+        expanded.pop()
+    if len(expanded) == UNIX_CRON_LEN + 1 and expanded[SECOND_FIELD] == [0]:
+        expanded.pop()
+    days, weekdays = expanded[DAY_FIELD], expanded[DOW_FIELD]
+    # see `croniter._search_day`
+    day_or = (
+        days != ['*']
+        and weekdays != ['*']
+        and itr._day_or
+        and not (
+            itr._implement_cron_bug
+            and (
+                re_star.match(itr.expressions[DAY_FIELD])
+                or re_star.match(itr.expressions[DOW_FIELD])
+            )
+        )
+    )
+    # nth weekdays apply to both searches of `day_or`, so those are kept as is
+    if not nth_weekday_of_month:
+        every_day = _EVERY_DAY.issubset(days)
+        every_weekday = _EVERY_WEEKDAY.issubset(weekdays)
+        if not day_or:
+            if every_day:
+                expanded[DAY_FIELD] = ['*']
+            if every_weekday:
+                expanded[DOW_FIELD] = ['*']
+        # either search failing fails both, so the days must exist every month
+        elif every_day or (
+            every_weekday and _feasible_months(days, expanded[MONTH_FIELD]) is None
+        ):
+            expanded[DAY_FIELD] = expanded[DOW_FIELD] = ['*']
+            day_or = False
+    star_mask, fields = encode_fields(expanded, nth_weekday_of_month)
+    return (
+        bytes((CANONICAL_VERSION, len(expanded), FLAG_DAY_OR * day_or, star_mask))
+        + fields
+    )
+
+
+def fingerprint(itr: Any) -> str:
+    """Return a hex digest of `canonical(itr)`, stable across processes."""
+    return hashlib.blake2b(canonical(itr), digest_size=16).hexdigest()
+
+
+def _tz_kind(tzinfo: datetime.tzinfo | None) -> tuple[int, int]:
+    if tzinfo is None:
+        return TZ_NAIVE, 0
+    if tzinfo is datetime.timezone.utc:
+        return TZ_UTC, 0
+    if isinstance(tzinfo, datetime.timezone):
+        offset = tzinfo.utcoffset(None)
+        if offset.microseconds == 0:
+            return TZ_FIXED, int(offset.total_seconds())
+    return TZ_OTHER, 0
+
+
+def encode(itr: Any) -> bytes:
+    """Encode a croniter's parsed schedule and position. See `croniter.to_bytes`."""
+    flags = (
+        FLAG_DAY_OR * bool(itr._day_or)
+        | FLAG_IMPLEMENT_CRON_BUG * bool(itr._implement_cron_bug)
+        | FLAG_SECOND_AT_BEGINNING * bool(itr.second_at_beginning)
+        | FLAG_EXPAND_FROM_START_TIME * bool(itr._expand_from_start_time)
+        | FLAG_IS_PREV * bool(itr._is_prev)
+        | FLAG_MAX_YEARS_SET * bool(itr._max_years_btw_matches_explicitly_set)
+        | FLAG_NTH * bool(itr.nth_weekday_of_month)
+        | FLAG_RET_DATETIME * issubclass(itr._ret_type, datetime.datetime)
+    )
+    star_mask, fields = encode_fields(itr.expanded, itr.nth_weekday_of_month)
+    source = ' '.join(itr.expressions).encode('utf-8')
+    hash_id = itr._hash_id or b''
+    kind, offset = _tz_kind(itr.tzinfo)
+    wall = (
+        WALL_CLOCK * itr._wall_clock
+        | WALL_GAP_SKIP * (itr._dst_gap == 'skip')
+        | WALL_FOLD_LAST * (itr._dst_fold == 'last')
+    )
+    return b''.join(
+        (
+            _HEADER.pack(
+                VERSION,
+                len(itr.expanded),
+                flags,
+                star_mask,
+                min(itr._max_years_between_matches, 0xFFFF),
+            ),
+            fields,
+            struct.pack('<H', len(source)),
+            source,
+            struct.pack('<H', len(hash_id)),
+            hash_id,
+            _STATE.pack(itr.cur, itr.start_time, itr.dst_start_time),
+            struct.pack('<Bi', kind, offset) if kind == TZ_FIXED else bytes((kind,)),
+            bytes((wall,)) if wall else b'',
+        )
+    )
+
+
+def decode(
+    cls: type,
+    data: bytes,
+    tzinfo: Any,
+    ret_type: type | None,
+    missing: Any,
+) -> Any:
+    """Rebuild a `cls` instance from `encode` output without re-parsing.
+
+    `tzinfo` and `ret_type` override the encoded ones; `missing` is the
+    sentinel meaning "not given" for `tzinfo`.
+    """
+    try:
+        version, n_fields, flags, star_mask, max_years = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError('truncated schedule encoding') from None
+    if version != VERSION:
+        raise ValueError(f'unsupported schedule encoding version {version}')
+    try:
+        pos = _HEADER.size
+        expanded = []
+        for index in range(n_fields):
+            if star_mask & (1 << index):
+                expanded.append(['*'])
+                continue
+            width = _field_width(index)
+            expanded.append(_decode_field(index, data[pos : pos + width]))
+            pos += width
+        nth_weekday_of_month = {}
+        if flags & FLAG_NTH:
+            nth_weekday_of_month = _decode_nth(data[pos : pos + 8])
+            pos += 8
+        (length,) = struct.unpack_from('<H', data, pos)
+        pos += 2
+        expressions = data[pos : pos + length].decode('utf-8').split(' ')
+        pos += length
+        (length,) = struct.unpack_from('<H', data, pos)
+        hash_id = data[pos + 2 : pos + 2 + length] or None
+        pos += 2 + length
+        cur, start_time, dst_start_time = _STATE.unpack_from(data, pos)
+        pos += _STATE.size
+        kind = data[pos]
+        pos += 5 if kind == TZ_FIXED else 1
+        wall = data[pos] if pos < len(data) else 0
+        if tzinfo is missing:
+            if kind == TZ_NAIVE:
+                tzinfo = None
+            elif kind == TZ_UTC:
+                tzinfo = datetime.timezone.utc
+            elif kind == TZ_FIXED:
+                (offset,) = struct.unpack_from('<i', data, pos - 4)
+                tzinfo = datetime.timezone(datetime.timedelta(seconds=offset))
+            else:
+                raise ValueError('this schedule uses a tzinfo that must be passed in')
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise ValueError('truncated schedule encoding') from None
+
+    itr = cls.__new__(cls)
+    if ret_type is None:
+        ret_type = datetime.datetime if flags & FLAG_RET_DATETIME else float
+    itr._ret_type = ret_type
+    itr._day_or = bool(flags & FLAG_DAY_OR)
+    itr._implement_cron_bug = bool(flags & FLAG_IMPLEMENT_CRON_BUG)
+    itr.second_at_beginning = bool(flags & FLAG_SECOND_AT_BEGINNING)
+    itr._expand_from_start_time = bool(flags & FLAG_EXPAND_FROM_START_TIME)
+    itr._is_prev = bool(flags & FLAG_IS_PREV)
+    itr._max_years_btw_matches_explicitly_set = bool(flags & FLAG_MAX_YEARS_SET)
+    itr._max_years_between_matches = max_years
+    itr._wall_clock = bool(wall & WALL_CLOCK)
+    itr._dst_gap = 'skip' if wall & WALL_GAP_SKIP else 'shift'
+    itr._dst_fold = 'last' if wall & WALL_FOLD_LAST else 'first'
+    itr.tzinfo = tzinfo
+    itr.cur = cur
+    itr.start_time = start_time
+    itr.dst_start_time = dst_start_time
+    itr.expanded = expanded
+    itr.nth_weekday_of_month = nth_weekday_of_month
+    itr.expressions = expressions
+    itr._hash_id = hash_id
+    itr.fields = CRON_FIELDS[n_fields]
+    return itr
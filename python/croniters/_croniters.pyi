@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 from typing import Any, TypeAlias
 
 __version__: str
@@ -52,6 +53,49 @@ def is_leap(year: int) -> bool:
     """
     pass
 
+def timestamp_to_datetime(
+    timestamp: float, tzinfo: datetime.tzinfo | None = None
+) -> datetime.datetime:
+    """Convert a UNIX timestamp into a datetime.
+
+    Args:
+        timestamp: Seconds since the epoch, rounded to microseconds as by
+            `datetime.fromtimestamp`.
+        tzinfo: The timezone of the result; naive (UTC) when None.
+    """
+    pass
+
+def datetime_to_timestamp(d: datetime.datetime) -> float:
+    """Convert a datetime into a UNIX timestamp, naive datetimes being UTC."""
+    pass
+
+def datetime_to_seconds(d: datetime.datetime) -> int:
+    """Convert a datetime into whole seconds since the epoch, rounding down."""
+    pass
+
+class CronRandom:
+    """Seedable generator used to expand random (`R`) fields.
+
+    The stream for a given seed is stable across releases, so seeded
+    schedules can be replayed.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        pass
+
+    def seed(self, seed: int) -> None:
+        pass
+
+    def getstate(self) -> int:
+        pass
+
+    def setstate(self, state: int) -> None:
+        pass
+
+    def random(self) -> int:
+        """Return the next 32-bit value."""
+        pass
+
 class HashExpander:
     def __init__(self, cronit: Any) -> None:
         pass
@@ -63,6 +107,7 @@ class HashExpander:
         hash_id: bytes | None = None,
         range_end: int | None = None,
         range_begin: int | None = None,
+        rng: CronRandom | None = None,
     ) -> int:
         pass
 
@@ -78,6 +123,7 @@ class HashExpander:
         expr: str,
         hash_id: bytes | None = None,
         match: str | None = None,
+        rng: CronRandom | None = None,
         **kw: Any,
     ) -> str:
         pass
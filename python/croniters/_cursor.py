@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import _thread
+import datetime
+import weakref
+from operator import attrgetter
+from time import time
+
+from croniters import _BoundedCache, _count, croniter, datetime_to_timestamp
+
+# Parse results and options that a croniter keeps per instance, but which only
+# depend on the expression; a CronSchedule holds them once for all its cursors.
+SCHEDULE_ATTRIBUTES = (
+    '_day_or',
+    '_dst_fold',
+    '_dst_gap',
+    '_expand_from_start_time',
+    '_hash_id',
+    '_implement_cron_bug',
+    '_max_years_between_matches',
+    '_max_years_btw_matches_explicitly_set',
+    '_ret_type',
+    '_wall_clock',
+    'expanded',
+    'expressions',
+    'fields',
+    'nth_weekday_of_month',
+    'second_at_beginning',
+)
+# Options that tell apart schedules matching the same times, see
+# `CronSchedule.intern`; the others are part of `_codec.canonical`.
+INTERN_ATTRIBUTES = (
+    '_dst_fold',
+    '_dst_gap',
+    '_expand_from_start_time',
+    '_max_years_between_matches',
+    '_max_years_btw_matches_explicitly_set',
+    '_ret_type',
+    '_wall_clock',
+)
+# (class, canonical form, options) -> the shared CronSchedule
+INTERNED = weakref.WeakValueDictionary()
+_intern_lock = _thread.allocate_lock()
+
+
+class CronSchedule:
+    """A parsed cron expression, shared by any number of `CronCursor`s.
+
+    Takes the same arguments as `croniter`, except for `is_prev`, which is a
+    property of each cursor. `start_time` is only used to expand the
+    expression when `expand_from_start_time` is set.
+
+    Example:
+    >>> schedule = CronSchedule('*/5 9-17 * * mon-fri')
+    >>> cursors = [schedule.cursor(start) for start in start_times]
+    """
+
+    __slots__ = (
+        *SCHEDULE_ATTRIBUTES,
+        '__weakref__',
+        '_cache_options',
+        '_occurrences',
+    )
+
+    def __init__(
+        self,
+        expr_format: str,
+        start_time: float | datetime.datetime | None = None,
+        ret_type: type = float,
+        day_or: bool = True,
+        max_years_between_matches: int | None = None,
+        hash_id: bytes | str | None = None,
+        implement_cron_bug: bool = False,
+        second_at_beginning: bool | None = None,
+        expand_from_start_time: bool = False,
+        rng=None,
+        wall_clock: bool = False,
+        dst_gap: str = 'shift',
+        dst_fold: str = 'first',
+    ):
+        self._copy_from(
+            croniter(
+                expr_format,
+                start_time,
+                ret_type=ret_type,
+                day_or=day_or,
+                max_years_between_matches=max_years_between_matches,
+                hash_id=hash_id,
+                implement_cron_bug=implement_cron_bug,
+                second_at_beginning=second_at_beginning,
+                expand_from_start_time=expand_from_start_time,
+                rng=rng,
+                wall_clock=wall_clock,
+                dst_gap=dst_gap,
+                dst_fold=dst_fold,
+            )
+        )
+
+    @classmethod
+    def from_croniter(cls, itr: croniter) -> CronSchedule:
+        """Return a schedule sharing `itr`'s parsed expression and options."""
+        schedule = cls.__new__(cls)
+        schedule._copy_from(itr)
+        return schedule
+
+    @classmethod
+    def intern(cls, *args, **kwargs) -> CronSchedule:
+        """Return the schedule shared by everyone asking for an equivalent one.
+
+        Takes the arguments of `CronSchedule`. Expressions matching the same
+        times (see `fingerprint`) with the same options get the same object,
+        so that they share its occurrence cache too. Interned schedules are
+        weakly referenced, and dropped once no longer used.
+
+        Example:
+        >>> quarters = CronSchedule.intern('*/15 * * * *')
+        >>> quarters is CronSchedule.intern('0,15,30,45 * * * *')
+        True
+        """
+        from ._codec import canonical
+
+        schedule = cls(*args, **kwargs)
+        key = (
+            cls,
+            canonical(schedule),
+            tuple(getattr(schedule, name) for name in INTERN_ATTRIBUTES),
+        )
+        with _intern_lock:
+            shared = INTERNED.get(key)
+            if shared is None:
+                INTERNED[key] = shared = schedule
+        return shared
+
+    fingerprint = croniter.fingerprint
+
+    def _copy_from(self, itr: croniter) -> None:
+        for name in SCHEDULE_ATTRIBUTES:
+            setattr(self, name, getattr(itr, name))
+        self._occurrences = None
+        self._cache_options = None
+
+    def cursor(
+        self,
+        start_time: float | datetime.datetime | None = None,
+        is_prev: bool = False,
+    ) -> CronCursor:
+        """Return a new cursor over this schedule, positioned at `start_time`."""
+        return CronCursor(self, start_time, is_prev)
+
+    def enable_cache(self, size: int = 1024, chunk: int = 64) -> None:
+        """Answer `next_after` and `prev_before` from cached occurrences.
+
+        The schedule keeps, per timezone of the queried times, a sorted window
+        of up to `size` consecutive occurrences, computed `chunk` at a time.
+        Queries that fall inside the window are answered by bisection, which
+        suits callers asking for the next run after a slowly advancing `now`.
+        """
+        from ._occurrences import OccurrenceCache
+
+        OccurrenceCache(self, None, size, chunk)  # validate the options early
+        self._cache_options = (size, chunk)
+        self._occurrences = _BoundedCache(16)
+
+    def disable_cache(self) -> None:
+        self._occurrences = None
+        self._cache_options = None
+
+    def cache_stats(self) -> dict:
+        """Return the cache's hits, misses and number of cached occurrences."""
+        caches = list((self._occurrences or {}).values())
+        return {
+            'hits': sum(cache.hits for cache in caches),
+            'misses': sum(cache.misses for cache in caches),
+            'size': sum(len(cache.times) for cache in caches),
+        }
+
+    def next_after(
+        self, t: float | datetime.datetime, ret_type: type | None = None
+    ) -> float | datetime.datetime:
+        """Return the first occurrence after `t`, as `cursor(t).get_next()` does."""
+        return self._lookup(t, ret_type, False)
+
+    def prev_before(
+        self, t: float | datetime.datetime, ret_type: type | None = None
+    ) -> float | datetime.datetime:
+        """Return the last occurrence before `t`, as `cursor(t).get_prev()` does."""
+        return self._lookup(t, ret_type, True)
+
+    def _lookup(self, t, ret_type, is_prev):
+        caches = self._occurrences
+        if caches is None:
+            cursor = self.cursor(t)
+            return cursor.get_prev(ret_type) if is_prev else cursor.get_next(ret_type)
+        if isinstance(t, datetime.datetime):
+            tzinfo = t.tzinfo
+            t = datetime_to_timestamp(t)
+        else:
+            tzinfo = None
+        # keyed by identity, as tzinfos need not be hashable; the cache's
+        # cursor holds on to the tzinfo so that its id is not reused
+        cache = caches.get(id(tzinfo))
+        if cache is None or cache.tzinfo is not tzinfo:
+            from ._occurrences import OccurrenceCache
+
+            cache = OccurrenceCache(self, tzinfo, *self._cache_options)
+            caches[id(tzinfo)] = cache
+        found, hit = cache.prev_before(t) if is_prev else cache.next_after(t)
+        _count(
+            'occurrence_cache_hits' if hit else 'occurrence_cache_misses',
+            self.expressions,
+        )
+        ret_type = ret_type or self._ret_type
+        if issubclass(ret_type, datetime.datetime):
+            return cache.timestamp_to_datetime(found)
+        return found if issubclass(ret_type, int) else float(found)
+
+
+class CronCursor:
+    """A position on a shared `CronSchedule`.
+
+    A cursor has the iteration API of `croniter` (`get_next`, `get_prev`,
+    `get_current`, `set_current`, `all_next`, `all_prev` and the iterator
+    protocol) but only stores its position, direction and tzinfo, in slots.
+    The expanded fields and options are read from the schedule, so keeping
+    millions of cursors over a few schedules costs about a hundred bytes each
+    instead of a croniter's dict and per-instance copies of the fields.
+    """
+
+    __slots__ = (
+        '_day_plan',
+        '_is_prev',
+        '_wall_position',
+        'cur',
+        'dst_start_time',
+        'schedule',
+        'start_time',
+        'tzinfo',
+    )
+
+    def __init__(
+        self,
+        schedule: CronSchedule,
+        start_time: float | datetime.datetime | None = None,
+        is_prev: bool = False,
+    ):
+        self.schedule = schedule
+        self._is_prev = is_prev
+        self._day_plan = None
+        self._wall_position = None
+        self.tzinfo = None
+        self.start_time = None
+        self.dst_start_time = None
+        self.cur = None
+        if start_time is None:
+            start_time = time()
+        self.set_current(start_time, force=False)
+
+    # The search itself is croniter's: only where the state lives differs.
+    MONTHS_IN_YEAR = croniter.MONTHS_IN_YEAR
+    DAYS = croniter.DAYS
+
+    get_next = croniter.get_next
+    get_prev = croniter.get_prev
+    get_current = croniter.get_current
+    set_current = croniter.set_current
+    all_next = croniter.all_next
+    all_prev = croniter.all_prev
+    iter = croniter.iter
+    iter_chunks = croniter.iter_chunks
+    next_array = croniter.next_array
+    fingerprint = croniter.fingerprint
+    __iter__ = croniter.__iter__
+    __next__ = next = _get_next = croniter._get_next
+    _search_next = croniter._search_next
+    _search_day = croniter._search_day
+    _search_wall_clock = croniter._search_wall_clock
+    _adjust_dst = croniter._adjust_dst
+    _plan_day = croniter._plan_day
+    _current_plan = croniter._current_plan
+    _day_steps = croniter._day_steps
+    _calc = croniter._calc
+    timestamp_to_datetime = _timestamp_to_datetime = croniter.timestamp_to_datetime
+    datetime_to_timestamp = _datetime_to_timestamp = vars(croniter)[
+        'datetime_to_timestamp'
+    ]
+    _timedelta_to_seconds = vars(croniter)['timedelta_to_seconds']
+    _get_next_nearest_diff = vars(croniter)['_get_next_nearest_diff']
+    _get_prev_nearest_diff = vars(croniter)['_get_prev_nearest_diff']
+    _get_nth_weekday_of_month = vars(croniter)['_get_nth_weekday_of_month']
+
+
+for _name in SCHEDULE_ATTRIBUTES:
+    setattr(CronCursor, _name, property(attrgetter(f'schedule.{_name}')))
+del _name
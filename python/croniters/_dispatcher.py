@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from croniters import _next_or_none
+
+if TYPE_CHECKING:
+    from croniters import croniter
+
+# Wheel levels: seconds, minutes, hours, days. A job lands on the lowest level
+# whose horizon covers its delay, and cascades one level down each time the
+# cursor enters its slot. Delays beyond the day wheel wait in an overflow heap.
+SPANS = (1, 60, 3600, 86400)
+SLOTS = (60, 60, 24, 400)
+HORIZONS = tuple(span * slots for span, slots in zip(SPANS, SLOTS))
+
+
+class CronDispatcher:
+    """Hierarchical timing wheel of cron jobs, with 1 second resolution.
+
+    Adding, removing and rescheduling a job is O(1), independent of the number
+    of jobs; `advance` only visits the slots the cursor moves through, and
+    skips over empty stretches a whole wheel level at a time.
+
+    Each job is driven by a croniter: its next fire time is computed when it is
+    added and again every time it fires.
+
+    Example:
+    >>> dispatcher = CronDispatcher()
+    >>> dispatcher.add('report', croniter('0 * * * *'))
+    >>> dispatcher.add('cleanup', croniter('*/5 * * * *'))
+    >>> due = dispatcher.advance()  # keys due since the previous call
+
+    Occurrences that are already in the past when a job is added are coalesced
+    into a single fire on the next `advance`.
+    """
+
+    def __init__(self, now: float | None = None):
+        self._now = int(time.time() if now is None else now)
+        self._wheels = [[{} for _ in range(slots)] for slots in SLOTS]
+        self._sizes = [0] * len(SLOTS)
+        self._due: dict[Hashable, int] = {}
+        self._overflow: dict[Hashable, int] = {}
+        self._overflow_heap: list[tuple[int, Hashable]] = []
+        # key -> (croniter, fire time, slot dict holding the key, wheel level or -1)
+        self._jobs: dict[Hashable, tuple[croniter, int, dict, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    @property
+    def now(self) -> int:
+        """The dispatcher's cursor, in epoch seconds."""
+        return self._now
+
+    def next_fire(self, key: Hashable) -> int:
+        """Return the epoch second at which the job under `key` fires next."""
+        return self._jobs[key][1]
+
+    def add(self, key: Hashable, itr: croniter) -> None:
+        """Schedule `itr` under `key`, replacing any job already using that key."""
+        if key in self._jobs:
+            self.remove(key)
+        timestamp = _next_or_none(itr)
+        if timestamp is not None:
+            self._insert(key, itr, math.ceil(timestamp))
+
+    def remove(self, key: Hashable) -> None:
+        """Unschedule the job under `key`. Raises KeyError if there is none."""
+        _, _, slot, level = self._jobs.pop(key)
+        del slot[key]
+        if level >= 0:
+            self._sizes[level] -= 1
+        # Overflow heap entries are dropped lazily, once their key is gone.
+
+    def reschedule(self, key: Hashable, itr: croniter) -> None:
+        """Move an existing job onto a new schedule. Raises KeyError if there is none."""
+        self.remove(key)
+        self.add(key, itr)
+
+    def _insert(self, key: Hashable, itr: croniter, timestamp: int) -> None:
+        delay = timestamp - self._now
+        level = -1
+        if delay <= 0:
+            slot = self._due
+        else:
+            for level, horizon in enumerate(HORIZONS):
+                if delay < horizon:
+                    slot = self._wheels[level][
+                        (timestamp // SPANS[level]) % SLOTS[level]
+                    ]
+                    self._sizes[level] += 1
+                    break
+            else:
+                level = -1
+                slot = self._overflow
+                heapq.heappush(self._overflow_heap, (timestamp, key))
+        slot[key] = timestamp
+        self._jobs[key] = (itr, timestamp, slot, level)
+
+    def _fire(self, key: Hashable, due: list) -> None:
+        due.append(key)
+        itr = self._jobs[key][0]
+        timestamp = _next_or_none(itr)
+        if timestamp is not None and timestamp <= self._now:
+            # coalesce a backlog of missed occurrences into the fire just made
+            itr.set_current(self._now, force=True)
+            timestamp = _next_or_none(itr)
+        if timestamp is None:
+            del self._jobs[key]
+        else:
+            self._insert(key, itr, math.ceil(timestamp))
+
+    def _cascade(self, level: int) -> None:
+        index = (self._now // SPANS[level]) % SLOTS[level]
+        slot = self._wheels[level][index]
+        if not slot:
+            return
+        self._wheels[level][index] = {}
+        self._sizes[level] -= len(slot)
+        for key, timestamp in slot.items():
+            self._insert(key, self._jobs[key][0], timestamp)
+
+    def _pull_overflow(self) -> None:
+        heap = self._overflow_heap
+        while heap and heap[0][0] - self._now < HORIZONS[-1]:
+            timestamp, key = heapq.heappop(heap)
+            if self._overflow.get(key) == timestamp:
+                del self._overflow[key]
+                self._insert(key, self._jobs[key][0], timestamp)
+
+    def _skip_to(self, now: int) -> int:
+        """Return the last second before the next wheel event, capped at `now`."""
+        if self._sizes[0]:
+            return self._now
+        for level in range(1, len(SLOTS)):
+            if self._sizes[level]:
+                span = SPANS[level]
+                break
+        else:
+            if not self._overflow:
+                return now
+            span = SPANS[-1]
+        return min(now, (self._now // span + 1) * span - 1)
+
+    def advance(self, now: float | None = None) -> list[Hashable]:
+        """Move the cursor to `now` and return the keys of every job due meanwhile.
+
+        Keys are returned in fire order; a job that fires several times within
+        the interval appears once per fire.
+        """
+        now = int(time.time() if now is None else now)
+        due: list[Hashable] = []
+        for key in list(self._due):
+            del self._due[key]
+            self._fire(key, due)
+        while self._now < now:
+            self._now = self._skip_to(now)
+            if self._now >= now:
+                break
+            self._now += 1
+            if self._now % SPANS[3] == 0:
+                self._pull_overflow()
+                self._cascade(3)
+            if self._now % SPANS[2] == 0:
+                self._cascade(2)
+            if self._now % SPANS[1] == 0:
+                self._cascade(1)
+            slot = self._wheels[0][self._now % SLOTS[0]]
+            if slot:
+                self._wheels[0][self._now % SLOTS[0]] = {}
+                self._sizes[0] -= len(slot)
+                for key in slot:
+                    self._fire(key, due)
+            # jobs cascaded straight onto the current second
+            for key in list(self._due):
+                del self._due[key]
+                self._fire(key, due)
+        return due
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import datetime
+import sys
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Union
+
+from croniters import croniter_range
+
+TimeBound = Union[datetime.datetime, float, int]
+
+
+class Horizon:
+    """Occurrences of many cron expressions, packed as int64 epoch seconds.
+
+    The occurrences of ``expr_formats[i]`` are
+    ``timestamps[offsets[i]:offsets[i + 1]]``, in ascending order (or
+    descending if ``start > end``).
+    """
+
+    __slots__ = ('expr_formats', 'offsets', 'timestamps')
+
+    def __init__(self, expr_formats: Sequence[str], offsets: array, timestamps: array):
+        self.expr_formats = list(expr_formats)
+        self.offsets = offsets
+        self.timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self.expr_formats)
+
+    def __getitem__(self, index: int) -> array:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('horizon index out of range')
+        return self.timestamps[self.offsets[index] : self.offsets[index + 1]]
+
+    def datetimes(
+        self, index: int, tzinfo: datetime.tzinfo | None = None
+    ) -> list[datetime.datetime]:
+        """Return the occurrences of one expression as datetimes.
+
+        Naive UTC datetimes are returned unless ``tzinfo`` is given.
+        """
+        utc = datetime.timezone.utc
+        result = [datetime.datetime.fromtimestamp(t, utc) for t in self[index]]
+        if tzinfo is None:
+            return [dt.replace(tzinfo=None) for dt in result]
+        return [dt.astimezone(tzinfo) for dt in result]
+
+
+def _occurrences(
+    expr_formats: Sequence[str],
+    start: TimeBound,
+    end: TimeBound,
+    options: dict[str, Any],
+) -> tuple[array, array]:
+    """Return per-expression counts and the concatenated epoch seconds."""
+    counts = array('q')
+    timestamps = array('q')
+    for expr_format in expr_formats:
+        before = len(timestamps)
+        for chunk in croniter_range(
+            start, end, expr_format, ret_type=int, chunk_size=4096, **options
+        ):
+            timestamps.extend(chunk)
+        counts.append(len(timestamps) - before)
+    return counts, timestamps
+
+
+def _create_block(size: int) -> shared_memory.SharedMemory:
+    """Create a shared-memory block that this process will not unlink itself.
+
+    The parent unlinks every block once copied; if the worker's resource tracker
+    also tracked it, it would warn about a leak and unlink it a second time.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def _horizon_shard(
+    expr_formats: Sequence[str],
+    start: TimeBound,
+    end: TimeBound,
+    options: dict[str, Any],
+) -> tuple[str, array]:
+    """Process-pool entry point: publish a shard's occurrences in shared memory.
+
+    The parent owns the returned block and unlinks it once copied.
+    """
+    counts, timestamps = _occurrences(expr_formats, start, end, options)
+    n_bytes = timestamps.itemsize * len(timestamps)
+    shm = _create_block(max(n_bytes, 1))
+    try:
+        shm.buf[:n_bytes] = memoryview(timestamps).cast('B')
+    finally:
+        shm.close()
+    return shm.name, counts
+
+
+def schedule_horizon(
+    expr_formats: Sequence[str],
+    start: TimeBound,
+    end: TimeBound,
+    workers: int = 1,
+    day_or: bool = True,
+    exclude_ends: bool = False,
+    second_at_beginning: bool = False,
+    hash_id: bytes | str | None = None,
+) -> Horizon:
+    """Materialize every occurrence of many expressions between two times.
+
+    Each expression is evaluated with `croniter_range` semantics (`start` and
+    `end` are inclusive unless `exclude_ends`). With ``workers > 1`` the
+    expressions are sharded across a process pool, and each worker hands its
+    results back as a shared-memory block of int64 epoch seconds instead of
+    pickled lists of datetimes. ``hash_id`` seeds the ``H`` fields of every
+    expression, as for `croniter`.
+
+    Example:
+    >>> horizon = schedule_horizon(exprs, now, now + timedelta(days=7), workers=8)
+    >>> horizon[0]  # array('q', [...]) of epoch seconds for exprs[0]
+    """
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+    expr_formats = list(expr_formats)
+    options = {
+        'day_or': day_or,
+        'exclude_ends': exclude_ends,
+        'second_at_beginning': second_at_beginning,
+        'hash_id': hash_id,
+    }
+
+    if workers == 1 or len(expr_formats) <= 1:
+        counts, timestamps = _occurrences(expr_formats, start, end, options)
+    else:
+        n_shards = min(len(expr_formats), workers * 4)
+        size, extra = divmod(len(expr_formats), n_shards)
+        bounds = [0]
+        for i in range(n_shards):
+            bounds.append(bounds[-1] + size + (i < extra))
+        shards = [expr_formats[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_horizon_shard, shard, start, end, options)
+                for shard in shards
+            ]
+        # Leaving the pool waited for every shard, so each block that was created
+        # is known here and gets unlinked, even if another shard failed.
+        error, results = None, []
+        for future in futures:
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+            elif error is None:
+                error = exc
+
+        counts, timestamps = array('q'), array('q')
+        for name, shard_counts in results:
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                if error is None:
+                    n_bytes = timestamps.itemsize * sum(shard_counts)
+                    timestamps.frombytes(shm.buf[:n_bytes])
+                    counts.extend(shard_counts)
+            finally:
+                shm.close()
+                shm.unlink()
+        if error is not None:
+            raise error
+
+    offsets = array('q', [0])
+    for count in counts:
+        offsets.append(offsets[-1] + count)
+    return Horizon(expr_formats, offsets, timestamps)
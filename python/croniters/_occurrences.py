@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import _thread
+import math
+from bisect import bisect_left, bisect_right
+
+from croniters import CroniterBadDateError, _fixed_offset, _transition_table
+from croniters._tztable import probed_table
+
+# how far from a UTC offset change a cursor's answers may depend on its start
+_CHANGE_MARGIN = 86400
+
+
+class OccurrenceCache:
+    """A sliding window of consecutive occurrences of a schedule, in one timezone.
+
+    `times` holds, as sorted timestamps, every occurrence between its first
+    and last item. There is no occurrence between `low` and `times[0]`, nor
+    between `times[-1]` and `high`, so `next_after(t)` is answered by
+    bisection for `low <= t < times[-1]`, and `prev_before(t)` for
+    `times[0] < t <= high`. A query just past either end extends the window
+    by `chunk` occurrences at a time, dropping the far end beyond `size`; a
+    query further away starts a new window there.
+
+    Around a DST change, a cursor's next or previous occurrence depends on
+    where it starts, so the window stays within the `period` of constant UTC
+    offset it was started in, less a day at either end. `low` or `high`
+    reaching an end of the period means the occurrences beyond are outside
+    it, and queries for them, as for times near the change, are answered by
+    a cursor without being cached.
+    """
+
+    __slots__ = (
+        '_cursor',
+        '_lock',
+        '_table',
+        'chunk',
+        'high',
+        'hits',
+        'low',
+        'misses',
+        'period',
+        'size',
+        'times',
+    )
+
+    def __init__(self, schedule, tzinfo, size: int, chunk: int):
+        if size < 2 * chunk or chunk < 1:
+            raise ValueError('the cache size must be at least twice the chunk size')
+        self._cursor = schedule.cursor(0.0)
+        self._cursor.tzinfo = tzinfo
+        self._lock = _thread.allocate_lock()
+        self.size = size
+        self.chunk = chunk
+        self.times: list[int] = []
+        self.low = self.high = 0.0
+        self.period = (-math.inf, math.inf)
+        self.hits = self.misses = 0
+        self._table = None
+        if not _fixed_offset(tzinfo):
+            self._table = _transition_table(tzinfo) or probed_table(tzinfo)
+
+    def _walk(self, start: float, is_prev: bool) -> list[int]:
+        """Up to `chunk` occurrences strictly after (or before) `start`."""
+        cursor = self._cursor
+        cursor.set_current(start, force=True)
+        step = cursor.get_prev if is_prev else cursor.get_next
+        found = []
+        try:
+            for _ in range(self.chunk):
+                found.append(step(int))
+        except CroniterBadDateError:
+            if not found:
+                raise
+        return found
+
+    def _period(self, t: float) -> tuple[float, float] | None:
+        """The `(start, stop)` of constant UTC offset around `t`, if known and
+        `t` is not within a day of its ends.
+        """
+        if self._table is None:
+            return -math.inf, math.inf
+        period = self._table.period(t)
+        if period is None:
+            return None
+        start, stop = period[0] + _CHANGE_MARGIN, period[1] - _CHANGE_MARGIN
+        return (start, stop) if start <= t < stop else None
+
+    def next_after(self, t: float) -> tuple[int, bool]:
+        """Return the first occurrence after `t`, and whether it was cached."""
+        with self._lock:
+            times = self.times
+            start, stop = self.period
+            if times and self.low <= t < stop:
+                i = bisect_right(times, t)
+                if i < len(times):
+                    self.hits += 1
+                    return times[i], True
+                if self.high < stop and t - times[-1] <= times[-1] - times[0]:
+                    self.misses += 1
+                    while times[-1] <= t and self.high < stop:
+                        found = self._walk(times[-1], False)
+                        kept = [x for x in found if x < stop]
+                        times.extend(kept)
+                        self.high = (
+                            stop
+                            if len(kept) < len(found)
+                            else max(self.high, times[-1])
+                        )
+                    i = bisect_right(times, t)
+                    drop = min(len(times) - self.size, i)
+                    if drop > 0:
+                        self.low = times[drop - 1]
+                        del times[:drop]
+                        i -= drop
+                    if i < len(times):
+                        return times[i], False
+                    # past the period: not cached
+                    return self._walk(t, False)[0], False
+            self.misses += 1
+            found = self._walk(t, False)
+            period = self._period(t)
+            if period is None or found[0] >= period[1]:
+                return found[0], False
+            kept = [x for x in found if x < period[1]]
+            self.times = kept
+            self.period = period
+            self.low = t
+            self.high = period[1] if len(kept) < len(found) else kept[-1]
+            return kept[0], False
+
+    def prev_before(self, t: float) -> tuple[int, bool]:
+        """Return the last occurrence before `t`, and whether it was cached."""
+        with self._lock:
+            times = self.times
+            start, stop = self.period
+            if times and start <= t <= self.high and t < stop:
+                i = bisect_left(times, t)
+                if i > 0:
+                    self.hits += 1
+                    return times[i - 1], True
+                if self.low > start and times[0] - t <= times[-1] - times[0]:
+                    self.misses += 1
+                    while times[0] >= t and self.low > start:
+                        found = self._walk(times[0], True)
+                        kept = [x for x in found if x >= start]
+                        times[:0] = reversed(kept)
+                        self.low = (
+                            start if len(kept) < len(found) else min(self.low, times[0])
+                        )
+                    i = bisect_left(times, t)
+                    drop = min(len(times) - self.size, len(times) - i)
+                    if drop > 0:
+                        self.high = times[-drop]
+                        del times[-drop:]
+                    if i > 0:
+                        return times[i - 1], False
+                    return self._walk(t, True)[0], False
+            self.misses += 1
+            found = self._walk(t, True)
+            period = self._period(t)
+            if period is None or found[0] < period[0]:
+                return found[0], False
+            kept = [x for x in found if x >= period[0]]
+            kept.reverse()
+            self.times = kept
+            self.period = period
+            self.low = period[0] if len(kept) < len(found) else kept[0]
+            self.high = t
+            return kept[-1], False
+
+    @property
+    def tzinfo(self):
+        return self._cursor.tzinfo
+
+    def timestamp_to_datetime(self, timestamp: float):
+        return self._cursor.timestamp_to_datetime(timestamp)
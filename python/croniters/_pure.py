@@ -0,0 +1,320 @@
+"""Pure-Python mirror of the `_croniters` extension.
+
+PyPy runs pyo3 extensions through its cpyext emulation layer, where every
+call into the extension costs far more than the work it does, and the JIT
+cannot trace through it. The search loop calls `is_leap` on every pass and
+`_expand` builds a `HashExpander` per field, so on PyPy `croniters` selects
+this module instead (see `PURE_PYTHON` in the package). The names, signatures
+and results match the extension exactly, including the `CronRandom` stream
+for a given seed.
+"""
+
+from __future__ import annotations
+
+import _thread
+import datetime
+import sys
+
+try:
+    from ._croniters import __version__
+except ImportError:  # running from a source tree without the compiled extension
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        __version__ = version('croniters')
+    except PackageNotFoundError:
+        __version__ = '0+unknown'
+
+MINUTE_FIELD = 0
+HOUR_FIELD = 1
+DAY_FIELD = 2
+MONTH_FIELD = 3
+DOW_FIELD = 4
+SECOND_FIELD = 5
+YEAR_FIELD = 6
+
+M_ALPHAS = {
+    'jan': 1,
+    'feb': 2,
+    'mar': 3,
+    'apr': 4,
+    'may': 5,
+    'jun': 6,
+    'jul': 7,
+    'aug': 8,
+    'sep': 9,
+    'oct': 10,
+    'nov': 11,
+    'dec': 12,
+}
+DOW_ALPHAS = {'sun': 0, 'mon': 1, 'tue': 2, 'wed': 3, 'thu': 4, 'fri': 5, 'sat': 6}
+
+WEEKDAYS = '|'.join(DOW_ALPHAS)
+MONTHS = '|'.join(M_ALPHAS)
+
+UNIX_FIELDS = [MINUTE_FIELD, HOUR_FIELD, DAY_FIELD, MONTH_FIELD, DOW_FIELD]
+SECOND_FIELDS = [*UNIX_FIELDS, SECOND_FIELD]
+YEAR_FIELDS = [*SECOND_FIELDS, YEAR_FIELD]
+
+DAYS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+RANGES = [
+    (0, 59),  # minutes
+    (0, 23),  # hours
+    (1, 31),  # days
+    (1, 12),  # months
+    (0, 6),  # weekdays
+    (0, 59),  # seconds
+    (1970, 2099),  # years
+]
+
+CRON_FIELDS = {
+    'unix': UNIX_FIELDS,
+    'second': SECOND_FIELDS,
+    'year': YEAR_FIELDS,
+    len(UNIX_FIELDS): UNIX_FIELDS,
+    len(SECOND_FIELDS): SECOND_FIELDS,
+    len(YEAR_FIELDS): YEAR_FIELDS,
+}
+
+UNIX_CRON_LEN = len(UNIX_FIELDS)
+SECOND_CRON_LEN = len(SECOND_FIELDS)
+YEAR_CRON_LEN = len(YEAR_FIELDS)
+
+VALID_LEN_EXPRESSION = {key for key in CRON_FIELDS if isinstance(key, int)}
+
+LEN_MEANS_ALL = [
+    60,  # minutes
+    24,  # hours
+    31,  # days
+    12,  # months
+    7,  # weekdays
+    60,  # seconds
+    130,  # years
+]
+
+
+def is_32bit() -> bool:
+    """Detect if Python is running in 32-bit mode.
+
+    see https://github.com/python/cpython/issues/101069 for details
+
+    Returns:
+        True if running on 32-bit Python, False for 64-bit.
+    """
+    return sys.maxsize <= 0xFFFF_FFFF
+
+
+def is_leap(year: int) -> bool:
+    """Check if a year is a leap year.
+
+    Args:
+        year: The year to check.
+    """
+    return year % 400 == 0 or (year % 4 == 0 and year % 100 != 0)
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def timestamp_to_datetime(
+    timestamp: float, tzinfo: datetime.tzinfo | None = None
+) -> datetime.datetime:
+    """Convert a UNIX timestamp into a datetime.
+
+    Args:
+        timestamp: Seconds since the epoch, rounded to microseconds as by
+            `datetime.fromtimestamp`.
+        tzinfo: The timezone of the result; naive (UTC) when None.
+    """
+    result = _EPOCH + datetime.timedelta(seconds=timestamp)
+    if tzinfo is None:
+        return result
+    # what `astimezone` does from UTC
+    return tzinfo.fromutc(result.replace(tzinfo=tzinfo))
+
+
+def _epoch_delta(d: datetime.datetime) -> datetime.timedelta:
+    if d.tzinfo is not None and (offset := d.utcoffset()) is not None:
+        d = d.replace(tzinfo=None) - offset
+    return d - _EPOCH
+
+
+def datetime_to_timestamp(d: datetime.datetime) -> float:
+    """Convert a datetime into a UNIX timestamp, naive datetimes being UTC."""
+    td = _epoch_delta(d)
+    return (td.microseconds + (td.seconds + td.days * 86400) * 10**6) / 10**6
+
+
+def datetime_to_seconds(d: datetime.datetime) -> int:
+    """Convert a datetime into whole seconds since the epoch, rounding down."""
+    td = _epoch_delta(d)
+    return td.days * 86400 + td.seconds
+
+
+# SplitMix64, spelled out as in the extension so that seeded streams match.
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix64(z: int) -> int:
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _check_u64(value: int) -> int:
+    if not 0 <= value <= _MASK64:
+        raise OverflowError('out of range integral type conversion attempted')
+    return value
+
+
+class CronRandom:
+    """Seedable generator used to expand random (`R`) fields.
+
+    The stream for a given seed is stable across releases, so seeded
+    schedules can be replayed.
+    """
+
+    __slots__ = ('_lock', '_state')
+
+    def __init__(self, seed: int | None = None) -> None:
+        if seed is None:
+            import random
+
+            seed = random.getrandbits(64)
+        self._state = _check_u64(seed)
+        self._lock = _thread.allocate_lock()
+
+    def seed(self, seed: int) -> None:
+        self._state = _check_u64(seed)
+
+    def getstate(self) -> int:
+        return self._state
+
+    def setstate(self, state: int) -> None:
+        self._state = _check_u64(state)
+
+    def next_u32(self) -> int:
+        with self._lock:
+            self._state = state = (self._state + _GOLDEN_GAMMA) & _MASK64
+        return _mix64(state) >> 32
+
+    def random(self) -> int:
+        """Return the next 32-bit value."""
+        return self.next_u32()
+
+    def __reduce__(self):
+        return type(self), (self._state,)
+
+
+_hash_expression_re = None
+
+
+def _get_hash_expression_re():
+    global _hash_expression_re
+    if _hash_expression_re is None:
+        import re
+
+        _hash_expression_re = re.compile(
+            r'^(?P<hash_type>[HhRr])\((?P<range_begin>\d+)-(?P<range_end>\d+)\)'
+            r'(?:/(?P<divisor>\d+))?$|^(?P<hash_type2>[HhRr])(?:/(?P<divisor2>\d+))?$'
+        )
+    return _hash_expression_re
+
+
+def _hashed_value(
+    idx: int,
+    hash_type: str | None,
+    hash_id: bytes | None,
+    range_end: int | None,
+    range_begin: int | None,
+    rng: CronRandom | None,
+) -> int:
+    if range_end is None:
+        range_end = RANGES[idx][1]
+    if range_begin is None:
+        range_begin = RANGES[idx][0]
+    if hash_type == 'r':
+        if rng is not None:
+            crc = rng.next_u32()
+        else:
+            import random
+
+            crc = random.getrandbits(32)
+    else:
+        from zlib import crc32
+
+        crc = crc32(hash_id or b'')
+    return ((crc >> idx) % (range_end - range_begin + 1)) + range_begin
+
+
+class HashExpander:
+    __slots__ = ('cron',)
+
+    def __init__(self, cronit: object) -> None:
+        self.cron = cronit
+
+    def do_(
+        self,
+        idx: int,
+        hash_type: str | None = None,
+        hash_id: bytes | None = None,
+        range_end: int | None = None,
+        range_begin: int | None = None,
+        rng: CronRandom | None = None,
+    ) -> int:
+        return _hashed_value(idx, hash_type, hash_id, range_end, range_begin, rng)
+
+    def match_(
+        self,
+        efl: object,
+        idx: int,
+        expr: str,
+        hash_id: bytes | None = None,
+        **kw: object,
+    ) -> bool:
+        return _get_hash_expression_re().match(expr) is not None
+
+    def expand(
+        self,
+        efl: object,
+        idx: int,
+        expr: str,
+        hash_id: bytes | None = None,
+        match_: bool | None = None,
+        rng: CronRandom | None = None,
+        **kw: object,
+    ) -> str:
+        # cheap rejection of the common case, before the regular expression
+        if match_ is None and expr[:1] not in ('H', 'h', 'R', 'r'):
+            return expr
+        m = _get_hash_expression_re().match(expr)
+        if not (m is not None if match_ is None else match_):
+            return expr
+        if m is None:
+            raise ValueError('Failed to capture regex groups')
+
+        hash_type = (m['hash_type'] or m['hash_type2']).lower()
+        if hash_type == 'h' and hash_id is None:
+            raise ValueError('Hashed definitions must include hash_id')
+
+        if m['range_begin'] is not None:
+            begin, end = int(m['range_begin']), int(m['range_end'])
+            if begin >= end:
+                raise ValueError('Range end must be greater than range begin')
+            if m['divisor'] is None:
+                return str(_hashed_value(idx, hash_type, hash_id, end, begin, rng))
+            divisor = int(m['divisor'])
+        elif m['divisor2'] is not None:
+            (begin, end), divisor = RANGES[idx], int(m['divisor2'])
+        else:
+            return str(_hashed_value(idx, hash_type, hash_id, None, None, rng))
+
+        if divisor == 0:
+            raise ValueError(f'Bad expression: {expr}')
+        value = _hashed_value(idx, hash_type, hash_id, divisor - 1 + begin, begin, rng)
+        return f'{value}-{end}/{divisor}'
+
+
+EXPANDERS = {'hash': HashExpander}
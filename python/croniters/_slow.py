@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import datetime
+import time
+from typing import Any, Callable, NamedTuple
+
+
+class SlowComputation(NamedTuple):
+    """A date search that exceeded the thresholds given to `set_slow_hook`."""
+
+    # the normalized expression, as in `croniter.expressions`
+    expression: str
+    hash_id: bytes | None
+    # the timestamp the search started from
+    start_time: float
+    is_prev: bool
+    # wall-clock duration of the search, in seconds
+    elapsed: float
+    # passes of the search loop, over all `_calc` runs of the step
+    iterations: int
+
+
+class SlowWatch:
+    """Times each search step and reports the slow ones to a callback."""
+
+    __slots__ = ('callback', 'iterations', 'seconds')
+
+    def __init__(
+        self,
+        callback: Callable[[SlowComputation], Any],
+        seconds: float | None,
+        iterations: int | None,
+    ):
+        self.callback = callback
+        self.seconds = seconds
+        self.iterations = iterations
+
+    def run(self, itr, ret_type, start_time, is_prev, update_current):
+        if start_time is None:
+            origin = itr.cur
+        elif isinstance(start_time, datetime.datetime):
+            origin = itr.datetime_to_timestamp(start_time)
+        else:
+            origin = start_time
+        direction = itr._is_prev if is_prev is None else is_prev
+        passes = [0]
+        started = time.perf_counter()
+        try:
+            return itr._search_next(
+                ret_type, start_time, is_prev, update_current, passes
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            if (self.seconds is not None and elapsed >= self.seconds) or (
+                self.iterations is not None and passes[0] >= self.iterations
+            ):
+                self.callback(
+                    SlowComputation(
+                        ' '.join(itr.expressions),
+                        itr._hash_id,
+                        origin,
+                        bool(direction),
+                        elapsed,
+                        passes[0],
+                    )
+                )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import _thread
+from collections import Counter
+from collections.abc import Callable, Sequence
+
+# Counter names, for reference:
+#   calc_calls               searches run by `_calc`
+#   calc_iterations          passes of the search's outer loop
+#   restarts.<field>         loop restarts triggered by each field's step
+#                            (year, month, day_of_month, day_of_week, ...),
+#                            and `restarts.month_index` for jumps over months
+#                            with no matching day
+#   relativedelta_ops        relativedelta steps applied to the candidate date
+#   dom_dow_passes           day-of-month/day-of-week union searches (two
+#                            `_calc` runs each)
+#   dst_adjustments          results shifted to compensate a DST change
+#   intraday_steps           results taken from the times of the current day,
+#                            without a search
+#   timestamp_cache_hits     `timestamp_to_datetime` cache hits
+#   timestamp_cache_misses   `timestamp_to_datetime` cache misses
+#   occurrence_cache_hits    `CronSchedule.next_after`/`prev_before` answered
+#                            from the schedule's occurrence cache
+#   occurrence_cache_misses  ... and those that had to search
+
+
+class SearchStats:
+    """Counters of the date search, per process and optionally per expression.
+
+    Expressions are keyed by their normalized fields, as in `croniter.expressions`.
+    """
+
+    __slots__ = ('_lock', 'by_expression', 'per_expression', 'totals')
+
+    def __init__(self, per_expression: bool = False):
+        self.per_expression = per_expression
+        self.totals: Counter[str] = Counter()
+        self.by_expression: dict[str, Counter[str]] = {}
+        self._lock = _thread.allocate_lock()
+
+    def add(self, key: str, expressions: Sequence[str], n: int = 1) -> None:
+        with self._lock:
+            self.totals[key] += n
+            if self.per_expression:
+                expression = ' '.join(expressions)
+                try:
+                    counts = self.by_expression[expression]
+                except KeyError:
+                    counts = self.by_expression[expression] = Counter()
+                counts[key] += n
+
+    def counting(self, factory: Callable, key: str, expressions: Sequence[str]):
+        """Wrap `factory` so that every call is counted under `key`."""
+
+        def counted(*args, **kwargs):
+            self.add(key, expressions)
+            return factory(*args, **kwargs)
+
+        return counted
+
+    def snapshot(self, by_expression: bool = False) -> dict:
+        with self._lock:
+            if by_expression:
+                return {
+                    expression: dict(counts)
+                    for expression, counts in self.by_expression.items()
+                }
+            return dict(self.totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals.clear()
+            self.by_expression.clear()
@@ -0,0 +1,206 @@
+"""UTC offset transitions of timezones with DST, for the date search.
+
+The search converts candidates between timestamps and local datetimes, and
+compares the UTC offsets of its start and result to handle DST changes. With
+pytz or zoneinfo, each of those conversions goes through the zone's
+`fromutc`. A `TransitionTable` holds the instants at which a zone changes its
+UTC offset, so that the offset at a timestamp is a bisection over ints and the
+local datetime is built from it directly. Tables are built once per tzinfo
+(see `croniters._transition_table`) and shared by every schedule using it.
+"""
+
+from __future__ import annotations
+
+import _thread
+import datetime
+from bisect import bisect_right
+
+from croniters import _datetime_to_seconds, _timestamp_to_datetime
+
+# UTC years over which zones without a transition list of their own (zoneinfo)
+# are scanned, see `croniters.set_transition_horizon`
+HORIZON = (1970, 2100)
+# such zones are probed weekly, and each offset change found is then narrowed
+# down to the second
+_PROBE_STEP = 7 * 86400
+# scans start this long before the span they cover, so that the fold of a
+# clock change just before it is known
+_SCAN_MARGIN = 2 * 86400
+
+_PYTZ_DST_CLASS = 'pytz.tzinfo.DstTzInfo'
+_ZONEINFO_CLASS = 'zoneinfo.ZoneInfo'
+
+
+def _seconds(delta):
+    return delta.days * 86400 + delta.seconds
+
+
+def _year_start(year):
+    return _datetime_to_seconds(datetime.datetime(year, 1, 1))
+
+
+class TransitionTable:
+    """The UTC offsets of a timezone, by the UTC instant they start at.
+
+    The covered span is `low <= t < high`. In it, `times[i]` is the first
+    second at `offsets[i]` (in seconds), which lasts until `times[i + 1]`,
+    and local datetimes carry `tzinfos[i]` (the zone itself when `tzinfos`
+    is None). Results before `folds[i]` repeat the wall-clock times just
+    before `times[i]`, and get `fold=1`.
+
+    Tables of probed zones start empty, and grow to the UTC year of each
+    timestamp looked up within `limits`. The span and its lists are swapped
+    in as one tuple, so lookups need no lock.
+    """
+
+    __slots__ = ('_lock', '_span', 'limits', 'tzinfo')
+
+    def __init__(self, tzinfo, span=None, limits=None):
+        self.tzinfo = tzinfo
+        # (low, high, times, offsets, tzinfos, folds)
+        self._span = span
+        self.limits = limits
+        self._lock = _thread.allocate_lock()
+
+    def _covering(self, t):
+        span = self._span
+        if span is not None and span[0] <= t < span[1]:
+            return span
+        limits = self.limits
+        if limits is None or not limits[0] <= t < limits[1]:
+            return None
+        with self._lock:
+            span = self._span  # another thread may have extended it meanwhile
+            if span is None or not span[0] <= t < span[1]:
+                self._span = span = self._extended(span, t)
+        return span
+
+    def _offset_at(self, t):
+        return _seconds(_timestamp_to_datetime(t, self.tzinfo).utcoffset())
+
+    def _scan(self, t, stop, times, offsets, folds):
+        """Append the offset changes in `t < ... <= stop`, the offset at `t`
+        being `offsets[-1]`.
+        """
+        offset_at = self._offset_at
+        while t < stop:
+            probe = min(t + _PROBE_STEP, stop)
+            if offset_at(probe) == offsets[-1]:
+                t = probe
+                continue
+            # bisect for the first second at another offset; probing goes on
+            # from there, so that several changes within a step are all found
+            before, after = t, probe
+            while after - before > 1:
+                middle = (before + after) // 2
+                if offset_at(middle) == offsets[-1]:
+                    before = middle
+                else:
+                    after = middle
+            offset = offset_at(after)
+            # moving the clocks back repeats the wall-clock times it skips over
+            folds.append(after + max(offsets[-1] - offset, 0))
+            times.append(after)
+            offsets.append(offset)
+            t = after
+
+    def _extended(self, span, t):
+        """Return `span` grown to the UTC years up to the one holding `t`."""
+        year = _timestamp_to_datetime(t).year
+        low = max(_year_start(year), self.limits[0])
+        high = min(_year_start(year + 1), self.limits[1])
+        start = low - _SCAN_MARGIN
+        times, offsets, folds = [start], [self._offset_at(start)], [start]
+        if span is None:
+            self._scan(start, high - 1, times, offsets, folds)
+            return (low, high, times, offsets, None, folds)
+        old_low, old_high, old_times, old_offsets, _, old_folds = span
+        if t < old_low:
+            # scan up to where the previous scan started, included, which then
+            # starts no new offset
+            self._scan(start, old_times[0], times, offsets, folds)
+            times += old_times[1:]
+            offsets += old_offsets[1:]
+            folds += old_folds[1:]
+            return (low, old_high, times, offsets, None, folds)
+        times, offsets, folds = old_times[:], old_offsets[:], old_folds[:]
+        self._scan(old_high - 1, high - 1, times, offsets, folds)
+        return (old_low, high, times, offsets, None, folds)
+
+    def utcoffset(self, t):
+        """Return the UTC offset at `t`, in seconds, or None if uncovered."""
+        span = self._covering(t)
+        if span is None:
+            return None
+        return span[3][bisect_right(span[2], t) - 1]
+
+    def same_offset(self, start, stop):
+        """Whether the offset does not change from `start` to `stop` included.
+
+        None when either end is not covered.
+        """
+        if self._covering(start) is None or self._covering(stop) is None:
+            return None
+        times = self._span[2]  # covering both ends by now
+        return bisect_right(times, start) == bisect_right(times, stop)
+
+    def period(self, t):
+        """Return the `(start, stop)` around `t` over which the UTC offset does
+        not change, or None if `t` is not covered.
+
+        Either end may be that of the covered span instead of an offset change.
+        """
+        span = self._covering(t)
+        if span is None:
+            return None
+        times = span[2]
+        i = bisect_right(times, t)
+        return times[i - 1], times[i] if i < len(times) else span[1]
+
+    def to_datetime(self, t):
+        """Return the local datetime at the int timestamp `t`, or None if uncovered."""
+        span = self._covering(t)
+        if span is None:
+            return None
+        _, _, times, offsets, tzinfos, folds = span
+        i = bisect_right(times, t) - 1
+        result = _timestamp_to_datetime(t + offsets[i]).replace(
+            tzinfo=self.tzinfo if tzinfos is None else tzinfos[i]
+        )
+        if folds is not None and t < folds[i]:
+            return result.replace(fold=1)
+        return result
+
+
+def _from_pytz(tzinfo):
+    """The table of a pytz zone, from its own list of transitions."""
+    times = [_datetime_to_seconds(dt) for dt in tzinfo._utc_transition_times]
+    infos = tzinfo._transition_info
+    offsets = [_seconds(info[0]) for info in infos]
+    tzinfos = [tzinfo._tzinfos[info] for info in infos]
+    # the first transition is at `datetime.min`, and the last offset is kept
+    return TransitionTable(
+        tzinfo, (times[0], float('inf'), times, offsets, tzinfos, None)
+    )
+
+
+def probed_table(tzinfo):
+    """Return a `TransitionTable` of `tzinfo` probed over the years of `HORIZON`."""
+    first_year, last_year = HORIZON
+    limits = (_year_start(first_year), _year_start(last_year + 1))
+    return TransitionTable(tzinfo, limits=limits)
+
+
+def build_table(tzinfo):
+    """Return the `TransitionTable` of `tzinfo`, or None if it cannot have one.
+
+    pytz zones get theirs from their transition lists, and zoneinfo zones one
+    probed over the years of `HORIZON` that are looked up. Other tzinfo
+    implementations keep being converted through their own methods.
+    """
+    names = {f'{base.__module__}.{base.__qualname__}' for base in type(tzinfo).__mro__}
+    if _PYTZ_DST_CLASS in names:
+        return _from_pytz(tzinfo)
+    if _ZONEINFO_CLASS in names:
+        return probed_table(tzinfo)
+    return None
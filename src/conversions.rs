@@ -0,0 +1,160 @@
+use pyo3::exceptions::{PyOverflowError, PyValueError};
+use pyo3::intern;
+use pyo3::prelude::*;
+use pyo3::types::{
+    timezone_utc, PyDateAccess, PyDateTime, PyDelta, PyDeltaAccess, PyFloat, PyTimeAccess,
+    PyTzInfo, PyTzInfoAccess,
+};
+
+// Conversions between UNIX timestamps and `datetime`s. The fields are computed here and the
+// result built in one call through the datetime C API, where the Python code went through
+// `fromtimestamp`, `replace` and `astimezone`, or subtracted a fresh epoch `datetime`, each step
+// allocating an intermediate object. Naive datetimes are UTC. `datetime.timezone` offsets are
+// applied here; any other tzinfo converts from UTC through its own `fromutc`, as `astimezone`
+// has it do, so pytz and zoneinfo zones give the same results as before.
+
+const SECONDS_PER_DAY: i64 = 86_400;
+const MICROS_PER_SECOND: i64 = 1_000_000;
+
+/// Days from 1970-01-01 to a proleptic Gregorian date (Howard Hinnant's `days_from_civil`).
+fn days_from_civil(year: i64, month: i64, day: i64) -> i64 {
+    let y = if month <= 2 { year - 1 } else { year };
+    let era = y.div_euclid(400);
+    let yoe = y - era * 400;
+    let mp = (month + 9) % 12;
+    let doy = (153 * mp + 2) / 5 + day - 1;
+    let doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    era * 146_097 + doe - 719_468
+}
+
+/// The date `days` after 1970-01-01, the inverse of `days_from_civil`.
+fn civil_from_days(days: i64) -> (i64, u8, u8) {
+    let z = days + 719_468;
+    let era = z.div_euclid(146_097);
+    let doe = z - era * 146_097;
+    let yoe = (doe - doe / 1460 + doe / 36_524 - doe / 146_096) / 365;
+    let doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    let mp = (5 * doy + 2) / 153;
+    let day = (doy - (153 * mp + 2) / 5 + 1) as u8;
+    let month = (if mp < 10 { mp + 3 } else { mp - 9 }) as u8;
+    (yoe + era * 400 + i64::from(month <= 2), month, day)
+}
+
+/// Whole seconds and microseconds of a timestamp, rounded as `datetime.fromtimestamp` does.
+fn split_timestamp(timestamp: &Bound<'_, PyAny>) -> PyResult<(i64, u32)> {
+    let Ok(timestamp) = timestamp.downcast::<PyFloat>() else {
+        return Ok((timestamp.extract()?, 0));
+    };
+    let t = timestamp.value();
+    if !t.is_finite() {
+        return Err(PyValueError::new_err(
+            "cannot convert NaN or infinity to a datetime",
+        ));
+    }
+    let whole = t.trunc();
+    if whole.abs() >= 1e15 {
+        return Err(PyOverflowError::new_err("timestamp out of range"));
+    }
+    let mut seconds = whole as i64;
+    let mut microseconds = ((t - whole) * 1e6).round_ties_even() as i64;
+    if microseconds >= MICROS_PER_SECOND {
+        seconds += 1;
+        microseconds -= MICROS_PER_SECOND;
+    } else if microseconds < 0 {
+        seconds -= 1;
+        microseconds += MICROS_PER_SECOND;
+    }
+    Ok((seconds, microseconds as u32))
+}
+
+/// The `datetime` with the wall-clock fields of `seconds` since the epoch, and `tzinfo`.
+fn new_datetime<'py>(
+    py: Python<'py>,
+    seconds: i64,
+    microsecond: u32,
+    tzinfo: Option<&Bound<'py, PyTzInfo>>,
+) -> PyResult<Bound<'py, PyDateTime>> {
+    let (year, month, day) = civil_from_days(seconds.div_euclid(SECONDS_PER_DAY));
+    let second_of_day = seconds.rem_euclid(SECONDS_PER_DAY);
+    let year =
+        i32::try_from(year).map_err(|_| PyOverflowError::new_err("timestamp out of range"))?;
+    PyDateTime::new(
+        py,
+        year,
+        month,
+        day,
+        (second_of_day / 3600) as u8,
+        (second_of_day % 3600 / 60) as u8,
+        (second_of_day % 60) as u8,
+        microsecond,
+        tzinfo,
+    )
+}
+
+fn delta_micros(delta: &Bound<'_, PyDelta>) -> i64 {
+    (i64::from(delta.get_days()) * SECONDS_PER_DAY + i64::from(delta.get_seconds()))
+        * MICROS_PER_SECOND
+        + i64::from(delta.get_microseconds())
+}
+
+/// Microseconds since the epoch of `d`, naive datetimes being UTC.
+fn epoch_micros(d: &Bound<'_, PyDateTime>) -> PyResult<i64> {
+    let days = days_from_civil(
+        d.get_year().into(),
+        d.get_month().into(),
+        d.get_day().into(),
+    );
+    let seconds = days * SECONDS_PER_DAY
+        + i64::from(d.get_hour()) * 3600
+        + i64::from(d.get_minute()) * 60
+        + i64::from(d.get_second());
+    let mut micros = seconds * MICROS_PER_SECOND + i64::from(d.get_microsecond());
+    if d.get_tzinfo().is_some() {
+        let offset = d.call_method0(intern!(d.py(), "utcoffset"))?;
+        if !offset.is_none() {
+            micros -= delta_micros(offset.downcast::<PyDelta>()?);
+        }
+    }
+    Ok(micros)
+}
+
+#[pyfunction]
+#[pyo3(signature = (timestamp, tzinfo=None))]
+pub fn timestamp_to_datetime<'py>(
+    py: Python<'py>,
+    timestamp: &Bound<'py, PyAny>,
+    tzinfo: Option<&Bound<'py, PyTzInfo>>,
+) -> PyResult<Bound<'py, PyDateTime>> {
+    let (seconds, microsecond) = split_timestamp(timestamp)?;
+    let Some(tzinfo) = tzinfo else {
+        return new_datetime(py, seconds, microsecond, None);
+    };
+    if tzinfo.get_type().is(&timezone_utc(py).get_type()) {
+        // a `datetime.timezone`: the offset is fixed, so it shifts the fields
+        let offset = tzinfo.call_method1(intern!(py, "utcoffset"), (py.None(),))?;
+        let offset = delta_micros(offset.downcast::<PyDelta>()?);
+        if offset % MICROS_PER_SECOND == 0 {
+            let shifted = seconds.saturating_add(offset / MICROS_PER_SECOND);
+            return new_datetime(py, shifted, microsecond, Some(tzinfo));
+        }
+    }
+    let utc = new_datetime(py, seconds, microsecond, Some(tzinfo))?;
+    Ok(tzinfo
+        .call_method1(intern!(py, "fromutc"), (utc,))?
+        .downcast_into::<PyDateTime>()?)
+}
+
+#[pyfunction]
+pub fn datetime_to_timestamp(d: &Bound<'_, PyDateTime>) -> PyResult<f64> {
+    let micros = epoch_micros(d)?;
+    if micros % MICROS_PER_SECOND == 0 {
+        return Ok((micros / MICROS_PER_SECOND) as f64);
+    }
+    // a single rounding, as Python's int division has, for |t| below 2**53 microseconds
+    Ok(micros as f64 / 1e6)
+}
+
+#[pyfunction]
+pub fn datetime_to_seconds(d: &Bound<'_, PyDateTime>) -> PyResult<i64> {
+    Ok(epoch_micros(d)?.div_euclid(MICROS_PER_SECOND))
+}
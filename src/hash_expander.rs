@@ -7,6 +7,7 @@ use regex::Regex;
 use std::sync::OnceLock;
 
 use crate::constants::RANGES;
+use crate::random::CronRandom;
 
 static HASH_EXPRESSION_RE: OnceLock<Regex> = OnceLock::new();
 
@@ -16,6 +17,29 @@ fn get_hash_expression_re() -> &'static Regex {
     })
 }
 
+fn hashed_value(
+    idx: i32,
+    hash_type: Option<&str>,
+    hash_id: Option<&[u8]>,
+    range_end: Option<i32>,
+    range_begin: Option<i32>,
+    rng: Option<&CronRandom>,
+) -> i32 {
+    let range_end = range_end.unwrap_or(RANGES[idx as usize].1);
+    let range_begin = range_begin.unwrap_or(RANGES[idx as usize].0);
+
+    let crc = if hash_type == Some("r") {
+        match rng {
+            Some(rng) => rng.next_u32(),
+            None => rand::rng().random::<u32>(),
+        }
+    } else {
+        hash(hash_id.unwrap_or_default())
+    };
+
+    (((crc >> idx) % ((range_end - range_begin + 1) as u32)) as i32) + range_begin
+}
+
 #[pyclass]
 pub struct HashExpander {
     #[pyo3(get)]
@@ -29,7 +53,7 @@ impl HashExpander {
         HashExpander { cron: cronit }
     }
 
-    #[pyo3(signature = (idx, hash_type=None, hash_id=None, range_end=None, range_begin=None))]
+    #[pyo3(signature = (idx, hash_type=None, hash_id=None, range_end=None, range_begin=None, rng=None))]
     fn do_(
         &self,
         idx: i32,
@@ -37,27 +61,16 @@ impl HashExpander {
         hash_id: Option<&[u8]>,
         range_end: Option<i32>,
         range_begin: Option<i32>,
+        rng: Option<PyRef<'_, CronRandom>>,
     ) -> PyResult<i32> {
-        let ranges = RANGES;
-
-        let range_end = match range_end {
-            Some(end) => end,
-            None => ranges[idx as usize].1,
-        };
-
-        let range_begin = match range_begin {
-            Some(begin) => begin,
-            None => ranges[idx as usize].0,
-        };
-
-        let crc = if hash_type == Some("r") {
-            let mut rng = rand::rng();
-            rng.random::<u32>()
-        } else {
-            hash(hash_id.unwrap_or_default())
-        };
-
-        Ok((((crc >> idx) % ((range_end - range_begin + 1) as u32)) as i32) + range_begin)
+        Ok(hashed_value(
+            idx,
+            hash_type,
+            hash_id,
+            range_end,
+            range_begin,
+            rng.as_deref(),
+        ))
     }
 
     #[pyo3(signature = (_efl, _idx, expr, _hash_id=None, **_kwargs))]
@@ -73,7 +86,7 @@ impl HashExpander {
         Ok(get_hash_expression_re().is_match(expr))
     }
 
-    #[pyo3(signature = (efl, idx, expr, hash_id=None, match_=None, **kwargs))]
+    #[pyo3(signature = (efl, idx, expr, hash_id=None, match_=None, rng=None, **kwargs))]
     #[allow(clippy::too_many_arguments)]
     fn expand(
         &self,
@@ -83,8 +96,10 @@ impl HashExpander {
         expr: &str,
         hash_id: Option<&[u8]>,
         match_: Option<bool>,
+        rng: Option<PyRef<'_, CronRandom>>,
         kwargs: Option<&Bound<'_, PyDict>>,
     ) -> PyResult<String> {
+        let rng = rng.as_deref();
         let is_match = match match_ {
             Some(m) => m,
             None => self.match_(py, efl, idx, expr, hash_id, kwargs)?,
@@ -134,20 +149,22 @@ impl HashExpander {
 
                 Ok(format!(
                     "{}-{}/{}",
-                    self.do_(
+                    hashed_value(
                         idx,
                         Some(&hash_type),
                         hash_id,
                         Some(divisor - 1 + begin),
-                        Some(begin)
-                    )?,
+                        Some(begin),
+                        rng,
+                    ),
                     end,
                     divisor
                 ))
             } else {
-                Ok(self
-                    .do_(idx, Some(&hash_type), hash_id, Some(end), Some(begin))?
-                    .to_string())
+                Ok(
+                    hashed_value(idx, Some(&hash_type), hash_id, Some(end), Some(begin), rng)
+                        .to_string(),
+                )
             }
         } else if let Some(divisor) = captures
             .name("divisor")
@@ -163,20 +180,19 @@ impl HashExpander {
 
             Ok(format!(
                 "{}-{}/{}",
-                self.do_(
+                hashed_value(
                     idx,
                     Some(&hash_type),
                     hash_id,
                     Some(divisor - 1 + range_begin),
-                    Some(range_begin)
-                )?,
+                    Some(range_begin),
+                    rng,
+                ),
                 range_end,
                 divisor
             ))
         } else {
-            Ok(self
-                .do_(idx, Some(&hash_type), hash_id, None, None)?
-                .to_string())
+            Ok(hashed_value(idx, Some(&hash_type), hash_id, None, None, rng).to_string())
         }
     }
 }
@@ -3,7 +3,9 @@ use pyo3::types::PyDict;
 use std::sync::OnceLock;
 
 mod constants;
+mod conversions;
 mod hash_expander;
+mod random;
 mod utils;
 
 pub fn get_croniters_version() -> &'static str {
@@ -21,7 +23,7 @@ pub fn get_croniters_version() -> &'static str {
     })
 }
 
-#[pymodule]
+#[pymodule(gil_used = false)]
 fn _croniters(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", get_croniters_version())?;
     m.add("MINUTE_FIELD", constants::MINUTE_FIELD)?;
@@ -51,7 +53,11 @@ fn _croniters(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("LEN_MEANS_ALL", constants::LEN_MEANS_ALL)?;
     m.add_function(wrap_pyfunction!(utils::is_32bit, m)?)?;
     m.add_function(wrap_pyfunction!(utils::is_leap, m)?)?;
+    m.add_function(wrap_pyfunction!(conversions::timestamp_to_datetime, m)?)?;
+    m.add_function(wrap_pyfunction!(conversions::datetime_to_timestamp, m)?)?;
+    m.add_function(wrap_pyfunction!(conversions::datetime_to_seconds, m)?)?;
     m.add_class::<hash_expander::HashExpander>()?;
+    m.add_class::<random::CronRandom>()?;
 
     let py = m.py();
     let expanders = PyDict::new(py);
@@ -0,0 +1,67 @@
+use pyo3::prelude::*;
+use pyo3::types::PyType;
+use rand::Rng;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+// SplitMix64 (Steele, Lea & Flood). `rand`'s `StdRng` explicitly makes no promise that a seed
+// produces the same stream across releases, and seeded `R` schedules must replay identically,
+// so the generator is spelled out here. The whole state is one counter, which also lets
+// concurrent callers share a generator through a single atomic add.
+const GOLDEN_GAMMA: u64 = 0x9E37_79B9_7F4A_7C15;
+
+fn mix64(mut z: u64) -> u64 {
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    z ^ (z >> 31)
+}
+
+#[pyclass(module = "croniters._croniters")]
+pub struct CronRandom {
+    state: AtomicU64,
+}
+
+impl CronRandom {
+    pub fn next_u64(&self) -> u64 {
+        let state = self
+            .state
+            .fetch_add(GOLDEN_GAMMA, Ordering::Relaxed)
+            .wrapping_add(GOLDEN_GAMMA);
+        mix64(state)
+    }
+
+    pub fn next_u32(&self) -> u32 {
+        (self.next_u64() >> 32) as u32
+    }
+}
+
+#[pymethods]
+impl CronRandom {
+    #[new]
+    #[pyo3(signature = (seed=None))]
+    fn new(seed: Option<u64>) -> Self {
+        let seed = seed.unwrap_or_else(|| rand::rng().random::<u64>());
+        CronRandom {
+            state: AtomicU64::new(seed),
+        }
+    }
+
+    fn seed(&self, seed: u64) {
+        self.state.store(seed, Ordering::Relaxed);
+    }
+
+    fn getstate(&self) -> u64 {
+        self.state.load(Ordering::Relaxed)
+    }
+
+    fn setstate(&self, state: u64) {
+        self.state.store(state, Ordering::Relaxed);
+    }
+
+    fn random(&self) -> u32 {
+        self.next_u32()
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> (Bound<'py, PyType>, (u64,)) {
+        (slf.get_type(), (slf.borrow().getstate(),))
+    }
+}
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from croniters import CronDriver, croniter
+from croniters._aio import sleep_until
+
+
+def run(coro, timeout=5):
+    return asyncio.run(asyncio.wait_for(coro, timeout))
+
+
+async def take(aiterable, n):
+    result = []
+    async for item in aiterable:
+        result.append(item)
+        if len(result) == n:
+            break
+    return result
+
+
+def test_aiter_fires_on_schedule():
+    start = time.time()
+    fires = run(take(croniter('* * * * * *').aiter(), 2))
+    assert fires[1] - fires[0] == 1
+    assert fires[0] > start
+    assert time.time() >= fires[1]
+
+
+def test_aiter_ret_type_and_catch_up():
+    itr = croniter('0 0 * * *', datetime(2024, 1, 1, tzinfo=timezone.utc))
+    fires = run(take(itr.aiter(datetime), 3))
+    assert fires == [datetime(2024, 1, d, tzinfo=timezone.utc) for d in (2, 3, 4)]
+
+
+def test_aiter_stops_when_schedule_is_exhausted():
+    itr = croniter('0 0 30 2 *', datetime(2024, 1, 1), max_years_between_matches=1)
+    assert run(take(itr.aiter(), 1)) == []
+
+
+def test_sleep_until_past_returns_immediately():
+    start = time.monotonic()
+    run(sleep_until(time.time() - 10))
+    assert time.monotonic() - start < 0.5
+
+
+def test_driver_multiplexes_jobs():
+    past = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    driver = CronDriver(ret_type=datetime)
+    driver.add('daily', croniter('0 0 * * *', past))
+    driver.add('hourly', croniter('0 * * * *', past))
+    driver.add('future', croniter('0 0 1 1 *', datetime(2999, 1, 1)))
+    events = run(take(driver, 4))
+    assert events == [
+        ('hourly', datetime(2024, 1, 1, 1, tzinfo=timezone.utc)),
+        ('hourly', datetime(2024, 1, 1, 2, tzinfo=timezone.utc)),
+        ('hourly', datetime(2024, 1, 1, 3, tzinfo=timezone.utc)),
+        ('hourly', datetime(2024, 1, 1, 4, tzinfo=timezone.utc)),
+    ]
+    assert len(driver) == 3
+
+
+def test_driver_add_wakes_armed_timer():
+    async def scenario():
+        driver = CronDriver()
+        driver.add('future', croniter('0 0 1 1 *', datetime(2999, 1, 1)))
+        asyncio.get_running_loop().call_later(
+            0.05, driver.add, 'now', croniter('* * * * * *')
+        )
+        return await take(driver, 2)
+
+    events = run(scenario(), timeout=3)
+    assert [key for key, _ in events] == ['now', 'now']
+    assert events[1][1] - events[0][1] == 1
+
+
+def test_driver_remove_and_replace():
+    past = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    driver = CronDriver()
+    driver.add('job', croniter('0 0 * * *', past))
+    driver.add('job', croniter('0 0 1 * *', past))
+    driver.add('gone', croniter('0 * * * *', past))
+    driver.remove('gone')
+    assert 'gone' not in driver
+    with pytest.raises(KeyError):
+        driver.remove('gone')
+    events = run(take(driver, 2))
+    assert [key for key, _ in events] == ['job', 'job']
+    assert events[1][1] - events[0][1] == 29 * 86400
+
+
+def test_driver_run_callbacks():
+    past = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    seen = []
+
+    async def async_job(key, fire_time):
+        seen.append((key, fire_time))
+
+    driver = CronDriver()
+    driver.add('sync', croniter('0 0 * * *', past))
+    driver.add('async', croniter('0 0 * * *', past))
+
+    async def scenario():
+        task = asyncio.ensure_future(
+            driver.run(
+                lambda key, t: (
+                    async_job(key, t) if key == 'async' else seen.append((key, t))
+                )
+            )
+        )
+        while len(seen) < 4:
+            await asyncio.sleep(0)
+        task.cancel()
+
+    run(scenario())
+    assert {key for key, _ in seen} == {'sync', 'async'}
+
+
+def test_driver_run_reports_and_cancels_tasks():
+    past = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    errors, started, cancelled = [], [], []
+
+    async def job(key, fire_time):
+        if key == 'bad':
+            raise RuntimeError(key)
+        started.append(key)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+
+    driver = CronDriver()
+    driver.add('bad', croniter('0 0 1 1 *', past))
+    driver.add('slow', croniter('0 0 1 1 *', past))
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        task = asyncio.ensure_future(driver.run(job))
+        while not (errors and started):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(scenario())
+    assert errors
+    assert {type(c['exception']) for c in errors} == {RuntimeError}
+    assert cancelled and set(cancelled) == {'slow'}
@@ -0,0 +1,75 @@
+import struct
+from datetime import datetime, timezone
+
+import pytest
+import pytz
+
+from croniters import CronSchedule, croniter, croniter_range, croniter_range_array
+
+START = datetime(2024, 3, 30)
+STOP = datetime(2024, 4, 2)
+
+
+@pytest.mark.parametrize(
+    'expr', ['*/5 * * * *', '0 12 * * *', '*/20 * * * * */30', '0 0 * * sat#1']
+)
+def test_range_array(expr):
+    times = croniter_range_array(START, STOP, expr)
+    assert times.typecode == 'q'
+    assert list(times) == [
+        int(t) for t in croniter_range(START, STOP, expr, ret_type=float)
+    ]
+    view = memoryview(times)
+    assert (view.format, view.itemsize, view.readonly) == ('q', 8, False)
+    assert view.nbytes == 8 * len(times)
+    if times:
+        assert struct.unpack_from('<q', times) == (times[0],)
+
+
+def test_units():
+    seconds = croniter_range_array(START, STOP, '0 * * * *')
+    for unit, scale in (('ms', 10**3), ('us', 10**6), ('ns', 10**9)):
+        scaled = croniter_range_array(START, STOP, '0 * * * *', unit=unit)
+        assert list(scaled) == [t * scale for t in seconds]
+    with pytest.raises(ValueError, match='unit'):
+        croniter_range_array(START, STOP, '0 * * * *', unit='h')
+
+
+def test_range_options():
+    tz = pytz.timezone('Europe/Paris')
+    times = croniter_range_array(
+        tz.localize(START), tz.localize(STOP), '0 0 * * *', exclude_ends=True
+    )
+    midnights = [tz.localize(datetime(2024, 3, 31)), tz.localize(datetime(2024, 4, 1))]
+    assert list(times) == [int(dt.timestamp()) for dt in midnights]
+
+
+def test_numpy_reads_without_copy():
+    numpy = pytest.importorskip('numpy')
+    times = croniter_range_array(START, STOP, '*/5 * * * *', unit='ns')
+    values = numpy.frombuffer(times, dtype='int64')
+    assert values.base is not None
+    times[0] = 42
+    assert values[0] == 42
+
+
+def test_next_array():
+    itr = croniter('*/5 * * * *', START)
+    ref = croniter('*/5 * * * *', START)
+    times = itr.next_array(1000)
+    assert list(times) == [int(ref.get_next(float)) for _ in range(1000)]
+    assert itr.get_current() == times[-1]
+    prev = croniter('*/5 * * * *', START, is_prev=True).next_array(3, unit='ns')
+    assert list(prev) == [
+        int(datetime(2024, 3, 29, 23, minute, tzinfo=timezone.utc).timestamp()) * 10**9
+        for minute in (55, 50, 45)
+    ]
+
+
+def test_next_array_exhausted():
+    itr = croniter('0 0 1 * * 0 2099', START, max_years_between_matches=100)
+    itr.set_current(datetime(2099, 10, 1))
+    assert len(itr.next_array(10)) == 2
+    assert len(itr.next_array(10)) == 0
+    cursor = CronSchedule('0 0 1 * *').cursor(START)
+    assert len(cursor.next_array(12)) == 12
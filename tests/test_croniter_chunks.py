@@ -0,0 +1,83 @@
+import itertools
+from datetime import datetime
+
+import pytest
+import pytz
+
+from croniters import CroniterBadDateError, CronSchedule, croniter, croniter_range
+
+EXPRESSIONS = [
+    '* * * * *',
+    '*/10 9-17 * * mon-fri',
+    '0 12 * * *',
+    '30 1,2 * * *',
+    '*/15 * * * * */20',
+]
+PARIS = pytz.timezone('Europe/Paris')
+RANGES = [
+    (datetime(2024, 3, 25), datetime(2024, 3, 31, 5)),
+    (datetime(2024, 4, 1), datetime(2024, 3, 28)),
+    (PARIS.localize(datetime(2024, 10, 25)), PARIS.localize(datetime(2024, 10, 28))),
+    (1_700_000_000, 1_700_000_000 + 2 * 86400),
+]
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+@pytest.mark.parametrize(('start', 'stop'), RANGES)
+@pytest.mark.parametrize('exclude_ends', [False, True])
+def test_range_chunks(expr, start, stop, exclude_ends):
+    expected = list(croniter_range(start, stop, expr, exclude_ends=exclude_ends))
+    for chunk_size in (1, 7, 1000):
+        chunks = list(
+            croniter_range(
+                start, stop, expr, exclude_ends=exclude_ends, chunk_size=chunk_size
+            )
+        )
+        assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+        assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+        assert list(itertools.chain.from_iterable(chunks)) == expected
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+@pytest.mark.parametrize('ret_type', [float, datetime])
+def test_iter_chunks(expr, ret_type):
+    start = PARIS.localize(datetime(2024, 3, 29, 12))
+    chunks = croniter(expr, start).iter_chunks(100, ret_type)
+    itr = croniter(expr, start)
+    for _ in range(5):
+        assert next(chunks) == [itr.get_next(ret_type) for _ in range(100)]
+
+    chunks = croniter(expr, start, is_prev=True).iter_chunks(100, ret_type)
+    itr = croniter(expr, start)
+    for _ in range(3):
+        assert next(chunks) == [itr.get_prev(ret_type) for _ in range(100)]
+
+
+def test_iter_chunks_exhausted():
+    itr = croniter(
+        '0 0 1 * * 0 2099', datetime(2099, 6, 1), max_years_between_matches=1
+    )
+    assert list(itr.iter_chunks(4, datetime)) == [
+        [datetime(2099, month, 1) for month in (7, 8, 9, 10)],
+        [datetime(2099, month, 1) for month in (11, 12)],
+    ]
+    chunks = croniter('0 0 1 * * 0 2099', datetime(2099, 6, 1)).iter_chunks(4)
+    next(chunks)
+    assert len(next(chunks)) == 2
+    with pytest.raises(CroniterBadDateError):
+        next(chunks)
+
+
+def test_iter_chunks_arguments():
+    itr = croniter('* * * * *', datetime(2024, 1, 1))
+    with pytest.raises(ValueError):
+        next(itr.iter_chunks(0))
+    with pytest.raises(TypeError):
+        next(itr.iter_chunks(10, str))
+
+
+def test_cursor_chunks():
+    cursor = CronSchedule('*/5 * * * *').cursor(datetime(2024, 1, 1))
+    [first] = itertools.islice(cursor.iter_chunks(300, datetime), 1)
+    assert first[0] == datetime(2024, 1, 1, 0, 5)
+    assert first[-1] == datetime(2024, 1, 2, 1, 0)
@@ -0,0 +1,105 @@
+import os
+import tracemalloc
+from datetime import datetime
+
+import pytest
+import pytz
+
+from croniters import CronCursor, CronSchedule, croniter
+
+EXPRESSIONS = [
+    '*/5 9-17 * * mon-fri',
+    '0 0 L * *',
+    '0 0 1,15 * sat#1',
+    '0 3 * * L5',
+    '15 10 * * * 30',
+    '0 0 1 */2 * 0 2020-2040',
+]
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+@pytest.mark.parametrize('day_or', [True, False])
+def test_cursor_matches_croniter(expr, day_or):
+    tz = pytz.timezone('Europe/Paris')
+    start = tz.localize(datetime(2024, 3, 30, 12))
+    itr = croniter(expr, start, ret_type=datetime, day_or=day_or)
+    cursor = CronSchedule(expr, ret_type=datetime, day_or=day_or).cursor(start)
+    assert [cursor.get_next() for _ in range(10)] == [itr.get_next() for _ in range(10)]
+    assert [cursor.get_prev(float) for _ in range(15)] == [
+        itr.get_prev(float) for _ in range(15)
+    ]
+    assert cursor.get_current() == itr.get_current()
+    assert [next(cursor) for _ in range(3)] == [next(itr) for _ in range(3)]
+
+
+def test_cursors_share_schedule():
+    schedule = CronSchedule('0 0 * * sat#1,sun#2')
+    first, second = schedule.cursor(0), schedule.cursor(86400 * 365)
+    assert first.expanded is second.expanded is schedule.expanded
+    assert first.nth_weekday_of_month is schedule.nth_weekday_of_month
+    assert first.get_next() < second.get_next()
+    assert not hasattr(first, '__dict__')
+    with pytest.raises(AttributeError):
+        first.expanded = []
+
+
+def test_cursor_iteration():
+    schedule = CronSchedule('0 0 1 1 * 0 2020-2022', max_years_between_matches=5)
+    cursor = CronCursor(schedule, datetime(2019, 6, 1))
+    assert list(cursor.all_next(datetime)) == [
+        datetime(y, 1, 1) for y in (2020, 2021, 2022)
+    ]
+    cursor.set_current(datetime(2023, 1, 1))
+    assert list(cursor.all_prev(datetime)) == [
+        datetime(y, 1, 1) for y in (2022, 2021, 2020)
+    ]
+    cursor = schedule.cursor(datetime(2021, 6, 1), is_prev=True)
+    assert [dt for dt in cursor.iter()(datetime)] == [
+        datetime(2021, 1, 1),
+        datetime(2020, 1, 1),
+    ]
+
+
+def test_schedule_from_croniter():
+    itr = croniter('R R * * *', datetime(2024, 1, 1), rng=3, implement_cron_bug=True)
+    schedule = CronSchedule.from_croniter(itr)
+    assert schedule.expanded is itr.expanded
+    assert schedule._implement_cron_bug
+    cursor = schedule.cursor(datetime(2024, 1, 1))
+    assert [cursor.get_next() for _ in range(5)] == [itr.get_next() for _ in range(5)]
+
+
+def test_schedule_expand_from_start_time():
+    start = datetime(2024, 1, 1, 0, 3)
+    schedule = CronSchedule('*/10 * * * *', start, expand_from_start_time=True)
+    cursor = schedule.cursor(start)
+    assert cursor.get_next(datetime) == datetime(2024, 1, 1, 0, 13)
+    with pytest.raises(ValueError):
+        cursor.get_next(start_time=start)
+
+
+def bytes_per_object(factory, count):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == count
+    return (after - before) / count
+
+
+def test_cursor_memory():
+    """Test a live cursor holds a fraction of the memory of a croniter"""
+    count = int(os.environ.get('CRONITER_TEST_MEMORY_ITERATORS', '200'))
+    expr = '*/5 9-17 * * mon-fri'
+    start = 1700000000.0
+    schedule = CronSchedule(expr)
+    per_croniter = bytes_per_object(lambda i: croniter(expr, start + i), count)
+    per_cursor = bytes_per_object(lambda i: schedule.cursor(start + i), count)
+    # the cursor only holds its slots and position floats; compared with each
+    # other, the sizes do not depend on the allocator or Python version
+    assert per_cursor * 4 < per_croniter, (
+        f'bytes per live iterator: croniter {per_croniter:.0f}, cursor {per_cursor:.0f}'
+    )
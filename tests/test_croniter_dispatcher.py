@@ -0,0 +1,138 @@
+import os
+import random
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from croniters import CronDispatcher, croniter, croniter_range
+
+EXPRESSIONS = [
+    '*/5 * * * *',
+    '0 */2 * * *',
+    '30 3 * * *',
+    '0 0 * * sat#1,sun#2',
+    '0 0 L * *',
+    '15 10 * * mon-fri',
+    '0 0 1 */3 *',
+    '0 0 29 2 *',
+]
+# Per-second schedules are only replayed over a few hours: each fire costs a
+# get_next call.
+SECOND_EXPRESSIONS = [
+    '* * * * * *',
+    '*/7 * * * * 13',
+    '0 * * * * */20',
+]
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def replay(expressions, end, steps, seed=0):
+    """Advance a dispatcher in irregular steps, checking each batch exactly."""
+    horizon = end + timedelta(days=1)
+    start = int(START.timestamp())
+    end = int(end.timestamp())
+    dispatcher = CronDispatcher(now=start)
+    for i, expr in enumerate(expressions):
+        dispatcher.add(i, croniter(expr, START))
+    fires = [
+        [int(t) for t in croniter_range(START, horizon, expr, ret_type=float)]
+        for expr in expressions
+    ]
+
+    rand = random.Random(seed)
+    now = start
+    while now < end:
+        prev, now = now, min(end, now + rand.choice(steps))
+        due = dispatcher.advance(now)
+        expected = Counter()
+        for i, times in enumerate(fires):
+            count = bisect_right(times, now) - bisect_right(times, prev)
+            if count:
+                expected[i] = count
+        assert Counter(due) == expected, (prev, now)
+    for i, times in enumerate(fires):
+        later = times[bisect_right(times, end) :]
+        if later:
+            assert dispatcher.next_fire(i) == later[0]
+        assert dispatcher.next_fire(i) > end
+
+
+def test_dispatcher_matches_croniter_range():
+    end = datetime(2024, 3, 2, tzinfo=timezone.utc)
+    replay(EXPRESSIONS, end, [1, 59, 61, 3599, 7201, 86400 * 3])
+
+
+def test_dispatcher_matches_croniter_range_seconds():
+    end = datetime(2024, 1, 1, 3, tzinfo=timezone.utc)
+    replay(SECOND_EXPRESSIONS, end, [1, 2, 59, 61, 601])
+
+
+def test_dispatcher_fire_order_and_overflow():
+    start = START.timestamp()
+    dispatcher = CronDispatcher(now=start)
+    dispatcher.add(
+        'leap', croniter('0 0 29 2 *', datetime(2024, 3, 1, tzinfo=timezone.utc))
+    )
+    dispatcher.add('yearly', croniter('0 0 1 1 *', START))
+    assert (
+        dispatcher.next_fire('leap')
+        == datetime(2028, 2, 29, tzinfo=timezone.utc).timestamp()
+    )
+
+    due = dispatcher.advance(datetime(2028, 3, 1, tzinfo=timezone.utc).timestamp())
+    assert due == ['yearly'] * 4 + ['leap']
+    assert (
+        dispatcher.next_fire('leap')
+        == datetime(2032, 2, 29, tzinfo=timezone.utc).timestamp()
+    )
+
+
+def test_dispatcher_remove_and_reschedule():
+    start = START.timestamp()
+    dispatcher = CronDispatcher(now=start)
+    dispatcher.add('a', croniter('*/5 * * * *', START))
+    dispatcher.add('b', croniter('*/5 * * * *', START))
+    dispatcher.remove('b')
+    assert 'b' not in dispatcher
+    with pytest.raises(KeyError):
+        dispatcher.remove('b')
+    with pytest.raises(KeyError):
+        dispatcher.reschedule('b', croniter('* * * * *', START))
+
+    assert dispatcher.advance(start + 600) == ['a', 'a']
+    dispatcher.reschedule(
+        'a', croniter('0 * * * *', datetime.fromtimestamp(start + 600, timezone.utc))
+    )
+    assert dispatcher.advance(start + 3000) == []
+    assert dispatcher.advance(start + 3600) == ['a']
+    assert len(dispatcher) == 1
+
+
+def test_dispatcher_coalesces_past_occurrences():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()
+    dispatcher = CronDispatcher(now=now)
+    dispatcher.add('late', croniter('0 * * * *', START))
+    assert dispatcher.advance(now) == ['late']
+    assert dispatcher.next_fire('late') == now + 3600
+
+
+def test_dispatcher_drops_exhausted_jobs():
+    start = START.timestamp()
+    dispatcher = CronDispatcher(now=start)
+    dispatcher.add('never', croniter('0 0 30 2 *', START, max_years_between_matches=1))
+    assert 'never' not in dispatcher
+
+
+def test_dispatcher_many_jobs():
+    jobs = int(os.environ.get('CRONITER_TEST_DISPATCHER_JOBS', '5000'))
+    start = START.timestamp()
+    dispatcher = CronDispatcher(now=start)
+    for i in range(jobs):
+        dispatcher.add(i, croniter(f'{i % 60} * * * *', START))
+    due = dispatcher.advance(start + 3600)
+    assert Counter(due) == Counter(range(jobs))
+    for i in range(0, jobs, 2):
+        dispatcher.remove(i)
+    assert sorted(dispatcher.advance(start + 7200)) == list(range(1, jobs, 2))
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+from dateutil import tz
+
+import croniters
+from croniters import croniter, croniter_range
+
+FIXED = [
+    timezone.utc,
+    timezone(timedelta(hours=5, minutes=30)),
+    timezone(-timedelta(hours=3)),
+    pytz.utc,
+    pytz.FixedOffset(-150),
+    pytz.timezone('Etc/GMT+5'),
+    tz.tzutc(),
+    tz.tzoffset('X', 7200),
+]
+EXPRESSIONS = ['*/10 * * * *', '30 2 * * *', '0 0 L * *', '15 10 * * * 30']
+
+
+def test_detection():
+    assert croniters._fixed_offset(None)
+    for tzinfo in FIXED:
+        assert croniters._fixed_offset(tzinfo)
+    assert not croniters._fixed_offset(pytz.timezone('Europe/Paris'))
+    assert not croniters._fixed_offset(tz.gettz('America/New_York'))
+
+
+@pytest.mark.parametrize('tzinfo', FIXED)
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+def test_same_results(tzinfo, expr, monkeypatch):
+    start = datetime(2024, 3, 30, 22, tzinfo=tzinfo)
+    itr = croniter(expr, start)
+    fast = [itr.get_next(datetime) for _ in range(200)]
+    fast += [itr.get_prev(datetime) for _ in range(50)]
+    # what the DST handling gives
+    monkeypatch.setitem(croniters.FIXED_OFFSET_TYPES, type(tzinfo), False)
+    itr = croniter(expr, start)
+    slow = [itr.get_next(datetime) for _ in range(200)]
+    slow += [itr.get_prev(datetime) for _ in range(50)]
+    assert fast == slow
+    assert [dt.utcoffset() for dt in fast] == [dt.utcoffset() for dt in slow]
+
+
+@pytest.mark.parametrize('tzinfo', [None, *FIXED])
+def test_dst_handling_skipped(tzinfo, monkeypatch):
+    def fail(self, result):
+        raise AssertionError('no DST handling expected')
+
+    monkeypatch.setattr(croniter, '_adjust_dst', fail)
+    start = datetime(2024, 3, 30, tzinfo=tzinfo)
+    assert (
+        len(list(croniter_range(start, start + timedelta(days=2), '0 * * * *'))) == 49
+    )
+    paris = pytz.timezone('Europe/Paris').localize(datetime(2024, 3, 30))
+    with pytest.raises(AssertionError):
+        croniter('0 * * * *', paris).get_next()
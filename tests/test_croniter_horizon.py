@@ -0,0 +1,97 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from croniters import CroniterBadCronError, croniter, croniter_range, schedule_horizon
+
+EXPRESSIONS = [
+    '*/5 * * * *',
+    '0 */2 * * *',
+    '0 0 1 */3 *',
+    '0 0 * * sat#1,sun#2',
+    '0 0 L * *',
+    '15 10 * * mon-fri',
+    '0 0 30 2 *',
+    '*/15 9 * * * */20',
+]
+START = datetime(2024, 1, 1)
+END = datetime(2024, 2, 1, 12)
+
+
+def expected(expr, start=START, end=END, **kwargs):
+    return list(croniter_range(start, end, expr, ret_type=int, **kwargs))
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_horizon_matches_croniter_range(workers):
+    horizon = schedule_horizon(EXPRESSIONS, START, END, workers=workers)
+    assert len(horizon) == len(EXPRESSIONS)
+    assert horizon.offsets[0] == 0
+    assert horizon.offsets[-1] == len(horizon.timestamps)
+    for i, expr in enumerate(EXPRESSIONS):
+        assert horizon[i].tolist() == expected(expr)
+    assert horizon[6].tolist() == []
+
+
+def test_horizon_workers_agree():
+    exprs = EXPRESSIONS * 2
+    end = datetime(2024, 1, 8)
+    serial = schedule_horizon(exprs, START, end)
+    pooled = schedule_horizon(exprs, START, end, workers=2)
+    assert pooled.offsets == serial.offsets
+    assert pooled.timestamps == serial.timestamps
+
+
+def test_horizon_options():
+    horizon = schedule_horizon(
+        ['0 0 * * *'], START, datetime(2024, 1, 3), exclude_ends=True
+    )
+    assert horizon[0].tolist() == expected(
+        '0 0 * * *', end=datetime(2024, 1, 3), exclude_ends=True
+    )
+    horizon = schedule_horizon(
+        ['0 0 13 * fri'], START, datetime(2025, 1, 1), day_or=False
+    )
+    assert horizon.datetimes(0) == [datetime(2024, 9, 13), datetime(2024, 12, 13)]
+    reverse = schedule_horizon(['0 0 * * mon'], END, START)
+    assert reverse[0].tolist() == expected('0 0 * * mon', END, START)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_horizon_hash_id(workers):
+    exprs = ['H H * * *', 'H/15 * * * *']
+    horizon = schedule_horizon(exprs, START, END, workers=workers, hash_id='job-1')
+    for i, expr in enumerate(exprs):
+        assert horizon[i].tolist() == expected(expr, hash_id='job-1')
+    first = croniter('H H * * *', START, hash_id=b'job-1').get_next(int)
+    assert horizon[0][0] == first
+    other = schedule_horizon(exprs, START, END, hash_id='job-2')
+    assert other.timestamps != horizon.timestamps
+
+
+def test_horizon_datetimes():
+    horizon = schedule_horizon(['0 12 1 * *'], START, END)
+    assert horizon.datetimes(0) == [datetime(2024, 1, 1, 12), datetime(2024, 2, 1, 12)]
+    assert horizon.datetimes(-1, timezone.utc) == [
+        datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, 12, tzinfo=timezone.utc),
+    ]
+    with pytest.raises(IndexError):
+        horizon[1]
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='needs /dev/shm')
+def test_horizon_failed_shard_releases_blocks():
+    before = set(os.listdir('/dev/shm'))
+    with pytest.raises(CroniterBadCronError):
+        schedule_horizon(['0 0 * * *'] * 3 + ['* * * *'], START, END, workers=4)
+    assert set(os.listdir('/dev/shm')) <= before
+
+
+def test_horizon_edge_cases():
+    assert len(schedule_horizon([], START, END, workers=4)) == 0
+    with pytest.raises(ValueError):
+        schedule_horizon(EXPRESSIONS, START, END, workers=0)
+    with pytest.raises(CroniterBadCronError):
+        schedule_horizon(['* * * *', '0 0 * * *'], START, END, workers=2)
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies that `import croniters` must not load: they are only needed
+# once a date is searched for, or by the optional subsystems.
+LAZY_MODULES = ('asyncio', 'calendar', 'dateutil', 'multiprocessing', 'pytz')
+ASSERT_IMPORT_TIME = os.environ.get('CRONITER_TEST_ASSERT_IMPORT_TIME') == '1'
+
+
+def run(*args):
+    # measure with the bytecode cached, as in a deployed install
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True, env=env
+    )
+
+
+def import_time_us(module):
+    """Cumulative `-X importtime` of `module` in a fresh interpreter"""
+    for line in run('-X', 'importtime', '-c', f'import {module}').stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f'{module} not in -X importtime output')
+
+
+def test_import_is_lazy():
+    code = (
+        'import sys, croniters\n'
+        f'print(*sorted({{m.partition(".")[0] for m in sys.modules}} & {set(LAZY_MODULES)}))'
+    )
+    assert run('-c', code).stdout.split() == []
+
+
+def test_import_time_budget():
+    # wall-clock import times are too noisy on shared CI runners to gate on by
+    # default; test_import_is_lazy checks what keeps the import light
+    if not ASSERT_IMPORT_TIME:
+        pytest.skip('set CRONITER_TEST_ASSERT_IMPORT_TIME=1 to assert the import time')
+    budget_ms = float(os.environ.get('CRONITER_TEST_IMPORT_BUDGET_MS', '40'))
+    import_time_us('croniters')  # warm the bytecode cache
+    best_ms = min(import_time_us('croniters') for _ in range(5)) / 1000
+    assert best_ms <= budget_ms, (
+        f'import croniters: {best_ms:.1f} ms (budget {budget_ms:.0f} ms)'
+    )
@@ -0,0 +1,94 @@
+import pickle
+from datetime import datetime
+
+import pytest
+import pytz
+
+from croniters import CronSchedule, croniter, croniter_range, croniter_range_array
+
+EXPRESSIONS = [
+    '* * * * *',
+    '*/10 9-17 * * mon-fri',
+    '0 0 L * *',
+    '30 2 * * *',
+    '*/15 * * * * */20',
+    '0 0 29 2 *',
+]
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+@pytest.mark.parametrize('tz', [None, 'Europe/Paris', 'America/New_York'])
+def test_int_matches_float(expr, tz):
+    start = datetime(2024, 3, 9, 20)
+    if tz:
+        start = pytz.timezone(tz).localize(start)
+    itr = croniter(expr, start, ret_type=int)
+    ref = croniter(expr, start)
+    for _ in range(300):
+        t = itr.get_next()
+        assert type(t) is int
+        assert t == ref.get_next(float)
+    for _ in range(100):
+        assert itr.get_prev() == ref.get_prev(float)
+    assert type(itr.get_current()) is int
+    assert type(itr.get_current(float)) is float
+
+
+def test_fractional_start():
+    itr = croniter('* * * * * *', 1_700_000_000.5)
+    assert itr.get_current(int) == 1_700_000_000
+    assert itr.get_next(int) == 1_700_000_001
+    itr = croniter('* * * * * *', -0.5)
+    assert itr.get_current(int) == -1
+    assert itr.get_prev(int) == -1
+    itr = croniter('* * * * *', datetime(2024, 1, 1, 0, 0, 59, 999999))
+    assert itr.get_next(int) == int(datetime(2024, 1, 1, 0, 1).timestamp())
+
+
+def test_range_int():
+    start = 472_222 * 3600
+    stop = start + 86400
+    times = list(croniter_range(start, stop, '0 * * * *', ret_type=int))
+    assert all(type(t) is int for t in times)
+    assert times == [t for t in range(start, stop + 1) if t % 3600 == 0]
+    chunks = croniter_range(stop, start, '0 * * * *', ret_type=int, chunk_size=5)
+    assert [t for chunk in chunks for t in chunk] == times[::-1]
+    assert list(croniter_range(start, start + 7200, '*/20 * * * *', ret_type=int)) == [
+        start + 1200 * i for i in range(7)
+    ]
+
+
+def test_nanoseconds_are_exact():
+    start, stop = datetime(2200, 1, 1), datetime(2200, 1, 2)
+    seconds = list(croniter_range(start, stop, '*/7 * * * * */13', ret_type=int))
+    ns = croniter_range_array(start, stop, '*/7 * * * * */13', unit='ns')
+    assert list(ns) == [t * 10**9 for t in seconds]
+
+
+def test_chunks_and_schedules():
+    start = datetime(2024, 1, 1, 12)
+    itr = croniter('*/5 * * * *', start)
+    chunk = next(itr.iter_chunks(500, int))
+    ref = croniter('*/5 * * * *', start)
+    assert chunk == [ref.get_next(float) for _ in range(500)]
+    assert all(type(t) is int for t in chunk)
+
+    schedule = CronSchedule('*/5 * * * *', ret_type=int)
+    assert schedule.cursor(start).get_next() == chunk[0]
+    assert schedule.next_after(start) == chunk[0]
+    schedule.enable_cache()
+    assert type(schedule.next_after(start)) is int
+    assert type(schedule.next_after(start, float)) is float
+
+
+def test_ret_type_kept():
+    itr = croniter('0 0 * * *', datetime(2024, 1, 1), ret_type=int)
+    clone = pickle.loads(pickle.dumps(itr))
+    assert clone.get_next() == itr.get_next() == 1_704_153_600
+    clone = croniter.from_bytes(itr.to_bytes(), ret_type=int)
+    assert clone.get_next() == itr.get_next()
+
+
+def test_bad_ret_type():
+    with pytest.raises(TypeError, match="'int'"):
+        croniter('0 0 * * *').get_next(str)
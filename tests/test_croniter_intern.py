@@ -0,0 +1,94 @@
+import gc
+from datetime import datetime
+
+import pytest
+
+from croniters import CronSchedule, _cursor, croniter
+
+EQUIVALENT = [
+    [
+        '*/15 * * * *',
+        '0,15,30,45 * * * *',
+        '0-59/15 * * * *',
+        '45,30,15,0,0 * * * *',
+        '*/15 * * * * 0',
+        '*/15 * * * * 0 *',
+    ],
+    # with day_or, either day field matching every day makes every day match
+    ['0 0 * * *', '0 0 1-31 * *', '0 0 * * 0-6', '0 0 1-31 * mon-fri', '@daily'],
+    ['0 9 * * mon-fri', '0 9 * * 1,2,3,4,5', '0 9 * * 1-5'],
+    ['0 0 L * *', '0 0 l * *'],
+    ['0 0 * * sat#1,sun#2', '0 0 * * 6#1,0#2'],
+    ['15 10 * * * 30', '15 10 * * * 30 *'],
+]
+
+
+def fingerprints(expressions, **kwargs):
+    return {croniter(expr, **kwargs).fingerprint() for expr in expressions}
+
+
+@pytest.mark.parametrize('expressions', EQUIVALENT)
+def test_equivalent_expressions(expressions):
+    assert len(fingerprints(expressions)) == 1
+    start = datetime(2024, 2, 27, 13, 7)
+    times = {
+        tuple(croniter(expr, start).get_next(float) for _ in range(100))
+        for expr in expressions
+    }
+    assert len(times) == 1
+
+
+def test_different_expressions():
+    assert len(fingerprints([group[0] for group in EQUIVALENT])) == len(EQUIVALENT)
+    assert len(fingerprints(['0 0 1 * mon', '0 0 1 * *', '0 0 * * mon'])) == 3
+    assert len(fingerprints(['0 0 * * *', '0 0 * * * 0 2024'])) == 2
+
+
+def test_day_fields():
+    union = croniter('0 0 */2 * mon').fingerprint()
+    intersection = croniter('0 0 */2 * mon', day_or=False).fingerprint()
+    assert union != intersection
+    assert croniter('0 0 */2 * mon', implement_cron_bug=True).fingerprint() == (
+        intersection
+    )
+    # no date has both, but with day_or the day of month is still searched for
+    assert len(fingerprints(['0 0 31 2 0-7', '0 0 * 2 *'])) == 2
+    # day_or makes no difference while either day field is '*'
+    assert fingerprints(['0 0 1 * *'], day_or=False) == fingerprints(['0 0 1 * *'])
+
+
+def test_stable():
+    # fingerprints are compared across processes and versions
+    assert croniter('*/15 * * * *').fingerprint() == '3d59de6430cfb2b83ee41ced78c7ffba'
+    schedule = CronSchedule('0,15,30,45 * * * *')
+    assert schedule.fingerprint() == schedule.cursor().fingerprint()
+    assert schedule.fingerprint() == '3d59de6430cfb2b83ee41ced78c7ffba'
+
+
+def test_intern():
+    shared = CronSchedule.intern('*/15 * * * *')
+    for expr in EQUIVALENT[0]:
+        assert CronSchedule.intern(expr) is shared
+    assert CronSchedule.intern('*/15 * * * *', ret_type=int) is not shared
+    assert CronSchedule.intern('*/15 * * * *', wall_clock=True) is not shared
+    assert CronSchedule.intern('*/20 * * * *') is not shared
+    # the occurrence cache comes along
+    shared.enable_cache()
+    other = CronSchedule.intern('0-59/15 * * * *')
+    assert other.next_after(0.0) == 900.0
+    assert shared.cache_stats()['misses'] == 1
+
+
+def test_interned_weakly():
+    key = CronSchedule.intern('7 7 7 7 *').fingerprint()
+
+    def interned():
+        return [s for s in _cursor.INTERNED.values() if s.fingerprint() == key]
+
+    gc.collect()
+    assert interned() == []
+    schedule = CronSchedule.intern('7 7 7 jul *')
+    assert interned() == [schedule]
+    del schedule
+    gc.collect()
+    assert interned() == []
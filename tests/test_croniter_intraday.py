@@ -0,0 +1,90 @@
+import random
+from datetime import datetime
+
+import pytest
+import pytz
+
+import croniters
+from croniters import CronSchedule, croniter, croniter_range
+
+DENSE = [
+    '* * * * *',
+    '*/10 9-17 * * mon-fri',
+    '*/7 1-3 * * *',
+    '30 1,2 * * *',
+    '0,30 * 1,15 * mon',
+    '0 0-23/3 L * *',
+    '*/15 * * * * */20',
+]
+
+
+def searched(itr, is_prev):
+    """The result of a full search from `itr`'s state"""
+    ref = croniter(' '.join(itr.expressions), ret_type=datetime)
+    ref.tzinfo, ref.cur, ref.dst_start_time = itr.tzinfo, itr.cur, itr.dst_start_time
+    return ref.get_prev() if is_prev else ref.get_next()
+
+
+@pytest.mark.parametrize('expr', DENSE)
+@pytest.mark.parametrize('tz', [None, 'Europe/Paris', 'America/New_York'])
+def test_steps_match_search(expr, tz):
+    tzinfo = pytz.timezone(tz) if tz else None
+    rnd = random.Random(expr)
+    # across the spring and autumn DST changes
+    for start in (datetime(2024, 3, 9, 20), datetime(2024, 10, 26, 22)):
+        itr = croniter(
+            expr, tzinfo.localize(start) if tzinfo else start, ret_type=datetime
+        )
+        for _ in range(150):
+            is_prev = rnd.random() < 0.3
+            expected = searched(itr, is_prev)
+            found = itr.get_prev() if is_prev else itr.get_next()
+            assert found == expected
+            assert found.utcoffset() == expected.utcoffset()
+
+
+def test_long_iteration_across_dst():
+    tz = pytz.timezone('Europe/Paris')
+    itr = croniter(
+        '0,30 * * * *', tz.localize(datetime(2024, 10, 1)), ret_type=datetime
+    )
+    for _ in range(3000):
+        expected = searched(itr, False)
+        assert itr.get_next() == expected
+
+
+def test_steps_skip_the_search():
+    croniters.enable_stats()
+    try:
+        dates = list(
+            croniter_range(datetime(2024, 1, 1), datetime(2024, 1, 8), '*/5 * * * *')
+        )
+        counts = croniters.stats()
+    finally:
+        croniters.disable_stats()
+    assert len(dates) == 7 * 288 + 1
+    # one search per day, plus the one past the end of the range
+    assert counts['calc_calls'] <= 9
+    assert counts['intraday_steps'] == len(dates) + 1 - counts['calc_calls']
+
+
+def test_no_plan_for_daily_schedules():
+    itr = croniter('0 12 * * *', datetime(2024, 1, 1))
+    itr.get_next()
+    assert itr._day_plan is None
+
+
+def test_plan_follows_timezone():
+    itr = croniter('*/30 * * * *', datetime(2024, 1, 1, 10), ret_type=datetime)
+    itr.get_next()
+    tz = pytz.timezone('Asia/Kolkata')
+    itr.set_current(tz.localize(datetime(2024, 1, 1, 10, 10)))
+    assert itr.get_next() == tz.localize(datetime(2024, 1, 1, 10, 30))
+
+
+def test_cursor_steps():
+    schedule = CronSchedule('*/10 9-17 * * mon-fri', ret_type=datetime)
+    cursor = schedule.cursor(datetime(2024, 1, 5, 16))
+    itr = croniter('*/10 9-17 * * mon-fri', datetime(2024, 1, 5, 16))
+    for _ in range(100):
+        assert cursor.get_next() == itr.get_next(datetime)
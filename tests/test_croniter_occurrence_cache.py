@@ -0,0 +1,114 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+from dateutil import tz
+
+import croniters
+from croniters import CroniterBadDateError, CronSchedule, croniter
+
+
+@pytest.mark.parametrize(
+    ('expr', 'tz'),
+    [
+        ('*/5 * * * *', None),
+        ('*/7 * * * * */13', None),
+        ('0 0 29 2 *', None),
+        ('0 3 * * *', 'Europe/Paris'),
+        ('30 1,2 * * *', 'America/New_York'),
+    ],
+)
+def test_matches_croniter(expr, tz):
+    schedule = CronSchedule(expr, ret_type=datetime)
+    schedule.enable_cache(size=64, chunk=16)
+    tzinfo = pytz.timezone(tz) if tz else None
+    rnd = random.Random(expr)
+    steps = [1, 30, 600, 3600, 3 * 86400, -600, -40 * 86400]
+    t = datetime(2024, 1, 1)
+    for _ in range(500):
+        t += timedelta(seconds=rnd.choice(steps))
+        query = tzinfo.localize(t) if tzinfo else t
+        assert schedule.next_after(query) == croniter(expr, query).get_next(datetime)
+        assert schedule.prev_before(query) == croniter(expr, query).get_prev(datetime)
+    stats = schedule.cache_stats()
+    assert stats['hits'] > stats['misses']
+    assert stats['size'] <= 64
+
+
+@pytest.mark.parametrize(
+    'tzinfo',
+    [
+        pytz.timezone('America/New_York'),
+        pytest.importorskip('zoneinfo').ZoneInfo('America/New_York'),
+        tz.gettz('America/New_York'),
+    ],
+)
+@pytest.mark.parametrize('expr', ['30 2 * * *', '*/20 1-3 * * *', '30 1 * * *'])
+def test_matches_croniter_across_dst(expr, tzinfo):
+    """Test no window spans a DST change, where a cursor's answers depend on
+    where it starts
+    """
+    schedule = CronSchedule(expr)
+    schedule.enable_cache(size=64, chunk=16)
+    for day in [datetime(2024, 3, 5), datetime(2024, 10, 30)]:
+        start = day.replace(tzinfo=timezone.utc).timestamp()
+        for minutes in range(0, 10 * 1440, 37):
+            query = datetime.fromtimestamp(start + minutes * 60, tzinfo)
+            cursor = croniter(expr, query)
+            assert schedule.next_after(query) == cursor.get_next(float), query
+            cursor.set_current(query, force=True)
+            assert schedule.prev_before(query) == cursor.get_prev(float), query
+    stats = schedule.cache_stats()
+    assert stats['hits'] > stats['misses']
+
+
+def test_advancing_now():
+    schedule = CronSchedule('*/5 * * * *')
+    schedule.enable_cache(size=256, chunk=32)
+    start = 1_700_000_000.0
+    for i in range(20_000):
+        now = start + i * 3
+        assert schedule.next_after(now) == (now // 300 + 1) * 300
+    stats = schedule.cache_stats()
+    assert stats['misses'] <= 10
+    assert stats['hits'] + stats['misses'] == 20_000
+    assert stats['size'] <= 256
+
+
+def test_uncached_and_disabled():
+    schedule = CronSchedule('0 12 * * *')
+    start = datetime(2024, 5, 1, 12)
+    assert schedule.next_after(start, datetime) == datetime(2024, 5, 2, 12)
+    assert schedule.prev_before(start, datetime) == datetime(2024, 4, 30, 12)
+    assert schedule.cache_stats() == {'hits': 0, 'misses': 0, 'size': 0}
+    schedule.enable_cache()
+    assert schedule.next_after(start) == croniter('0 12 * * *', start).get_next()
+    assert schedule.cache_stats()['misses'] == 1
+    schedule.disable_cache()
+    assert schedule.cache_stats() == {'hits': 0, 'misses': 0, 'size': 0}
+    with pytest.raises(ValueError):
+        schedule.enable_cache(size=10, chunk=8)
+
+
+def test_global_counters():
+    schedule = CronSchedule('0 * * * *')
+    schedule.enable_cache()
+    croniters.enable_stats()
+    try:
+        for minute in range(0, 600, 7):
+            schedule.next_after(datetime(2024, 1, 1) + timedelta(minutes=minute))
+        counts = croniters.stats()
+    finally:
+        croniters.disable_stats()
+    assert counts['occurrence_cache_misses'] == 1
+    assert counts['occurrence_cache_hits'] == len(range(0, 600, 7)) - 1
+
+
+def test_end_of_schedule():
+    schedule = CronSchedule('0 0 1 1 * 0 2097-2099')
+    schedule.enable_cache(size=8, chunk=4)
+    assert schedule.next_after(datetime(2096, 6, 1), datetime) == datetime(2097, 1, 1)
+    assert schedule.next_after(datetime(2098, 6, 1), datetime) == datetime(2099, 1, 1)
+    with pytest.raises(CroniterBadDateError):
+        schedule.next_after(datetime(2099, 6, 1))
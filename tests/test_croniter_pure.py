@@ -0,0 +1,169 @@
+import datetime
+import os
+import pickle
+import random
+import subprocess
+import sys
+
+import pytest
+import pytz
+
+from croniters import _croniters as native, _pure as pure
+
+CONSTANTS = (
+    'MINUTE_FIELD',
+    'HOUR_FIELD',
+    'DAY_FIELD',
+    'MONTH_FIELD',
+    'DOW_FIELD',
+    'SECOND_FIELD',
+    'YEAR_FIELD',
+    'M_ALPHAS',
+    'DOW_ALPHAS',
+    'UNIX_FIELDS',
+    'SECOND_FIELDS',
+    'YEAR_FIELDS',
+    'CRON_FIELDS',
+    'UNIX_CRON_LEN',
+    'SECOND_CRON_LEN',
+    'YEAR_CRON_LEN',
+    'VALID_LEN_EXPRESSION',
+    'DAYS',
+    'RANGES',
+    'LEN_MEANS_ALL',
+    '__version__',
+)
+
+
+@pytest.mark.parametrize('name', CONSTANTS)
+def test_constants(name):
+    assert getattr(pure, name) == getattr(native, name)
+
+
+def test_alternations():
+    assert set(pure.WEEKDAYS.split('|')) == set(native.WEEKDAYS.split('|'))
+    assert set(pure.MONTHS.split('|')) == set(native.MONTHS.split('|'))
+    assert sorted(pure.EXPANDERS) == sorted(native.EXPANDERS)
+
+
+def test_functions():
+    assert pure.is_32bit() == native.is_32bit()
+    for year in range(1600, 2500):
+        assert pure.is_leap(year) == native.is_leap(year)
+
+
+UTC = datetime.timezone.utc
+TIMEZONES = [
+    None,
+    UTC,
+    datetime.timezone(datetime.timedelta(hours=5, minutes=30)),
+    datetime.timezone(-datetime.timedelta(hours=3, microseconds=1)),
+    pytz.timezone('Europe/Paris'),
+    pytz.timezone('America/New_York'),
+]
+
+
+@pytest.mark.parametrize('tzinfo', TIMEZONES)
+def test_conversions(tzinfo):
+    rnd = random.Random(str(tzinfo))
+    timestamps = [0, -1, -0.5, 1e-6, 0.5e-6, 1.5e-6, -0.5e-6, 2**31, 4e9, 253402214400]
+    timestamps += [rnd.randrange(-(2**31), 2**33) for _ in range(500)]
+    timestamps += [rnd.uniform(-(2**31), 2**33) for _ in range(500)]
+    for ts in timestamps:
+        utc = datetime.datetime.fromtimestamp(ts, UTC)
+        expected = utc.astimezone(tzinfo) if tzinfo else utc.replace(tzinfo=None)
+        for module in (pure, native):
+            result = module.timestamp_to_datetime(ts, tzinfo)
+            assert repr(result) == repr(expected)
+            assert module.datetime_to_timestamp(result) == utc.timestamp()
+            assert module.datetime_to_seconds(result) == utc.timestamp() // 1
+
+
+def test_conversion_errors():
+    for module in (pure, native):
+        with pytest.raises((OverflowError, ValueError)):
+            module.timestamp_to_datetime(1e20)
+        with pytest.raises((OverflowError, ValueError)):
+            module.timestamp_to_datetime(float('nan'))
+        with pytest.raises(TypeError):
+            module.timestamp_to_datetime('0')
+
+
+def test_random_stream():
+    for seed in (0, 1, 42, 2**63, 2**64 - 1):
+        a, b = pure.CronRandom(seed), native.CronRandom(seed)
+        assert [a.random() for _ in range(50)] == [b.random() for _ in range(50)]
+        assert a.getstate() == b.getstate()
+    rng = pure.CronRandom(7)
+    rng.random()
+    clone = pickle.loads(pickle.dumps(rng))
+    assert clone.random() == rng.random()
+    with pytest.raises(OverflowError):
+        pure.CronRandom(-1)
+    with pytest.raises(OverflowError):
+        pure.CronRandom(2**64)
+
+
+def expand(module, idx, expr, hash_id):
+    rng = module.CronRandom(idx) if expr.lower().startswith('r') else None
+    return module.HashExpander(None).expand('', idx, expr, hash_id=hash_id, rng=rng)
+
+
+@pytest.mark.parametrize(
+    'expr',
+    ['*', '5', 'H', 'h', 'H/5', 'H(3-17)', 'H(10-50)/7', 'R', 'R(1-5)', 'R/3'],
+)
+@pytest.mark.parametrize('idx', range(7))
+def test_hash_expand(expr, idx):
+    for hash_id in (b'a', b'job-1', b'\xff' * 16):
+        assert expand(pure, idx, expr, hash_id) == expand(native, idx, expr, hash_id)
+    assert pure.HashExpander(None).match_('', idx, expr) == (
+        native.HashExpander(None).match_('', idx, expr)
+    )
+
+
+@pytest.mark.parametrize(
+    ('expr', 'hash_id'),
+    [
+        ('H', None),
+        ('H(5-5)', b'x'),
+        ('H(9-5)', b'x'),
+        ('H/0', b'x'),
+        ('H(1-5)/0', b'x'),
+    ],
+)
+def test_hash_expand_errors(expr, hash_id):
+    with pytest.raises(ValueError) as pure_error:
+        pure.HashExpander(None).expand('', 0, expr, hash_id=hash_id)
+    with pytest.raises(ValueError) as native_error:
+        native.HashExpander(None).expand('', 0, expr, hash_id=hash_id)
+    assert str(pure_error.value) == str(native_error.value)
+
+
+@pytest.mark.parametrize(('flag', 'expected'), [('1', True), ('0', False)])
+def test_backend_selection(flag, expected):
+    code = (
+        'import croniters\n'
+        'from datetime import datetime\n'
+        'itr = croniters.croniter("H H * * H", datetime(2024, 1, 1), hash_id=b"j")\n'
+        'print(croniters.PURE_PYTHON, croniters.is_leap.__module__, itr.get_next())'
+    )
+    env = dict(os.environ, CRONITERS_PURE_PYTHON=flag)
+    out = subprocess.run(
+        [sys.executable, '-c', code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert out[0] == str(expected)
+    assert (out[1] == 'croniters._pure') is expected
+    env['CRONITERS_PURE_PYTHON'] = '0' if expected else '1'
+    other = subprocess.run(
+        [sys.executable, '-c', code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert other[2] == out[2]
@@ -1,8 +1,9 @@
+import pickle
 from datetime import datetime, timedelta
 
 import pytest
 
-from croniters import croniter
+from croniters import CroniterBadCronError, CronRandom, croniter
 
 
 @pytest.fixture
@@ -51,3 +52,93 @@ def test_random_with_year(epoch):
     result = obj.get_next(datetime)
     assert result.year >= 2025
     assert result.year <= 2030
+
+
+def test_random_seeded_is_reproducible(epoch):
+    """Test that the same seed replays the same schedule"""
+    first = croniter('R R * * * R', epoch, rng=1234)
+    second = croniter('R R * * * R', epoch, rng=1234)
+    assert first.expanded == second.expanded
+    assert [first.get_next(datetime) for _ in range(3)] == [
+        second.get_next(datetime) for _ in range(3)
+    ]
+
+
+def test_random_shared_generator(epoch):
+    """Test that croniters sharing a generator draw successive values"""
+    gen = CronRandom(99)
+    schedules = [croniter('R R * * *', epoch, rng=gen).expanded for _ in range(20)]
+    gen.seed(99)
+    replayed = [croniter('R R * * *', epoch, rng=gen).expanded for _ in range(20)]
+    assert schedules == replayed
+    assert len({(tuple(m), tuple(h)) for m, h, *_ in schedules}) > 1
+
+
+def test_random_after_range_field(epoch):
+    """Test that fields after a range still receive the generator"""
+    first = croniter('R 9-17 * * R', epoch, rng=3).expanded
+    assert first == croniter('R 9-17 * * R', epoch, rng=3).expanded
+    assert first[1] == list(range(9, 18))
+    assert croniter.expand('R 9-17 * * R', rng=3)[0] == first
+
+
+def test_random_bad_rng(epoch):
+    with pytest.raises(TypeError):
+        croniter('R R * * *', epoch, rng='seed')
+    with pytest.raises(TypeError):
+        croniter('R R * * *', epoch, rng=True)
+
+
+def test_cron_random_state():
+    gen = CronRandom(7)
+    state = gen.getstate()
+    values = [gen.random() for _ in range(5)]
+    gen.setstate(state)
+    assert [gen.random() for _ in range(5)] == values
+    assert all(0 <= v < 2**32 for v in values)
+    clone = pickle.loads(pickle.dumps(gen))
+    assert [clone.random() for _ in range(5)] == [gen.random() for _ in range(5)]
+
+
+def test_cron_random_stream_is_stable():
+    """The seeded stream is part of the public contract (SplitMix64)"""
+    gen = CronRandom(1234567)
+    assert [gen.random() for _ in range(3)] == [1503580183, 745795716, 2285812965]
+
+
+def test_expand_many():
+    exprs = ['R R * * *', 'R(10-20) * * * *', 'R/15 * * * *', '0 0 * * *'] * 25
+    first = croniter.expand_many(exprs, rng=5)
+    second = croniter.expand_many(exprs, rng=CronRandom(5))
+    assert first == second
+    assert len(first) == len(exprs)
+    assert first[3] == croniter.expand('0 0 * * *')
+    for expanded, _ in first[1::4]:
+        assert 10 <= expanded[0][0] <= 20
+
+
+def test_expand_many_with_hash_id():
+    [(expanded, _)] = croniter.expand_many(['H R * * *'], rng=1, hash_id='hello')
+    assert expanded[0] == croniter.expand('H * * * *', hash_id=b'hello')[0][0]
+
+
+@pytest.mark.parametrize('second_at_beginning', [False, True])
+def test_expand_many_matches_croniter(epoch, second_at_beginning):
+    """Test the batch draws random fields in the same order as croniter"""
+    exprs = ['R R R * * R', '@daily', 'R/5 R(1-5) * * mon-fri']
+    gen = CronRandom(11)
+    expected = [
+        croniter.expand(expr, second_at_beginning=second_at_beginning, rng=gen)
+        for expr in exprs
+    ]
+    assert (
+        croniter.expand_many(exprs, rng=11, second_at_beginning=second_at_beginning)
+        == expected
+    )
+
+
+def test_expand_many_bad_expression():
+    with pytest.raises(CroniterBadCronError):
+        croniter.expand_many(['R R * * *', 'H * * * *'], rng=1)
+    with pytest.raises(CroniterBadCronError):
+        croniter.expand_many(['R R * *'], rng=1)
@@ -0,0 +1,117 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+
+from croniters import croniter
+
+EXPRESSIONS = [
+    '* * * * *',
+    '*/5 9-17 * * mon-fri',
+    '0 0 L * *',
+    '0 0 1,15,L * *',
+    '0 0 * * sat#1,sun#2',
+    '0 0 * * L5',
+    '0 0 * * L5,sat#3',
+    '30 2 29 2 *',
+    '0 0 * 1-6/2 *',
+    '15 10 * * * 30',
+    '15 10 * * * 30 2020-2030',
+    '@weekly',
+]
+
+
+def states(itr, n=20):
+    return [itr.get_next(float) for _ in range(n)] + [
+        itr.get_prev(float) for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+@pytest.mark.parametrize('day_or', [True, False])
+def test_round_trip(expr, day_or):
+    start = datetime(2024, 2, 27, 13, 7)
+    itr = croniter(expr, start, day_or=day_or)
+    itr.get_next()
+    clone = croniter.from_bytes(itr.to_bytes())
+    assert clone.expanded == itr.expanded
+    assert clone.nth_weekday_of_month == itr.nth_weekday_of_month
+    assert clone.expressions == itr.expressions
+    # the times of the current day are a cache, rebuilt by the next search
+    itr_state = {k: v for k, v in vars(itr).items() if k != '_day_plan'}
+    assert vars(clone) == itr_state
+    assert states(clone) == states(itr)
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+def test_pickle(expr):
+    itr = croniter(expr, datetime(2024, 1, 1), ret_type=datetime, day_or=False)
+    clone = pickle.loads(pickle.dumps(itr))
+    assert type(clone) is croniter
+    assert vars(clone) == vars(itr)
+    assert [clone.get_next() for _ in range(5)] == [itr.get_next() for _ in range(5)]
+
+
+def test_encoding_is_compact():
+    itr = croniter('*/5 9-17 * * mon-fri', datetime(2024, 1, 1))
+    assert len(itr.to_bytes()) < 100
+    assert len(pickle.dumps(itr)) < 250
+    assert len(pickle.dumps(itr)) < len(pickle.dumps(vars(itr)))
+
+
+def test_flags_round_trip():
+    itr = croniter(
+        '0 0 31 * *',
+        datetime(2024, 1, 1),
+        is_prev=True,
+        max_years_between_matches=3,
+        implement_cron_bug=True,
+        expand_from_start_time=True,
+        second_at_beginning=True,
+    )
+    clone = croniter.from_bytes(itr.to_bytes())
+    assert vars(clone) == vars(itr)
+    assert croniter.from_bytes(itr.to_bytes(), ret_type=datetime)._ret_type is datetime
+
+
+@pytest.mark.parametrize(
+    'tzinfo',
+    [
+        None,
+        timezone.utc,
+        timezone(timedelta(hours=5, minutes=30)),
+        timezone(-timedelta(hours=3)),
+    ],
+)
+def test_tzinfo_encoded(tzinfo):
+    itr = croniter('0 12 * * *', datetime(2024, 3, 1, tzinfo=tzinfo))
+    clone = croniter.from_bytes(itr.to_bytes())
+    assert clone.tzinfo == tzinfo
+    assert [clone.get_next(datetime) for _ in range(3)] == [
+        itr.get_next(datetime) for _ in range(3)
+    ]
+
+
+def test_tzinfo_passed_back():
+    tz = pytz.timezone('Europe/Paris')
+    itr = croniter('0 2 * * *', tz.localize(datetime(2024, 3, 29)))
+    data = itr.to_bytes()
+    with pytest.raises(ValueError):
+        croniter.from_bytes(data)
+    clone = croniter.from_bytes(data, tzinfo=itr.tzinfo)
+    assert [clone.get_next(datetime) for _ in range(5)] == [
+        itr.get_next(datetime) for _ in range(5)
+    ]
+    clone = pickle.loads(pickle.dumps(itr))
+    assert clone.get_next(datetime) == itr.get_next(datetime)
+
+
+def test_bad_encoding():
+    data = croniter('0 0 * * *', datetime(2024, 1, 1)).to_bytes()
+    with pytest.raises(ValueError):
+        croniter.from_bytes(b'')
+    with pytest.raises(ValueError):
+        croniter.from_bytes(data[:-10])
+    with pytest.raises(ValueError):
+        croniter.from_bytes(b'\xff' + data[1:])
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+import croniters
+from croniters import (
+    CroniterBadDateError,
+    CronSchedule,
+    SlowComputation,
+    croniter,
+    croniter_range,
+    datetime_to_timestamp,
+)
+
+
+@pytest.fixture
+def reports():
+    events = []
+    yield events
+    croniters.set_slow_hook(None)
+
+
+def test_slow_hook_seconds(reports):
+    croniters.set_slow_hook(reports.append, seconds=0)
+    start = datetime(2024, 1, 1)
+    itr = croniter('H 9 * * *', start, hash_id='job')
+    following = itr.get_next()
+    itr.get_prev()
+    first, second = reports
+    assert isinstance(first, SlowComputation)
+    assert first.expression == ' '.join(itr.expressions)
+    assert first.hash_id == b'job'
+    assert first.start_time == datetime_to_timestamp(start)
+    assert not first.is_prev
+    assert second.is_prev
+    assert first.elapsed >= 0
+    assert first.iterations >= 1
+    assert second.start_time == following
+
+
+def test_slow_hook_iterations(reports):
+    croniters.set_slow_hook(reports.append, iterations=10)
+    croniter('*/5 * * * *', datetime(2024, 1, 1)).get_next()
+    assert reports == []
+    # the next Monday, February 29th is in 2044
+    croniter('0 0 29 2 mon', datetime(2024, 3, 1), day_or=False).get_next()
+    [event] = reports
+    assert event.expression == '0 0 29 2 mon'
+    assert event.hash_id is None
+    assert event.iterations >= 10
+
+    croniters.set_slow_hook(reports.append, iterations=1)
+    with pytest.raises(CroniterBadDateError):
+        croniter('0 0 30 2 *', datetime(2024, 1, 1)).get_next()
+    assert reports[-1].expression == '0 0 30 2 *'
+
+
+def test_slow_hook_range_and_cursor(reports):
+    croniters.set_slow_hook(reports.append, seconds=0)
+    dates = list(
+        croniter_range(datetime(2024, 1, 1), datetime(2024, 1, 3), '0 12 * * *')
+    )
+    assert len(dates) == 2
+    # one report per step, including the one that runs past the end
+    assert len(reports) == 3
+    CronSchedule('0 0 L * *').cursor(datetime(2024, 1, 1)).get_next()
+    assert reports[-1].expression == '0 0 l * *'
+
+
+def test_slow_hook_removed(reports):
+    croniters.set_slow_hook(reports.append, seconds=0)
+    croniters.set_slow_hook(None)
+    croniter('0 0 * * *', datetime(2024, 1, 1)).get_next()
+    assert reports == []
+    with pytest.raises(ValueError):
+        croniters.set_slow_hook(reports.append)
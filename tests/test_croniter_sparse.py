@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+import croniters
+from croniters import CroniterBadDateError, croniter
+
+# (expression, day_or, days of month, months, weekdays)
+SPARSE = [
+    ('0 0 31 * *', True, {31}, None, None),
+    ('0 0 29 2 *', True, {29}, {2}, None),
+    ('0 0 30,31 1-6 *', True, {30, 31}, set(range(1, 7)), None),
+    ('0 0 29-31 2,4 *', True, {29, 30, 31}, {2, 4}, None),
+    ('0 0 29 2 mon', False, {29}, {2}, {0}),
+    ('0 0 13 * fri', False, {13}, None, {4}),
+]
+
+
+def matches(day, days, months, weekdays):
+    return (
+        day.day in days
+        and (months is None or day.month in months)
+        and (weekdays is None or day.weekday() in weekdays)
+    )
+
+
+def brute_force(start, step, count, *fields):
+    found = []
+    day = start
+    while len(found) < count:
+        day += step
+        if matches(day, *fields):
+            found.append(day)
+    return found
+
+
+@pytest.mark.parametrize(('expr', 'day_or', 'days', 'months', 'weekdays'), SPARSE)
+def test_sparse_matches_day_walk(expr, day_or, days, months, weekdays):
+    start = datetime(2000, 1, 1)
+    fields = (days, months, weekdays)
+    itr = croniter(expr, start, day_or=day_or, ret_type=datetime)
+    count = 12 if weekdays is None else 4
+    assert [itr.get_next() for _ in range(count)] == brute_force(
+        start - timedelta(days=1), timedelta(days=1), count, *fields
+    )
+    itr = croniter(expr, datetime(2090, 1, 1), day_or=day_or, ret_type=datetime)
+    assert [itr.get_prev() for _ in range(count)] == brute_force(
+        datetime(2090, 1, 1), timedelta(days=-1), count, *fields
+    )
+
+
+def test_sparse_with_timezone():
+    tz = pytz.timezone('Europe/Paris')
+    itr = croniter('0 12 29 2 *', tz.localize(datetime(2024, 3, 1)), ret_type=datetime)
+    assert itr.get_next() == tz.localize(datetime(2028, 2, 29, 12))
+    assert itr.get_prev() == tz.localize(datetime(2024, 2, 29, 12))
+
+
+def test_sparse_search_is_bounded():
+    croniters.enable_stats()
+    try:
+        for year in range(2001, 2030):
+            croniter('0 0 29 2 *', datetime(year, 3, 1)).get_next()
+            croniter('0 0 31 * *', datetime(year, 4, 1)).get_prev()
+        counts = croniters.stats()
+        assert counts['calc_iterations'] <= 4 * counts['calc_calls']
+
+        croniters.reset_stats()
+        with pytest.raises(CroniterBadDateError):
+            croniter('0 0 30 2 *', datetime(2024, 1, 1)).get_next()
+        with pytest.raises(CroniterBadDateError):
+            croniter('0 0 31 4,6,9,11 *', datetime(2024, 1, 1)).get_prev()
+        assert croniters.stats()['calc_iterations'] == 2
+    finally:
+        croniters.disable_stats()
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+import croniters
+from croniters import CronSchedule, croniter
+
+
+@pytest.fixture(autouse=True)
+def search_stats():
+    croniters.enable_stats()
+    yield
+    croniters.disable_stats()
+
+
+def test_stats_disabled():
+    croniters.disable_stats()
+    croniter('0 0 31 * *', datetime(2024, 1, 1)).get_next()
+    assert croniters.stats() == {}
+    croniters.reset_stats()
+
+
+def test_search_counters():
+    itr = croniter('0 0 31 * *', datetime(2024, 1, 1))
+    itr.get_next()
+    itr.get_next()
+    counts = croniters.stats()
+    assert counts['calc_calls'] == 2
+    # Jan 31st is one day-of-month jump away, then February has no 31st and
+    # is skipped through the feasible-month index
+    assert counts['restarts.day_of_month'] >= 1
+    assert counts['restarts.month_index'] == 1
+    assert counts['calc_iterations'] == counts['calc_calls'] + sum(
+        n for key, n in counts.items() if key.startswith('restarts.')
+    )
+    assert counts['relativedelta_ops'] >= (
+        counts['calc_iterations'] - counts['restarts.month_index']
+    )
+    assert counts.get('timestamp_cache_hits', 0) + counts.get(
+        'timestamp_cache_misses', 0
+    )
+    assert 'dom_dow_passes' not in counts
+
+    croniters.reset_stats()
+    assert croniters.stats() == {}
+    croniter('0 0 1 * mon', datetime(2024, 1, 1)).get_next()
+    counts = croniters.stats()
+    assert counts['dom_dow_passes'] == 1
+    assert counts['calc_calls'] == 2
+
+
+def test_dst_adjustments():
+    tz = pytz.timezone('Europe/Paris')
+    itr = croniter('0 3 * * *', tz.localize(datetime(2024, 3, 30, 12)))
+    for _ in range(3):
+        itr.get_next(datetime)
+    assert croniters.stats()['dst_adjustments'] >= 1
+
+
+def test_stats_per_expression():
+    croniters.enable_stats(per_expression=True)
+    croniter('*/5 * * * *', datetime(2024, 1, 1)).get_next()
+    CronSchedule('0 0 L * *').cursor(datetime(2024, 1, 1)).get_next()
+    by_expression = croniters.stats(by_expression=True)
+    assert set(by_expression) == {'*/5 * * * *', '0 0 l * *'}
+    totals = croniters.stats()
+    for key, count in totals.items():
+        assert count == sum(counts.get(key, 0) for counts in by_expression.values())
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from croniters import EXPRESSIONS, croniter
+
+TENANT_EXPRESSIONS = [
+    '*/5 * * * *',
+    '0 */2 * * *',
+    '0 0 1 */3 *',
+    '0 0 * * sat#1,sun#2',
+    '0 0 L * *',
+    '15 10 * * mon-fri',
+    '0 9 1 * wed',
+    '*/15 * * * * */20',
+]
+
+FREE_THREADED = hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled()
+ASSERT_SCALING = os.environ.get('CRONITER_TEST_ASSERT_SCALING') == '1'
+
+
+def run_tenant(expr, iterations):
+    itr = croniter(expr, datetime(2024, 1, 1))
+    return [itr.get_next() for _ in range(iterations)]
+
+
+def test_threads_match_serial():
+    exprs = TENANT_EXPRESSIONS * 4
+    serial = [run_tenant(expr, 100) for expr in exprs]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        threaded = list(pool.map(run_tenant, exprs, [100] * len(exprs)))
+    assert threaded == serial
+
+
+def test_shared_caches_under_contention():
+    def construct(worker):
+        for i in range(EXPRESSIONS.maxsize // 4):
+            itr = croniter(f'{i % 60} {worker} * * *', datetime(2024, 1, 1))
+            assert itr.expressions == [str(i % 60), str(worker), '*', '*', '*']
+            itr.get_next()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(construct, range(8)))
+    assert len(EXPRESSIONS) <= EXPRESSIONS.maxsize
+
+
+def throughput(threads, iterations):
+    """Return `get_next` calls per second across `threads` tenants."""
+    exprs = [TENANT_EXPRESSIONS[i % len(TENANT_EXPRESSIONS)] for i in range(threads)]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(run_tenant, exprs, [iterations] * threads))
+        elapsed = time.perf_counter() - start
+    return threads * iterations / elapsed
+
+
+def test_get_next_thread_scaling():
+    iterations = int(os.environ.get('CRONITER_TEST_THREADS_ITERATIONS', '2000'))
+    cores = min(os.cpu_count() or 1, 8)
+
+    single = throughput(1, iterations)
+    multi = throughput(cores, iterations)
+    print(
+        f'\nget_next: {single:,.0f}/s on 1 thread, {multi:,.0f}/s on {cores} threads '
+        f'({multi / single:.2f}x, free-threaded={FREE_THREADED})'
+    )
+    # wall-clock ratios are too noisy on shared CI runners to gate on by default
+    if not ASSERT_SCALING:
+        pytest.skip('set CRONITER_TEST_ASSERT_SCALING=1 to assert thread scaling')
+    if not FREE_THREADED or cores < 4:
+        pytest.skip('thread scaling needs a free-threaded build and >= 4 cores')
+    assert multi > 1.5 * single, f'get_next did not scale across {cores} threads'
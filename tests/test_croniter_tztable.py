@@ -0,0 +1,100 @@
+import random
+from datetime import datetime
+
+import pytest
+import pytz
+from dateutil import tz
+
+import croniters
+from croniters import _timestamp_to_datetime, _tztable, croniter
+
+zoneinfo = pytest.importorskip('zoneinfo')
+
+ZONES = ['Europe/Paris', 'America/New_York', 'Australia/Lord_Howe', 'Africa/Casablanca']
+
+
+def zones(name):
+    return [pytz.timezone(name), zoneinfo.ZoneInfo(name)]
+
+
+@pytest.mark.parametrize('name', ZONES)
+def test_table_matches_zone(name):
+    rnd = random.Random(name)
+    transitions = _tztable.build_table(pytz.timezone(name))._span[2][1:]
+    timestamps = [rnd.randrange(0, 4_000_000_000) for _ in range(500)]
+    for t in transitions:
+        timestamps += [t - 3601, t - 3600, t - 1, t, t + 1, t + 1800, t + 3600]
+    rnd.shuffle(timestamps)
+    for tzinfo in zones(name):
+        table = _tztable.build_table(tzinfo)
+        for t in timestamps:
+            local = table.to_datetime(t)
+            if local is None:
+                assert not 0 <= t < 4_133_980_800  # outside of the horizon
+                continue
+            expected = _timestamp_to_datetime(t, tzinfo)
+            assert repr(local) == repr(expected)
+            assert local.fold == expected.fold
+            assert table.utcoffset(t) == expected.utcoffset().total_seconds()
+
+
+@pytest.mark.parametrize('name', ZONES)
+@pytest.mark.parametrize(
+    'expr', ['0 * * * *', '30 2 * * *', '*/20 1-3 * * *', '0 0 L * *', '15 3 * * sun']
+)
+def test_search_unchanged(name, expr, monkeypatch):
+    for tzinfo in zones(name):
+        for day in (datetime(2024, 3, 5), datetime(2024, 3, 28), datetime(2024, 10, 1)):
+            if hasattr(tzinfo, 'localize'):
+                start = tzinfo.localize(day)
+            else:
+                start = day.replace(tzinfo=tzinfo)
+            itr = croniter(expr, start)
+            found = [itr.get_next(datetime) for _ in range(150)]
+            found += [itr.get_prev(datetime) for _ in range(50)]
+            with monkeypatch.context() as m:
+                m.setattr(croniters, '_transition_table', lambda tzinfo: None)
+                m.setattr(
+                    croniters, 'TIMESTAMP_TO_DT_CACHE', croniters._BoundedCache(8)
+                )
+                itr = croniter(expr, start)
+                expected = [itr.get_next(datetime) for _ in range(150)]
+                expected += [itr.get_prev(datetime) for _ in range(50)]
+            assert [repr(dt) for dt in found] == [repr(dt) for dt in expected]
+
+
+def test_shared_per_zone():
+    paris = pytz.timezone('Europe/Paris')
+    table = croniters._transition_table(paris)
+    assert croniters._transition_table(paris) is table
+    croniter('0 0 * * *', paris.localize(datetime(2024, 1, 1))).get_next()
+    croniter('0 12 * * *', paris.localize(datetime(2024, 6, 1))).get_next()
+    assert croniters.TRANSITION_TABLES[id(paris)] == (paris, table)
+    assert croniters._transition_table(tz.gettz('Europe/Paris')) is None
+    assert croniters._transition_table(None) is None
+
+
+def test_probed_years():
+    table = _tztable.build_table(zoneinfo.ZoneInfo('Europe/Berlin'))
+    table.utcoffset(1_700_000_000)
+    assert len(table._span[2]) == 3  # the start, then the two changes of 2023
+    table.utcoffset(1_600_000_000)
+    assert len(table._span[2]) == 9
+    table.utcoffset(1_800_000_000)
+    assert len(table._span[2]) == 17
+
+
+def test_horizon():
+    berlin = zoneinfo.ZoneInfo('Europe/Berlin')
+    try:
+        croniters.set_transition_horizon(2020, 2030)
+        table = croniters._transition_table(berlin)
+        assert table.utcoffset(1_700_000_000) == 3600
+        assert table.utcoffset(1_000_000_000) is None
+        itr = croniter('30 2 * * *', datetime(2001, 3, 24, tzinfo=berlin))
+        assert itr.get_next(datetime) == datetime(2001, 3, 24, 2, 30, tzinfo=berlin)
+        with pytest.raises(ValueError):
+            croniters.set_transition_horizon(2030, 2020)
+    finally:
+        croniters.set_transition_horizon(1970, 2100)
+    assert croniters._transition_table(berlin) is not table
@@ -0,0 +1,182 @@
+import itertools
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+from dateutil import tz
+
+from croniters import CronSchedule, croniter, croniter_range
+
+zoneinfo = pytest.importorskip('zoneinfo')
+
+
+def zones(name):
+    return [pytz.timezone(name), zoneinfo.ZoneInfo(name), tz.gettz(name)]
+
+
+def localize(tzinfo, *fields):
+    if hasattr(tzinfo, 'localize'):
+        return tzinfo.localize(datetime(*fields))
+    return datetime(*fields, tzinfo=tzinfo)
+
+
+def formatted(dates):
+    return [f'{dt:%d %H:%M%z}' for dt in dates]
+
+
+@pytest.mark.parametrize('tzinfo', zones('Europe/Paris'))
+@pytest.mark.parametrize(
+    'expr, start, policies, expected',
+    [
+        # the clocks move from 02:00 to 03:00 on March 31st
+        (
+            '30 2 * * *',
+            (2024, 3, 30),
+            {},
+            ['30 02:30+0100', '31 03:00+0200', '01 02:30+0200'],
+        ),
+        (
+            '30 2 * * *',
+            (2024, 3, 30),
+            {'dst_gap': 'skip'},
+            ['30 02:30+0100', '01 02:30+0200', '02 02:30+0200'],
+        ),
+        (
+            '*/30 1-3 * * *',
+            (2024, 3, 31),
+            {},
+            ['31 01:00+0100', '31 01:30+0100', '31 03:00+0200', '31 03:30+0200'],
+        ),
+        (
+            '0 3 * * *',
+            (2024, 3, 30),
+            {},
+            ['30 03:00+0100', '31 03:00+0200', '01 03:00+0200'],
+        ),
+        # and from 03:00 back to 02:00 on October 27th
+        (
+            '30 2 * * *',
+            (2024, 10, 26),
+            {},
+            ['26 02:30+0200', '27 02:30+0200', '28 02:30+0100'],
+        ),
+        (
+            '30 2 * * *',
+            (2024, 10, 26),
+            {'dst_fold': 'last'},
+            ['26 02:30+0200', '27 02:30+0100', '28 02:30+0100'],
+        ),
+        (
+            '*/30 1-3 * * *',
+            (2024, 10, 27),
+            {},
+            ['27 01:00+0200', '27 01:30+0200', '27 02:00+0200', '27 02:30+0200']
+            + ['27 03:00+0100', '27 03:30+0100'],
+        ),
+        (
+            '*/30 1-3 * * *',
+            (2024, 10, 27),
+            {'dst_fold': 'last'},
+            ['27 01:00+0200', '27 01:30+0200', '27 02:00+0100', '27 02:30+0100']
+            + ['27 03:00+0100', '27 03:30+0100'],
+        ),
+    ],
+)
+def test_policies(tzinfo, expr, start, policies, expected):
+    start = localize(tzinfo, *start) - timedelta(seconds=1)
+    itr = croniter(expr, start, wall_clock=True, **policies)
+    found = [itr.get_next(datetime) for _ in expected]
+    assert formatted(found) == expected
+    # the same instants when going back
+    assert [itr.get_prev(datetime) for _ in expected[1:]] == found[-2::-1]
+
+
+@pytest.mark.parametrize(
+    'name', ['Europe/Paris', 'America/New_York', 'Australia/Lord_Howe']
+)
+@pytest.mark.parametrize(
+    'expr', ['*/20 1-3 * * *', '30 2 * * *', '0 1-3 * * sun', '*/15 2 * * * 30']
+)
+@pytest.mark.parametrize('dst_gap', ['shift', 'skip'])
+@pytest.mark.parametrize('dst_fold', ['first', 'last'])
+def test_wall_clock_times(name, expr, dst_gap, dst_fold):
+    for tzinfo, months in itertools.product(zones(name), [(3, 4), (10, 11)]):
+        start = localize(tzinfo, 2024, months[0], 1)
+        stop = localize(tzinfo, 2024, months[1], 10)
+        found = list(
+            croniter_range(
+                start,
+                stop,
+                expr,
+                wall_clock=True,
+                dst_gap=dst_gap,
+                dst_fold=dst_fold,
+            )
+        )
+        instants = [dt.timestamp() for dt in found]
+        assert instants == sorted(set(instants))
+        expected = set(
+            croniter_range(start.replace(tzinfo=None), stop.replace(tzinfo=None), expr)
+        )
+        for dt in found:
+            if dt.replace(tzinfo=None) not in expected:
+                # fired when the clocks skipped over the time
+                assert dst_gap == 'shift'
+                before = dt.astimezone(timezone.utc) - timedelta(seconds=1)
+                assert before.astimezone(tzinfo).utcoffset() < dt.utcoffset()
+        # every time of the schedule that the clocks show is found
+        reference = zoneinfo.ZoneInfo(name)
+        for wall in expected - {dt.replace(tzinfo=None) for dt in found}:
+            local = wall.replace(tzinfo=reference).astimezone(timezone.utc)
+            assert local.astimezone(reference).replace(tzinfo=None) != wall
+
+
+def test_start_inside_fold():
+    paris = zoneinfo.ZoneInfo('Europe/Paris')
+    first = datetime(2024, 10, 27, 2, 10, tzinfo=paris)
+    second = first.replace(fold=1)
+    for start, dst_fold, expected in [
+        (first, 'first', ['27 02:30+0200', '27 02:00+0200']),
+        (first, 'last', ['27 02:00+0100', '27 01:30+0200']),
+        (second, 'first', ['27 03:00+0100', '27 02:30+0200']),
+        (second, 'last', ['27 02:30+0100', '27 02:00+0100']),
+    ]:
+        itr = croniter('*/30 * * * *', start, wall_clock=True, dst_fold=dst_fold)
+        following = itr.get_next(datetime)
+        itr.set_current(start)
+        assert formatted([following, itr.get_prev(datetime)]) == expected
+
+
+@pytest.mark.parametrize(
+    'tzinfo', [None, timezone.utc, timezone(timedelta(hours=-3)), pytz.utc]
+)
+def test_fixed_offsets_unchanged(tzinfo):
+    start = datetime(2024, 3, 30, tzinfo=tzinfo)
+    itr = croniter('*/45 * * * *', start, wall_clock=True)
+    expected = croniter('*/45 * * * *', start)
+    assert [itr.get_next(datetime) for _ in range(100)] == [
+        expected.get_next(datetime) for _ in range(100)
+    ]
+
+
+def test_options_kept():
+    paris = zoneinfo.ZoneInfo('Europe/Paris')
+    start = datetime(2024, 3, 30, tzinfo=paris)
+    itr = croniter('30 2 * * *', start, wall_clock=True, dst_gap='skip')
+    clone = pickle.loads(pickle.dumps(itr))
+    assert clone.get_next(datetime) == itr.get_next(datetime)
+    assert clone.get_next(datetime) == itr.get_next(datetime)
+    assert itr.get_current(datetime) == datetime(2024, 4, 1, 2, 30, tzinfo=paris)
+    assert len(itr.to_bytes()) == len(croniter('30 2 * * *').to_bytes()) + 1
+
+    schedule = CronSchedule('30 2 * * *', wall_clock=True, dst_fold='last')
+    cursor = schedule.cursor(datetime(2024, 10, 27, tzinfo=paris))
+    assert formatted([cursor.get_next(datetime)]) == ['27 02:30+0100']
+
+
+def test_bad_policies():
+    with pytest.raises(ValueError, match='dst_gap'):
+        croniter('0 0 * * *', wall_clock=True, dst_gap='later')
+    with pytest.raises(ValueError, match='dst_fold'):
+        croniter('0 0 * * *', wall_clock=True, dst_fold='both')